@@ -0,0 +1,75 @@
+"""
+Measure how long the server takes to answer `initialize` on the stdio transport.
+
+Each run spawns a fresh server process, as MCP clients do for every session,
+sends the initialize request and stops the clock when the response arrives.
+
+    python benchmarks/startup.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-benchmark", "version": "1.0"},
+    },
+}
+
+
+def time_to_initialize(python: str = sys.executable) -> float:
+    """Return the seconds from process spawn to the initialize response."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    started = time.perf_counter()
+    process = subprocess.Popen(  # noqa: S603
+        [python, "-m", "nasdaq_data_link_mcp_os.server", "--transport", "stdio"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        cwd=ROOT,
+        env=env,
+        text=True,
+    )
+    try:
+        process.stdin.write(json.dumps(INITIALIZE) + "\n")
+        process.stdin.flush()
+        line = process.stdout.readline()
+        elapsed = time.perf_counter() - started
+    finally:
+        process.kill()
+        process.wait()
+    response = json.loads(line)
+    if "result" not in response:
+        raise RuntimeError(f"initialize failed: {response}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts")
+    args = parser.parse_args()
+
+    timings = [time_to_initialize() for _ in range(args.runs)]
+    print(  # noqa: T201
+        f"time to initialize over {args.runs} runs: "
+        f"min {min(timings) * 1000:.0f} ms, "
+        f"median {statistics.median(timings) * 1000:.0f} ms, "
+        f"max {max(timings) * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import pandas as pd
+
+# Resampling rules for the frequencies accepted by get_dataset
+FREQUENCIES = {
+    "weekly": "W",
+    "monthly": "ME",
+    "quarterly": "QE",
+    "yearly": "YE",
+}
+AGGREGATIONS = ("last", "first", "mean", "sum", "min", "max", "ohlc", "describe")
+
+# Column-aware rollup used by 'ohlc' for price tables such as WIKI/*
+_PRICE_ROLLUP = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+
+def _ohlc(frame: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """Roll price columns up by bar semantics, other numerics to OHLC bars."""
+    numeric = frame.select_dtypes("number")
+    resampled = numeric.resample(rule)
+    rollup = {
+        column: _PRICE_ROLLUP[str(column).lower()]
+        for column in numeric.columns
+        if str(column).lower() in _PRICE_ROLLUP
+    }
+    if {"open", "high", "low", "close"} <= {str(c).lower() for c in rollup}:
+        return resampled.agg(rollup)
+    bars = resampled.ohlc()
+    bars.columns = [f"{column}_{field}" for column, field in bars.columns]
+    return bars
+
+
+def aggregate_frame(
+    frame: pd.DataFrame,
+    frequency: str | None = None,
+    aggregation: str | None = None,
+    last_n: int | None = None,
+) -> pd.DataFrame:
+    """
+    Downsample or summarize a time series before it is serialized.
+
+    Args:
+        frame: Date-indexed DataFrame
+        frequency: 'weekly', 'monthly', 'quarterly' or 'yearly'
+        aggregation: How rows are combined per period: 'last' (default with a
+            frequency), 'first', 'mean', 'sum', 'min', 'max', 'ohlc', or
+            'describe' for summary statistics of the whole range
+        last_n: Keep only the last N rows of the (aggregated) result
+
+    Returns:
+        The aggregated DataFrame
+    """
+    if frequency is not None and frequency not in FREQUENCIES:
+        raise ValueError(
+            f"Unsupported frequency: {frequency}. Use one of: {', '.join(FREQUENCIES)}"
+        )
+    if aggregation is not None and aggregation not in AGGREGATIONS:
+        raise ValueError(
+            f"Unsupported aggregation: {aggregation}. "
+            f"Use one of: {', '.join(AGGREGATIONS)}"
+        )
+    if last_n is not None and last_n < 1:
+        raise ValueError("last_n must be a positive integer")
+
+    if aggregation == "describe":
+        data = frame.tail(last_n) if last_n else frame
+        return data.describe()
+
+    if frequency is not None or aggregation is not None:
+        if frequency is None:
+            raise ValueError(f"Aggregation '{aggregation}' requires a frequency")
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            raise ValueError("Resampling requires a date-indexed dataset")
+        rule = FREQUENCIES[frequency]
+        if aggregation == "ohlc":
+            frame = _ohlc(frame, rule)
+        else:
+            resampled = frame.select_dtypes("number").resample(rule)
+            if aggregation == "sum":
+                # Empty periods become NaN rather than 0 so they are dropped
+                frame = resampled.sum(min_count=1)
+            else:
+                frame = getattr(resampled, aggregation or "last")()
+        # Periods without any observation (e.g. market holidays) are dropped
+        frame = frame.dropna(how="all")
+
+    return frame.tail(last_n) if last_n else frame
@@ -0,0 +1,291 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import Any
+
+import pandas as pd
+
+# Set NASDAQ_DATA_LINK_CACHE=0 to disable response caching entirely
+CACHE_ENABLED = os.getenv("NASDAQ_DATA_LINK_CACHE", "1").lower() not in (
+    "0",
+    "false",
+    "no",
+)
+# Memory budget for the in-process LRU tier
+CACHE_MAX_BYTES = int(os.getenv("NASDAQ_DATA_LINK_CACHE_MAX_BYTES", str(256 << 20)))
+# Directory for the on-disk Parquet tier; unset keeps the cache memory-only
+CACHE_DIR = os.getenv("NASDAQ_DATA_LINK_CACHE_DIR")
+# Default time-to-live in seconds for codes without a specific entry below
+DEFAULT_TTL_SECONDS = float(os.getenv("NASDAQ_DATA_LINK_CACHE_TTL", "900"))
+
+# Per-dataset TTLs, matched on the longest code prefix. Fundamentals and
+# reference tables change at most quarterly, market activity changes daily.
+DATASET_TTL_SECONDS: dict[str, float] = {
+    "NDAQ/FS": 86400,
+    "NDAQ/FD": 86400,
+    "NDAQ/BS": 86400,
+    "NDAQ/CF": 86400,
+    "NDAQ/RD": 86400,
+    "NDAQ/STAT": 3600,
+    "NDAQ/CA": 3600,
+    "NFN/": 3600,
+    "WB/": 86400,
+}
+
+
+def _parse_ttl_overrides(value: str | None) -> dict[str, float]:
+    """Parse 'CODE=SECONDS,CODE=SECONDS' into a TTL mapping."""
+    overrides: dict[str, float] = {}
+    for item in (value or "").split(","):
+        code, _, seconds = item.partition("=")
+        if code.strip() and seconds.strip():
+            overrides[code.strip().upper()] = float(seconds)
+    return overrides
+
+
+DATASET_TTL_SECONDS.update(
+    _parse_ttl_overrides(os.getenv("NASDAQ_DATA_LINK_CACHE_TTLS"))
+)
+
+
+def ttl_for(code: str) -> float:
+    """Return the cache TTL for a dataset or datatable code."""
+    code = code.upper()
+    prefixes = [prefix for prefix in DATASET_TTL_SECONDS if code.startswith(prefix)]
+    if not prefixes:
+        return DEFAULT_TTL_SECONDS
+    return DATASET_TTL_SECONDS[max(prefixes, key=len)]
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize a request parameter so equivalent requests share a key."""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, list | tuple | set):
+        return [_normalize(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items())}
+    return value
+
+
+def make_key(kind: str, code: str, params: dict[str, Any]) -> str:
+    """Build the normalized cache key for a (code, params) request."""
+    normalized = {
+        key: _normalize(value)
+        for key, value in sorted(params.items())
+        if value is not None
+    }
+    return json.dumps(
+        [kind, code.strip().upper(), normalized], sort_keys=True, default=str
+    )
+
+
+def frame_nbytes(frame: pd.DataFrame) -> int:
+    """Return the in-memory size of a DataFrame including object payloads."""
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+class ResponseCache:
+    """
+    Two-tier cache for Data Link responses.
+
+    The first tier is an in-memory LRU bounded by max_bytes. The optional second
+    tier stores Parquet files in cache_dir so entries survive restarts. Every
+    entry expires after the TTL configured for its dataset code.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = CACHE_MAX_BYTES,
+        cache_dir: str | None = CACHE_DIR,
+        enabled: bool = CACHE_ENABLED,
+    ):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[pd.DataFrame, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._counters = dict.fromkeys(
+            ("hits", "memory_hits", "disk_hits", "misses", "evictions"), 0
+        )
+        self._disk_warned = False
+
+    @property
+    def disk_enabled(self) -> bool:
+        """Whether the on-disk tier is configured and a Parquet engine exists."""
+        if not self.cache_dir:
+            return False
+        if find_spec("pyarrow") is None and find_spec("fastparquet") is None:
+            if not self._disk_warned:
+                warnings.warn(
+                    "NASDAQ_DATA_LINK_CACHE_DIR is set but no Parquet engine is "
+                    "installed; install pyarrow to enable the on-disk cache.",
+                    stacklevel=2,
+                )
+                self._disk_warned = True
+            return False
+        return True
+
+    def _disk_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir or "", f"{digest}.parquet")
+
+    def _count(self, *names: str) -> None:
+        for name in names:
+            self._counters[name] += 1
+
+    def get(self, key: str, ttl: float) -> pd.DataFrame | None:
+        """Return a copy of the cached frame for key, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                frame, expires_at, _ = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._count("hits", "memory_hits")
+                    return frame.copy()
+                self._discard(key)
+
+        entry = self._read_disk(key, ttl)
+        with self._lock:
+            if entry is None:
+                self._count("misses")
+                return None
+            frame, remaining = entry
+            self._count("hits", "disk_hits")
+            # Promoted entries keep the expiry of the file, not a fresh TTL
+            self._store(key, frame, remaining)
+        return frame.copy()
+
+    def put(self, key: str, frame: pd.DataFrame, ttl: float) -> None:
+        """Store a copy of frame under key in both tiers."""
+        if not self.enabled or ttl <= 0:
+            return
+        frame = frame.copy()
+        with self._lock:
+            self._store(key, frame, ttl)
+        self._write_disk(key, frame)
+
+    def get_or_fetch(
+        self, key: str, ttl: float, fetch: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return the cached frame for key, calling fetch and caching on a miss."""
+        cached = self.get(key, ttl)
+        if cached is not None:
+            return cached
+        frame = fetch()
+        if isinstance(frame, pd.DataFrame):
+            self.put(key, frame, ttl)
+        return frame
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single entry from both tiers."""
+        with self._lock:
+            self._discard(key)
+        if self.disk_enabled:
+            try:
+                os.remove(self._disk_path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop every in-memory entry and reset counters, optionally the disk."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for name in self._counters:
+                self._counters[name] = 0
+        if disk and self.disk_enabled and os.path.isdir(self.cache_dir or ""):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".parquet"):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def frames(self, kind: str = "get_table") -> list[tuple[str, pd.DataFrame]]:
+        """Return (code, frame) for the unexpired in-memory entries of a kind."""
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._entries.items())
+        frames = []
+        for key, (frame, expires_at, _) in entries:
+            try:
+                entry_kind, code, _ = json.loads(key)
+            except (TypeError, ValueError):
+                # Keys not built by make_key
+                continue
+            if entry_kind == kind and now < expires_at:
+                frames.append((code, frame))
+        return frames
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and the current memory footprint."""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "disk_enabled": self.disk_enabled,
+            }
+
+    def _store(self, key: str, frame: pd.DataFrame, ttl: float) -> None:
+        """Insert into the LRU tier and evict to stay within max_bytes."""
+        self._discard(key)
+        size = frame_nbytes(frame)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (frame, time.monotonic() + ttl, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self._count("evictions")
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _read_disk(self, key: str, ttl: float) -> tuple[pd.DataFrame, float] | None:
+        """Return the stored frame and its remaining lifetime in seconds."""
+        if not self.disk_enabled:
+            return None
+        path = self._disk_path(key)
+        try:
+            remaining = ttl - (time.time() - os.path.getmtime(path))
+            if remaining <= 0:
+                return None
+            return pd.read_parquet(path), remaining
+        except Exception:
+            # Missing, expired or unreadable files are all treated as misses
+            return None
+
+    def _write_disk(self, key: str, frame: pd.DataFrame) -> None:
+        if not self.disk_enabled:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir or "", exist_ok=True)
+            frame.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Frames with mixed object columns cannot always be written
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,394 @@
+import copy
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+import warnings
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import nasdaqdatalink
+import pandas as pd
+import requests
+from nasdaqdatalink.api_config import ApiConfig
+from nasdaqdatalink.connection import Connection
+from requests.adapters import HTTPAdapter
+
+from nasdaq_data_link_mcp_os import mirror, ratelimit
+from nasdaq_data_link_mcp_os.cache import make_key, response_cache, ttl_for
+from nasdaq_data_link_mcp_os.normalize import NORMALIZE_ENABLED, normalize_frame
+from nasdaq_data_link_mcp_os.range_store import timeseries_store
+from nasdaq_data_link_mcp_os.resources.common.columns import chunk_values, split_values
+from nasdaq_data_link_mcp_os.singleflight import flights
+
+# Number of distinct hosts kept in the pool and connections kept per host
+POOL_CONNECTIONS = int(os.getenv("NASDAQ_DATA_LINK_POOL_CONNECTIONS", "4"))
+POOL_MAXSIZE = int(os.getenv("NASDAQ_DATA_LINK_POOL_SIZE", "32"))
+# Connect and read timeouts in seconds applied when the caller sets none
+CONNECT_TIMEOUT = float(os.getenv("NASDAQ_DATA_LINK_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("NASDAQ_DATA_LINK_READ_TIMEOUT", "60"))
+# Opt-in HTTP/2 through urllib3's experimental support (requires `h2`)
+USE_HTTP2 = os.getenv("NASDAQ_DATA_LINK_HTTP2", "").lower() in ("1", "true", "yes")
+# Row cap applied to paginated get_table calls that do not set max_rows
+MAX_ROWS = int(os.getenv("NASDAQ_DATA_LINK_MAX_ROWS", "1000000"))
+# Values per comma-separated filter and parallel requests in get_table_batch
+BATCH_CHUNK_SIZE = int(os.getenv("NASDAQ_DATA_LINK_BATCH_CHUNK_SIZE", "100"))
+BATCH_WORKERS = int(os.getenv("NASDAQ_DATA_LINK_BATCH_WORKERS", "8"))
+
+_session_lock = threading.Lock()
+_session: requests.Session | None = None
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies the default timeouts to every request."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = (CONNECT_TIMEOUT, READ_TIMEOUT)
+        return super().send(request, **kwargs)
+
+
+def _request_api_key(request: Any) -> str | None:
+    """Return the API key a prepared request authenticates with."""
+    headers = getattr(request, "headers", None) or {}
+    # requests' header mapping is case-insensitive
+    key = headers.get("X-Api-Token")
+    if key:
+        return key
+    query = urllib.parse.urlsplit(getattr(request, "url", None) or "").query
+    return urllib.parse.parse_qs(query).get("api_key", [ApiConfig.api_key])[0]
+
+
+class _RateLimitedHTTPAdapter(_TimeoutHTTPAdapter):
+    """
+    HTTPAdapter that paces requests per API key and retries failures.
+
+    Every request first takes a token from the key's bucket, so all call
+    sites share one budget. Status codes in ApiConfig.retry_status_codes and
+    connection errors are retried with jittered exponential backoff following
+    ApiConfig's retry settings; a 429 also slows the whole bucket down and
+    honours Retry-After.
+    """
+
+    def send(self, request, **kwargs):
+        bucket = ratelimit.get_bucket(_request_api_key(request))
+        method = getattr(request, "method", "GET")
+        retries = (
+            ApiConfig.number_of_retries
+            if ApiConfig.use_retries and method in ("GET", "HEAD")
+            else 0
+        )
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= retries:
+                    raise
+                delay = ratelimit.backoff_delay(
+                    attempt,
+                    ApiConfig.retry_backoff_factor,
+                    ApiConfig.max_wait_between_retries,
+                )
+            else:
+                status = getattr(response, "status_code", None)
+                if status not in ApiConfig.retry_status_codes:
+                    bucket.recover()
+                    return response
+                if attempt >= retries:
+                    return response
+                delay = ratelimit.backoff_delay(
+                    attempt,
+                    ApiConfig.retry_backoff_factor,
+                    ApiConfig.max_wait_between_retries,
+                    ratelimit.parse_retry_after(response.headers.get("Retry-After")),
+                )
+                response.close()
+                if status == 429:
+                    # The bucket makes every caller of this key wait
+                    bucket.throttle(delay)
+                    delay = 0
+            ratelimit.record_retry()
+            time.sleep(delay)
+            attempt += 1
+
+
+def _enable_http2() -> None:
+    """Switch urllib3 to HTTP/2 where the optional dependencies are present."""
+    try:
+        import h2  # noqa: F401
+        from urllib3.http2 import inject_into_urllib3
+    except ImportError:
+        warnings.warn(
+            "NASDAQ_DATA_LINK_HTTP2 is set but HTTP/2 support is unavailable; "
+            "install urllib3>=2.3 and h2. Falling back to HTTP/1.1.",
+            stacklevel=3,
+        )
+        return
+    inject_into_urllib3()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session used for every Data Link request.
+
+    The session keeps connections alive in a pool of POOL_MAXSIZE connections
+    per host, so repeated calls skip the TCP and TLS handshakes.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            if USE_HTTP2:
+                _enable_http2()
+            session = requests.Session()
+            # Retries are handled by the adapter so they are rate limited too
+            adapter = _RateLimitedHTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=0,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            proxies = urllib.request.getproxies()
+            if proxies:
+                session.proxies.update(proxies)
+            _session = session
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session; the next request opens a new one."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def install() -> None:
+    """
+    Make nasdaqdatalink reuse the shared session.
+
+    The library builds a new requests.Session for every request by default,
+    which throws the connection away after each call.
+    """
+    Connection.get_session = classmethod(lambda cls: get_session())
+
+
+def get(dataset_code: str, cache: bool = True, **params: Any) -> pd.DataFrame:
+    """
+    Fetch a time-series dataset (e.g., 'WIKI/AAPL') through the shared client.
+
+    Identical requests are answered from the response cache until the TTL
+    for the dataset expires; pass cache=False to force a network fetch.
+    Concurrent identical requests share one upstream call.
+    """
+    key = make_key("get", dataset_code, params)
+
+    def fetch() -> pd.DataFrame:
+        return nasdaqdatalink.get(dataset_code, **params)
+
+    if not cache:
+        return flights.do(f"fresh:{key}", fetch)
+    return flights.do(
+        key, lambda: response_cache.get_or_fetch(key, ttl_for(dataset_code), fetch)
+    )
+
+
+def iter_table(
+    datatable_code: str, max_rows: int | None = None, **params: Any
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a datatable page by page by following the API cursor.
+
+    Pages are requested lazily, so only one page is held in memory at a time
+    and no further requests are made once the caller stops iterating.
+
+    Args:
+        datatable_code: Datatable code (e.g., 'NDAQ/TS')
+        max_rows: Stop after this many rows; the last chunk is trimmed to fit
+        **params: Filters passed to the API (e.g., symbol, qopts.per_page)
+
+    Yields:
+        One DataFrame per page
+    """
+    options = dict(params)
+    remaining = max_rows
+    while remaining is None or remaining > 0:
+        page = nasdaqdatalink.Datatable(datatable_code).data(
+            params=copy.deepcopy(options)
+        )
+        frame = page.to_pandas()
+        if remaining is not None:
+            frame = frame.iloc[:remaining]
+            remaining -= len(frame)
+        yield frame
+
+        next_cursor_id = page.meta.get("next_cursor_id")
+        if next_cursor_id is None:
+            return
+        options["qopts.cursor_id"] = next_cursor_id
+
+
+def _collect_pages(
+    datatable_code: str, max_rows: int | None, params: dict[str, Any]
+) -> pd.DataFrame:
+    """Concatenate every page of a datatable up to the row cap."""
+    row_cap = max_rows or MAX_ROWS
+    frames = list(iter_table(datatable_code, max_rows=row_cap, **params))
+    data = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    if max_rows is None and len(data) >= row_cap:
+        warnings.warn(
+            f"{datatable_code} results were capped at {row_cap} rows; pass "
+            "max_rows or use iter_table() to read further.",
+            stacklevel=3,
+        )
+    return data
+
+
+def _table_key(
+    datatable_code: str,
+    paginate: bool,
+    max_rows: int | None,
+    normalize: bool,
+    params: dict[str, Any],
+) -> str:
+    key_params = {
+        **params,
+        "paginate": paginate or None,
+        "max_rows": max_rows,
+        "normalize": normalize or None,
+    }
+    return make_key("get_table", datatable_code, key_params)
+
+
+def cached_table(
+    datatable_code: str,
+    paginate: bool = False,
+    max_rows: int | None = None,
+    normalize: bool | None = None,
+    **params: Any,
+) -> pd.DataFrame | None:
+    """Return the cached result of the identical get_table call, or None."""
+    if normalize is None:
+        normalize = NORMALIZE_ENABLED
+    key = _table_key(datatable_code, paginate, max_rows, normalize, params)
+    return response_cache.get(key, ttl_for(datatable_code))
+
+
+def get_table(
+    datatable_code: str,
+    cache: bool = True,
+    paginate: bool = False,
+    max_rows: int | None = None,
+    normalize: bool | None = None,
+    **params: Any,
+) -> pd.DataFrame:
+    """
+    Fetch a datatable (e.g., 'NDAQ/RTAT') through the shared client.
+
+    Identical requests are answered from the response cache until the TTL
+    for the datatable expires; pass cache=False to force a network fetch.
+    Without paginate only the first page is returned; with paginate=True all
+    pages are read, up to max_rows (or NASDAQ_DATA_LINK_MAX_ROWS) rows.
+    With normalize=True (default: NASDAQ_DATA_LINK_NORMALIZE) the frame is
+    shrunk by normalize_frame before it is cached. Concurrent identical
+    requests share one upstream call. Datatables held by the local mirror
+    (see mirror.py) are answered from it, with every matching row, while
+    the mirrored copy is fresh; cache=False skips the mirror too.
+    """
+    if normalize is None:
+        normalize = NORMALIZE_ENABLED
+
+    mirrored = mirror.table_mirror.lookup(datatable_code, params) if cache else None
+    if mirrored is not None:
+        if max_rows is not None:
+            mirrored = mirrored.head(max_rows)
+        return normalize_frame(mirrored, datatable_code) if normalize else mirrored
+
+    def fetch() -> pd.DataFrame:
+        if paginate:
+            data = _collect_pages(datatable_code, max_rows, params)
+        else:
+            data = nasdaqdatalink.get_table(datatable_code, **params)
+        return normalize_frame(data, datatable_code) if normalize else data
+
+    key = _table_key(datatable_code, paginate, max_rows, normalize, params)
+    if not cache:
+        return flights.do(f"fresh:{key}", fetch)
+    return flights.do(
+        key,
+        lambda: response_cache.get_or_fetch(key, ttl_for(datatable_code), fetch),
+    )
+
+
+def get_table_batch(
+    datatable_code: str,
+    filter_name: str,
+    values: str | Iterable[str],
+    chunk_size: int | None = None,
+    **params: Any,
+) -> pd.DataFrame:
+    """
+    Fetch a datatable for many filter values with few concurrent requests.
+
+    The values are split into chunks sent as the API's comma-separated
+    multi-value filter (e.g. symbol=AAPL,MSFT,...). Chunks run concurrently
+    on up to BATCH_WORKERS threads, each reading every page, and the results
+    are concatenated in chunk order. Every chunk goes through get_table, so
+    repeated batches are answered from the response cache.
+
+    Args:
+        datatable_code: Datatable code (e.g., 'NDAQ/FS')
+        filter_name: Column filtered on (e.g., 'symbol' or 'figi')
+        values: Filter values, as a list or a comma-separated string
+        chunk_size: Values per request (default: NASDAQ_DATA_LINK_BATCH_CHUNK_SIZE)
+        **params: Further filters applied to every chunk
+
+    Returns:
+        Concatenated DataFrame for all values
+    """
+    unique = split_values(values)
+    if not unique:
+        raise ValueError(f"No {filter_name} values provided")
+    chunks = chunk_values(unique, chunk_size or BATCH_CHUNK_SIZE)
+
+    def fetch(chunk: list[str]) -> pd.DataFrame:
+        return get_table(
+            datatable_code, paginate=True, **{filter_name: ",".join(chunk)}, **params
+        )
+
+    if len(chunks) == 1:
+        return fetch(chunks[0])
+    with ThreadPoolExecutor(max_workers=min(len(chunks), BATCH_WORKERS)) as pool:
+        frames = list(pool.map(fetch, chunks))
+    frames = [frame for frame in frames if not frame.empty] or frames[:1]
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+def get_range(
+    dataset_code: str, start_date: str | None = None, end_date: str | None = None
+) -> pd.DataFrame:
+    """
+    Fetch a date range of a time-series dataset, downloading only missing days.
+
+    Ranges already held by the time-series store are served locally, so
+    overlapping rolling-window requests only fetch the uncovered gaps. Each
+    gap is fetched through get(), so it goes through the response cache with
+    the dataset's TTL.
+    """
+    return timeseries_store.get(
+        dataset_code,
+        get,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+install()
@@ -0,0 +1,48 @@
+import functools
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+import anyio.to_thread
+
+# Maximum number of blocking Data Link calls running at the same time
+MAX_CONCURRENCY = int(os.getenv("NASDAQ_DATA_LINK_MAX_CONCURRENCY", "16"))
+
+_limiter: anyio.CapacityLimiter | None = None
+
+
+def get_limiter() -> anyio.CapacityLimiter:
+    """Return the limiter bounding the worker threads used for blocking calls."""
+    global _limiter
+
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(MAX_CONCURRENCY)
+    return _limiter
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function in the bounded worker pool.
+
+    The event loop stays free to serve other MCP sessions while the call waits
+    on the network. At most MAX_CONCURRENCY calls run at once; the rest queue.
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs), limiter=get_limiter()
+    )
+
+
+def offload(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """
+    Wrap a blocking function in an async variant that runs it via run_blocking.
+
+    The wrapper keeps the original name, docstring and signature so FastMCP
+    derives the same tool schema from it.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await run_blocking(func, *args, **kwargs)
+
+    return wrapper
@@ -1,6 +1,6 @@
 import os
+import sys
 
-import nasdaqdatalink
 from dotenv import load_dotenv
 
 
@@ -18,6 +18,9 @@ def initialize_api():
         )
         return False
 
-    # Set the API key directly on the module
-    nasdaqdatalink.read_key(api_key)
+    # nasdaqdatalink reads NASDAQ_DATA_LINK_API_KEY from the environment when
+    # it is first imported; only a module loaded earlier needs to be updated.
+    nasdaqdatalink = sys.modules.get("nasdaqdatalink")
+    if nasdaqdatalink is not None:
+        nasdaqdatalink.read_key(api_key)
     return True
@@ -0,0 +1,188 @@
+import json
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+ENCODINGS = ("split", "columnar", "summary")
+# Strings are dictionary-encoded when at most this share of values is unique
+DICTIONARY_MAX_UNIQUE_RATIO = 0.5
+
+_UNITS = {"D": 86_400_000_000_000, "s": 1_000_000_000}
+
+
+def sample_rows(frame: pd.DataFrame, max_rows: int) -> pd.DataFrame:
+    """Keep max_rows evenly spaced rows, always including the first and last."""
+    if max_rows <= 0 or len(frame) <= max_rows:
+        return frame
+    if max_rows == 1:
+        return frame.iloc[[-1]]
+    positions = np.linspace(0, len(frame) - 1, max_rows).round().astype(int)
+    return frame.iloc[np.unique(positions)]
+
+
+def _plain(values: np.ndarray) -> list[Any]:
+    """Convert an array to JSON-ready Python values with NaN as null."""
+    items = values.tolist()
+    if values.dtype.kind == "f" and np.isnan(values).any():
+        return [None if v != v else v for v in items]
+    return items
+
+
+def _encode_dates(series: pd.Series | pd.Index) -> dict[str, Any] | list[Any]:
+    """Delta-encode datetimes from the first value, in days when possible."""
+    if series.isna().any():
+        return [None if pd.isna(v) else v.isoformat() for v in series]
+    tz = series.tz if isinstance(series, pd.Index) else series.dt.tz
+    if tz is not None:
+        return [v.isoformat() for v in series]
+    values = np.asarray(series, dtype="datetime64[ns]").astype("int64")
+    if len(values) == 0:
+        return {"type": "dates", "start": None, "unit": "D", "deltas": []}
+    unit = "D" if (values % _UNITS["D"] == 0).all() else "s"
+    if unit == "s" and (values % _UNITS["s"]).any():
+        return [v.isoformat() for v in series]
+    steps = np.diff(values) // _UNITS[unit]
+    encoded: dict[str, Any] = {
+        "type": "dates",
+        "start": pd.Timestamp(values[0]).isoformat(),
+        "unit": unit,
+    }
+    if len(steps) and (steps == steps[0]).all():
+        # Regular series (e.g. daily) collapse to a start, step and count
+        encoded.update(step=int(steps[0]), count=len(values))
+    else:
+        encoded["deltas"] = steps.tolist()
+    return encoded
+
+
+def _encode_column(series: pd.Series | pd.Index) -> Any:
+    dtype = series.dtype
+    if dtype.kind == "M":
+        return _encode_dates(series)
+    if dtype.kind in "biuf":
+        return _plain(np.asarray(series))
+    values = pd.Series(series, copy=False)
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    if len(uniques) <= DICTIONARY_MAX_UNIQUE_RATIO * len(values):
+        return {
+            "type": "dictionary",
+            "values": [_scalar(v) for v in uniques],
+            "codes": codes.tolist(),
+        }
+    return [None if pd.isna(v) else _scalar(v) for v in values]
+
+
+def _scalar(value: Any) -> Any:
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def encode_columnar(frame: pd.DataFrame) -> dict[str, Any]:
+    """
+    Encode a frame column by column.
+
+    Repetitive strings are stored once in a dictionary with integer codes
+    (-1 for null) and datetimes as a start plus integer deltas, so the
+    payload grows with the information in the data rather than its length.
+    """
+    payload: dict[str, Any] = {"encoding": "columnar", "rows": len(frame)}
+    if not isinstance(frame.index, pd.RangeIndex):
+        payload["index"] = {
+            "name": frame.index.name,
+            "values": _encode_column(frame.index),
+        }
+    payload["columns"] = {
+        str(name): _encode_column(frame[name]) for name in frame.columns
+    }
+    return payload
+
+
+def _decode_column(encoded: Any) -> Any:
+    if isinstance(encoded, list):
+        return encoded
+    if encoded["type"] == "dictionary":
+        values = encoded["values"]
+        return [values[code] if code >= 0 else None for code in encoded["codes"]]
+    if encoded["start"] is None:
+        return pd.DatetimeIndex([])
+    unit = _UNITS[encoded["unit"]]
+    if "deltas" in encoded:
+        offsets = np.concatenate([[0], np.cumsum(encoded["deltas"])])
+    else:
+        offsets = np.arange(encoded["count"]) * encoded["step"]
+    start = pd.Timestamp(encoded["start"]).value
+    return pd.DatetimeIndex((start + offsets * unit).astype("datetime64[ns]"))
+
+
+def decode_columnar(payload: dict[str, Any]) -> pd.DataFrame:
+    """Rebuild a DataFrame from the output of encode_columnar."""
+    index = None
+    if "index" in payload:
+        index = pd.Index(
+            _decode_column(payload["index"]["values"]),
+            name=payload["index"]["name"],
+        )
+    columns = {
+        name: _decode_column(values) for name, values in payload["columns"].items()
+    }
+    return pd.DataFrame(columns, index=index)
+
+
+def summarize(frame: pd.DataFrame, head: int = 3) -> dict[str, Any]:
+    """Describe each column and keep the first and last few rows."""
+    summary: dict[str, Any] = {"encoding": "summary", "rows": len(frame)}
+    if len(frame) and isinstance(frame.index, pd.DatetimeIndex):
+        summary["range"] = [frame.index[0].isoformat(), frame.index[-1].isoformat()]
+    if not frame.columns.empty:
+        stats = frame.describe(include="all").T
+        summary["columns"] = json.loads(stats.to_json(orient="index"))
+    edges = (
+        frame
+        if len(frame) <= 2 * head
+        else pd.concat([frame.head(head), frame.tail(head)])
+    )
+    summary["edges"] = json.loads(edges.to_json(orient="split", date_format="iso"))
+    return summary
+
+
+def encode_frame(
+    frame: pd.DataFrame, encoding: str = "split", max_rows: int | None = None
+) -> str:
+    """
+    Serialize a tool result.
+
+    Args:
+        frame: DataFrame to serialize
+        encoding: 'split' (pandas split JSON), 'columnar' (dictionary and
+            delta encoded columns) or 'summary' (per-column statistics plus
+            the first and last rows)
+        max_rows: Optional cap; longer frames are sampled evenly and the
+            original length is reported as 'sampled_from'
+
+    Returns:
+        JSON text
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(
+            f"Unsupported encoding: {encoding}. Use one of: {', '.join(ENCODINGS)}"
+        )
+    if encoding == "summary":
+        return json.dumps(summarize(frame), separators=(",", ":"), default=str)
+
+    total = len(frame)
+    if max_rows is not None:
+        frame = sample_rows(frame, max_rows)
+    if encoding == "split" and len(frame) == total:
+        return frame.to_json(orient="split", date_format="iso")
+
+    if encoding == "split":
+        payload = json.loads(frame.to_json(orient="split", date_format="iso"))
+    else:
+        payload = encode_columnar(frame)
+    if len(frame) < total:
+        payload["sampled_from"] = total
+    return json.dumps(payload, separators=(",", ":"), default=str)
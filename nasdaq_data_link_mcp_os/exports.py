@@ -0,0 +1,290 @@
+import os
+import re
+import tempfile
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from importlib.util import find_spec
+from typing import Any, TextIO
+
+import pandas as pd
+
+# Directory holding exported files served as nasdaq://exports/{export_id}
+EXPORT_DIR = os.getenv(
+    "NASDAQ_DATA_LINK_EXPORT_DIR",
+    os.path.join(tempfile.gettempdir(), "nasdaq_data_link_exports"),
+)
+# Rows serialized per chunk when writing an export file
+CHUNK_ROWS = int(os.getenv("NASDAQ_DATA_LINK_EXPORT_CHUNK_ROWS", "50000"))
+# Results above this many rows are written to a file instead of returned inline
+INLINE_MAX_ROWS = int(os.getenv("NASDAQ_DATA_LINK_EXPORT_INLINE_ROWS", "5000"))
+# Export files older than this many seconds are removed on the next export
+EXPORT_TTL_SECONDS = float(os.getenv("NASDAQ_DATA_LINK_EXPORT_TTL", "86400"))
+
+# Formats that can be written to an export file, mapped to their extension
+STREAMING_FORMATS = {
+    "csv": "csv",
+    "json": "json",
+    "ndjson": "ndjson",
+    "xml": "xml",
+    "parquet": "parquet",
+    "arrow": "arrow",
+}
+# Columnar formats written through pyarrow; they are only delivered as files
+BINARY_FORMATS = ("parquet", "arrow")
+# Codecs accepted by each binary format; None selects the format default
+COMPRESSION_CODECS = {
+    "parquet": ("snappy", "zstd", "gzip", "brotli", "lz4", "none"),
+    "arrow": ("lz4", "zstd", "none"),
+}
+
+_EXPORT_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+def iter_chunks(
+    frame: pd.DataFrame, chunk_rows: int = CHUNK_ROWS
+) -> Iterator[pd.DataFrame]:
+    """Split a DataFrame into consecutive row chunks without copying it."""
+    for start in range(0, max(len(frame), 1), chunk_rows):
+        yield frame.iloc[start : start + chunk_rows]
+
+
+def project(frame: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
+    """Keep only the requested columns, in the requested order."""
+    if not columns:
+        return frame
+    missing = [column for column in columns if column not in frame.columns]
+    if missing:
+        raise ValueError(
+            f"Unknown columns: {', '.join(missing)}. "
+            f"Available: {', '.join(map(str, frame.columns))}"
+        )
+    return frame[list(columns)]
+
+
+def _write_csv(frames: Iterable[pd.DataFrame], out: TextIO) -> int:
+    rows = 0
+    for number, chunk in enumerate(frames):
+        chunk.to_csv(out, index=True, header=number == 0)
+        rows += len(chunk)
+    return rows
+
+
+def _write_ndjson(frames: Iterable[pd.DataFrame], out: TextIO) -> int:
+    rows = 0
+    for chunk in frames:
+        if chunk.empty:
+            continue
+        lines = chunk.to_json(orient="records", date_format="iso", lines=True)
+        out.write(lines if lines.endswith("\n") else f"{lines}\n")
+        rows += len(chunk)
+    return rows
+
+
+def _write_json(frames: Iterable[pd.DataFrame], out: TextIO) -> int:
+    """Write a single JSON array, one chunk of records at a time."""
+    rows = 0
+    out.write("[")
+    for chunk in frames:
+        if chunk.empty:
+            continue
+        records = chunk.to_json(orient="records", date_format="iso")
+        if rows:
+            out.write(",")
+        # Drop the enclosing brackets so chunks join into one array
+        out.write(records[1:-1])
+        rows += len(chunk)
+    out.write("]")
+    return rows
+
+
+def _write_xml(frames: Iterable[pd.DataFrame], out: TextIO) -> int:
+    """Write a single <data> document, one chunk of <row> elements at a time."""
+    parser = "lxml" if find_spec("lxml") is not None else "etree"
+    rows = 0
+    out.write("<?xml version='1.0' encoding='utf-8'?>\n<data>\n")
+    for chunk in frames:
+        if chunk.empty:
+            continue
+        document = chunk.to_xml(index=True, parser=parser)
+        # Drop the declaration and <data> element so chunks join into one document
+        body = document[document.index("<data>") + 6 : document.rindex("</data>")]
+        out.write(body.strip("\n") + "\n")
+        rows += len(chunk)
+    out.write("</data>\n")
+    return rows
+
+
+def _arrow_tables(frames: Iterable[pd.DataFrame]) -> Iterator[Any]:
+    """Convert chunks to Arrow tables sharing the schema of the first chunk."""
+    import pyarrow as pa
+
+    schema = None
+    for chunk in frames:
+        if schema is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=True)
+            schema = table.schema
+        else:
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=True)
+        yield table
+
+
+def _write_parquet(
+    frames: Iterable[pd.DataFrame], path: str, compression: str | None
+) -> int:
+    """Write each chunk as a Parquet row group."""
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for table in _arrow_tables(frames):
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    path, table.schema, compression=compression or "snappy"
+                )
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def _write_arrow(
+    frames: Iterable[pd.DataFrame], path: str, compression: str | None
+) -> int:
+    """Write each chunk as a record batch of an Arrow IPC (Feather v2) file."""
+    import pyarrow as pa
+
+    codec = None if compression in (None, "none") else compression
+    options = pa.ipc.IpcWriteOptions(compression=codec)
+    rows = 0
+    writer = None
+    try:
+        for table in _arrow_tables(frames):
+            if writer is None:
+                writer = pa.ipc.new_file(path, table.schema, options=options)
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+_WRITERS = {
+    "csv": _write_csv,
+    "json": _write_json,
+    "ndjson": _write_ndjson,
+    "xml": _write_xml,
+}
+_BINARY_WRITERS = {"parquet": _write_parquet, "arrow": _write_arrow}
+
+
+def _check_binary_format(output_format: str, compression: str | None) -> None:
+    if find_spec("pyarrow") is None:
+        raise ImportError(
+            f"The {output_format} format requires pyarrow; install it with "
+            "'pip install nasdaq-data-link-mcp-os[parquet]'."
+        )
+    codecs = COMPRESSION_CODECS[output_format]
+    if compression is not None and compression not in codecs:
+        raise ValueError(
+            f"Unsupported compression for {output_format}: {compression}. "
+            f"Use one of: {', '.join(codecs)}"
+        )
+
+
+def _prune_exports() -> None:
+    """Delete export files older than EXPORT_TTL_SECONDS."""
+    cutoff = time.time() - EXPORT_TTL_SECONDS
+    try:
+        entries = list(os.scandir(EXPORT_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def write_export(
+    frames: Iterable[pd.DataFrame],
+    output_format: str,
+    compression: str | None = None,
+) -> dict[str, Any]:
+    """
+    Write frames to a new export file chunk by chunk.
+
+    Only one chunk is serialized at a time, so peak memory stays close to the
+    size of the source data instead of several times it.
+
+    Args:
+        frames: DataFrame chunks to write, in order
+        output_format: One of 'csv', 'json', 'ndjson', 'xml', 'parquet' or
+            'arrow'
+        compression: Codec for 'parquet' or 'arrow' files, see COMPRESSION_CODECS
+
+    Returns:
+        Export handle with the resource URI, file path, format, rows and bytes
+    """
+    if output_format not in STREAMING_FORMATS:
+        raise ValueError(
+            f"Unsupported streaming format: {output_format}. "
+            f"Use one of: {', '.join(STREAMING_FORMATS)}"
+        )
+    if output_format in BINARY_FORMATS:
+        _check_binary_format(output_format, compression)
+    elif compression is not None:
+        raise ValueError(f"Compression is not supported for {output_format}")
+
+    _prune_exports()
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    export_id = uuid.uuid4().hex
+    path = os.path.join(EXPORT_DIR, f"{export_id}.{STREAMING_FORMATS[output_format]}")
+    try:
+        if output_format in BINARY_FORMATS:
+            rows = _BINARY_WRITERS[output_format](frames, path, compression)
+        else:
+            with open(path, "w", encoding="utf-8", newline="") as out:
+                rows = _WRITERS[output_format](frames, out)
+    except Exception:
+        # Do not leave partial files behind as readable exports
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+    return {
+        "export_id": export_id,
+        "uri": f"nasdaq://exports/{export_id}",
+        "path": path,
+        "format": output_format,
+        "rows": rows,
+        "bytes": os.path.getsize(path),
+    }
+
+
+def find_export(export_id: str) -> str:
+    """Return the file path of an export, raising ValueError if it is unknown."""
+    if not _EXPORT_ID_RE.match(export_id):
+        raise ValueError(f"Invalid export id: {export_id}")
+    try:
+        for name in os.listdir(EXPORT_DIR):
+            if name.split(".", 1)[0] == export_id:
+                return os.path.join(EXPORT_DIR, name)
+    except FileNotFoundError:
+        pass
+    raise ValueError(f"Export not found or expired: {export_id}")
+
+
+def read_export(export_id: str) -> str | bytes:
+    """Return the contents of an export file, as bytes for binary formats."""
+    path = find_export(export_id)
+    if path.rsplit(".", 1)[-1] in BINARY_FORMATS:
+        with open(path, "rb") as f:
+            return f.read()
+    with open(path, encoding="utf-8") as f:
+        return f.read()
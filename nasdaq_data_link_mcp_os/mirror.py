@@ -0,0 +1,451 @@
+import argparse
+import json
+import os
+import threading
+import time
+import warnings
+import zipfile
+from collections.abc import Iterable
+from importlib.util import find_spec
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Directory holding mirrored datatables; unset disables the mirror
+MIRROR_DIR = os.getenv("NASDAQ_DATA_LINK_MIRROR_DIR")
+# Datatables downloaded in full with the bulk export and answered locally
+MIRROR_TABLES = tuple(
+    code.strip().upper()
+    for code in os.getenv(
+        "NASDAQ_DATA_LINK_MIRROR_TABLES", "NDAQ/RD,NDAQ/STAT,NFN/MFRFM,WB/METADATA"
+    ).split(",")
+    if code.strip()
+)
+# Seconds a mirror is used before it is downloaded again
+MIRROR_TTL_SECONDS = float(os.getenv("NASDAQ_DATA_LINK_MIRROR_TTL", "86400"))
+# Seconds to wait after a failed refresh before downloading a table again
+MIRROR_RETRY_SECONDS = float(os.getenv("NASDAQ_DATA_LINK_MIRROR_RETRY", "3600"))
+
+# Lookup columns for tables without primary keys in the schema registry
+INDEX_COLUMNS: dict[str, tuple[str, ...]] = {
+    "NDAQ/STAT": ("symbol", "figi"),
+    "NFN/MFRFM": ("fund_id",),
+    "WB/METADATA": ("series_id",),
+}
+
+_RANGE_OPERATORS = {
+    "gt": "__gt__",
+    "gte": "__ge__",
+    "lt": "__lt__",
+    "lte": "__le__",
+}
+
+
+class _MirroredTable:
+    __slots__ = ("fetched_at", "frame", "positions")
+
+    def __init__(
+        self, frame: pd.DataFrame, fetched_at: float, index_columns: Iterable[str]
+    ):
+        self.frame = frame
+        self.fetched_at = fetched_at
+        # Row positions per value of each lookup column, e.g. symbol -> rows
+        self.positions: dict[str, dict[str, np.ndarray]] = {}
+        for column in index_columns:
+            if column in frame.columns and frame[column].dtype.kind not in "Mmf":
+                groups = frame.groupby(column, sort=False, observed=True).indices
+                self.positions[column] = {str(k): v for k, v in groups.items()}
+
+
+def _parse_dates(frame: pd.DataFrame, types: dict[str, str]) -> pd.DataFrame:
+    """Parse the Date columns, as the API client does for live responses."""
+    dates = {}
+    for name, kind in types.items():
+        if kind.lower().startswith("date") and name in frame.columns:
+            try:
+                dates[name] = pd.to_datetime(frame[name])
+            except (TypeError, ValueError):
+                pass
+    return frame.assign(**dates) if dates else frame
+
+
+def _values(value: Any) -> list[str]:
+    if isinstance(value, list | tuple | set):
+        return [str(v).strip() for v in value]
+    return [v.strip() for v in str(value).split(",") if v.strip()]
+
+
+def _coerce(series: pd.Series, value: Any) -> Any:
+    """Convert a filter value to something comparable with the column."""
+    if series.dtype.kind == "M":
+        return pd.Timestamp(value)
+    if series.dtype.kind in "biuf":
+        return float(value)
+    return str(value)
+
+
+def _mask(series: pd.Series, operator: str, value: Any) -> pd.Series:
+    if operator == "in":
+        if series.dtype.kind == "M":
+            return series.isin(pd.to_datetime(value))
+        if series.dtype.kind in "biuf":
+            return series.isin([float(v) for v in value])
+        return series.astype(str).isin(value)
+    return getattr(series, _RANGE_OPERATORS[operator])(_coerce(series, value))
+
+
+class TableMirror:
+    """
+    Local copies of whole datatables, refreshed through the bulk export.
+
+    Each mirrored table is downloaded with qopts.export, stored as Parquet
+    in directory and loaded into memory on first use. Equality filters on
+    primary key and filterable columns are answered from a value -> rows
+    index; other filters and qopts.columns are applied to the matching rows.
+    A stale table keeps being served from the network while a background
+    thread downloads a fresh copy; after a failed download the table is not
+    retried for retry_after seconds.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = MIRROR_DIR,
+        tables: Iterable[str] = MIRROR_TABLES,
+        ttl: float = MIRROR_TTL_SECONDS,
+        retry_after: float = MIRROR_RETRY_SECONDS,
+    ):
+        self.directory = directory
+        self.tables = frozenset(code.upper() for code in tables)
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._loaded: dict[str, _MirroredTable] = {}
+        self._refreshing: set[str] = set()
+        self._failed_at: dict[str, float] = {}
+        self._counters = dict.fromkeys(("hits", "misses", "refreshes", "errors"), 0)
+        self._last_error: str | None = None
+        self._warned = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a mirror directory is configured and Parquet can be written."""
+        if not self.directory or not self.tables:
+            return False
+        if find_spec("pyarrow") is None:
+            if not self._warned:
+                warnings.warn(
+                    "NASDAQ_DATA_LINK_MIRROR_DIR is set but pyarrow is not "
+                    "installed; install pyarrow to enable the table mirror.",
+                    stacklevel=2,
+                )
+                self._warned = True
+            return False
+        return True
+
+    def _path(self, code: str, suffix: str) -> str:
+        return os.path.join(self.directory or "", f"{code.replace('/', '_')}{suffix}")
+
+    def _read_meta(self, code: str) -> dict[str, Any] | None:
+        try:
+            with open(self._path(code, ".json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, code: str) -> bool:
+        """Whether the stored copy of code is younger than the TTL."""
+        code = code.upper()
+        with self._lock:
+            table = self._loaded.get(code)
+        fetched_at = table.fetched_at if table else None
+        if fetched_at is None:
+            meta = self._read_meta(code)
+            fetched_at = meta.get("fetched_at") if meta else None
+        return fetched_at is not None and time.time() - fetched_at < self.ttl
+
+    def parquet_files(self) -> dict[str, str]:
+        """Return the Parquet file of every fresh mirrored table, by code."""
+        if not self.enabled:
+            return {}
+        return {
+            code: self._path(code, ".parquet")
+            for code in sorted(self.tables)
+            if self.is_fresh(code) and os.path.exists(self._path(code, ".parquet"))
+        }
+
+    def _index_columns(self, code: str) -> tuple[str, ...]:
+        # Imported lazily: the registry imports the client, which imports us
+        from nasdaq_data_link_mcp_os.resources.equities_360.registry import get_schema
+
+        schema = get_schema(code)
+        columns = INDEX_COLUMNS.get(code, ())
+        if schema is not None:
+            columns = (*schema.primary_key, *schema.filterable, *columns)
+        return tuple(dict.fromkeys(columns))
+
+    def _load(self, code: str) -> _MirroredTable | None:
+        with self._lock:
+            table = self._loaded.get(code)
+        if table is not None:
+            return table
+        meta = self._read_meta(code)
+        if meta is None:
+            return None
+        try:
+            frame = pd.read_parquet(self._path(code, ".parquet"))
+        except Exception:
+            return None
+        table = _MirroredTable(frame, meta["fetched_at"], self._index_columns(code))
+        with self._lock:
+            self._loaded[code] = table
+        return table
+
+    def _download(self, code: str, path: str) -> None:
+        # Importing the client routes the download through the shared session
+        from nasdaq_data_link_mcp_os import client
+
+        client.nasdaqdatalink.export_table(code, filename=path)
+
+    def _column_types(self, code: str) -> dict[str, str]:
+        """
+        Return the API type of each column of code, e.g. {'date': 'Date'}.
+
+        The types come from the datatable metadata of a one-row request and
+        fall back to the schema registry when that request fails.
+        """
+        from nasdaq_data_link_mcp_os import client
+        from nasdaq_data_link_mcp_os.resources.equities_360.registry import get_schema
+
+        try:
+            page = client.nasdaqdatalink.Datatable(code).data(
+                params={"qopts.per_page": 1}
+            )
+            types = {c["name"]: c["type"] for c in page.meta.get("columns") or []}
+        except Exception:
+            types = {}
+        if not types:
+            schema = get_schema(code)
+            if schema is not None:
+                types = {field.name: field.type for field in schema if field.type}
+        return types
+
+    def refresh(self, code: str) -> dict[str, Any]:
+        """
+        Download code with the bulk export and replace the stored copy.
+
+        Returns:
+            The stored metadata: code, fetched_at, rows and columns
+        """
+        code = code.upper()
+        os.makedirs(self.directory or "", exist_ok=True)
+        zip_path = self._path(code, f".{threading.get_ident()}.zip")
+        parquet_path = self._path(code, ".parquet")
+        tmp_path = f"{parquet_path}.{threading.get_ident()}.tmp"
+        try:
+            self._download(code, zip_path)
+            types = self._column_types(code)
+            with zipfile.ZipFile(zip_path) as archive:
+                member = next(
+                    (n for n in archive.namelist() if n.endswith(".csv")), None
+                )
+                if member is None:
+                    raise ValueError(f"The {code} export contains no CSV file")
+                with archive.open(member) as f:
+                    # String columns are kept as text so identifiers such as
+                    # CUSIPs keep their leading zeros
+                    frame = pd.read_csv(
+                        f,
+                        dtype={
+                            name: str
+                            for name, kind in types.items()
+                            if kind.lower().startswith(("string", "text"))
+                        },
+                    )
+            frame = _parse_dates(frame, types)
+            frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, parquet_path)
+        finally:
+            for path in (zip_path, tmp_path):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+        meta = {
+            "code": code,
+            "fetched_at": time.time(),
+            "rows": len(frame),
+            "columns": [str(c) for c in frame.columns],
+        }
+        with open(self._path(code, ".json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        table = _MirroredTable(frame, meta["fetched_at"], self._index_columns(code))
+        with self._lock:
+            self._loaded[code] = table
+            self._counters["refreshes"] += 1
+        return meta
+
+    def refresh_stale(self, force: bool = False) -> dict[str, str]:
+        """Refresh every configured table that is missing, stale or, with force, all."""
+        results = {}
+        for code in sorted(self.tables):
+            if not force and self.is_fresh(code):
+                results[code] = "fresh"
+                continue
+            try:
+                meta = self.refresh(code)
+                results[code] = f"refreshed ({meta['rows']} rows)"
+            except Exception as e:
+                results[code] = f"error: {e!s}"
+        return results
+
+    def _refresh_in_background(self, code: str) -> None:
+        with self._lock:
+            if code in self._refreshing:
+                return
+            # Keys without bulk export rights would otherwise retry on every lookup
+            failed_at = self._failed_at.get(code, -self.retry_after)
+            if time.monotonic() - failed_at < self.retry_after:
+                return
+            self._refreshing.add(code)
+
+        def run() -> None:
+            try:
+                self.refresh(code)
+            except Exception as e:
+                with self._lock:
+                    self._counters["errors"] += 1
+                    self._last_error = f"{code}: {e!s}"
+                    self._failed_at[code] = time.monotonic()
+            else:
+                with self._lock:
+                    self._failed_at.pop(code, None)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(code)
+
+        threading.Thread(target=run, name=f"mirror-{code}", daemon=True).start()
+
+    def lookup(self, code: str, params: dict[str, Any]) -> pd.DataFrame | None:
+        """
+        Answer a get_table request from the mirror.
+
+        Returns:
+            The matching rows, or None when code is not mirrored, the copy is
+            stale (a refresh is then started) or a parameter cannot be
+            evaluated locally
+        """
+        code = code.upper()
+        if code not in self.tables or not self.enabled:
+            return None
+        if not self.is_fresh(code):
+            self._refresh_in_background(code)
+            self._count("misses")
+            return None
+        table = self._load(code)
+        result = _select(table, params) if table is not None else None
+        self._count("hits" if result is not None else "misses")
+        return result
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def invalidate(self, code: str | None = None) -> None:
+        """Forget the loaded copy of code (or of every table) and its files."""
+        with self._lock:
+            codes = [code.upper()] if code else list(self.tables)
+            for name in codes:
+                self._loaded.pop(name, None)
+        if not self.directory:
+            return
+        for name in codes:
+            for suffix in (".json", ".parquet"):
+                try:
+                    os.remove(self._path(name, suffix))
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict[str, Any]:
+        """Return lookup counters and the state of each mirrored table."""
+        tables = {}
+        if self.directory:
+            for code in sorted(self.tables):
+                meta = self._read_meta(code)
+                tables[code] = {
+                    "rows": meta["rows"] if meta else None,
+                    "fetched_at": meta["fetched_at"] if meta else None,
+                    "fresh": self.is_fresh(code),
+                }
+        with self._lock:
+            return {
+                **self._counters,
+                "enabled": bool(self.directory),
+                "refreshing": sorted(self._refreshing),
+                "last_error": self._last_error,
+                "tables": tables,
+            }
+
+
+def _select(table: _MirroredTable, params: dict[str, Any]) -> pd.DataFrame | None:
+    """Apply datatable filters to a mirrored table, or None if unsupported."""
+    frame = table.frame
+    rows: np.ndarray | None = None
+    filters: list[tuple[str, str, Any]] = []
+    columns: list[str] | None = None
+
+    for name, value in params.items():
+        if value is None:
+            continue
+        if name == "qopts.columns":
+            columns = _values(value)
+            continue
+        if name.startswith("qopts."):
+            return None
+        column, _, operator = name.partition(".")
+        if column not in frame.columns:
+            return None
+        if operator and operator not in _RANGE_OPERATORS:
+            return None
+        if operator:
+            filters.append((column, operator, value))
+        elif column in table.positions:
+            index = table.positions[column]
+            matches = [index[v] for v in _values(value) if v in index]
+            found = np.concatenate(matches) if matches else np.array([], dtype=int)
+            rows = found if rows is None else np.intersect1d(rows, found)
+        else:
+            filters.append((column, "in", _values(value)))
+
+    if columns is not None and not set(columns) <= set(frame.columns):
+        # Let the API report the unknown columns
+        return None
+    result = frame if rows is None else frame.iloc[np.unique(rows)]
+    try:
+        for column, operator, value in filters:
+            result = result[_mask(result[column], operator, value)]
+    except (TypeError, ValueError):
+        # Values that do not fit the column type are left to the API
+        return None
+    if columns is not None:
+        result = result[columns]
+    return result.reset_index(drop=True)
+
+
+table_mirror = TableMirror()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Download or refresh the mirrored Nasdaq Data Link datatables"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Refresh tables that are still fresh"
+    )
+    args = parser.parse_args()
+
+    if not table_mirror.enabled:
+        parser.error("Set NASDAQ_DATA_LINK_MIRROR_DIR to enable the mirror")
+    for code, status in table_mirror.refresh_stale(force=args.force).items():
+        print(f"{code}: {status}")  # noqa: T201
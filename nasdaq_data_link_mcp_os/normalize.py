@@ -0,0 +1,132 @@
+import os
+import threading
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from nasdaq_data_link_mcp_os.cache import frame_nbytes
+from nasdaq_data_link_mcp_os.resources.common.schema import CATEGORY_MAX_UNIQUE_RATIO
+
+# Set NASDAQ_DATA_LINK_NORMALIZE=1 to normalize every fetched datatable frame
+NORMALIZE_ENABLED = os.getenv("NASDAQ_DATA_LINK_NORMALIZE", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+_stats_lock = threading.Lock()
+_stats = {"frames": 0, "bytes_before": 0, "bytes_after": 0}
+
+
+def _is_text(series: pd.Series) -> bool:
+    return series.dtype == object or isinstance(series.dtype, pd.StringDtype)
+
+
+def _looks_like_date(name: Any) -> bool:
+    name = str(name).lower()
+    return name == "date" or name.endswith(("date", "_at")) or name == "reportperiod"
+
+
+def _normalize_text(name: Any, series: pd.Series) -> pd.Series | None:
+    values = series.dropna()
+    if values.empty:
+        return None
+    if _looks_like_date(name):
+        try:
+            return pd.to_datetime(series, format="ISO8601")
+        except (TypeError, ValueError):
+            pass
+    if not values.map(type).eq(str).all():
+        # Mixed object columns are left alone
+        return None
+    if values.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(series):
+        return series.astype("category")
+    return None
+
+
+def _normalize_numeric(series: pd.Series) -> pd.Series | None:
+    kind = series.dtype.kind
+    if kind in "iu":
+        downcast = pd.to_numeric(series, downcast="integer")
+        return downcast if downcast.dtype != series.dtype else None
+    if kind != "f" or series.dtype == np.float32:
+        return None
+    values = series.to_numpy()
+    finite = np.isfinite(values)
+    if not series.isna().any() and finite.all() and (values % 1 == 0).all():
+        return pd.to_numeric(series.astype("int64"), downcast="integer")
+    # Only downcast floats that survive the round trip to float32 unchanged
+    narrow = values.astype(np.float32)
+    same = (narrow.astype(np.float64) == values) | np.isnan(values)
+    return series.astype(np.float32) if same.all() else None
+
+
+def normalize_frame(
+    frame: pd.DataFrame, datatable_code: str | None = None
+) -> pd.DataFrame:
+    """
+    Shrink a fetched frame by converting columns to compact dtypes.
+
+    Documented columns of Equities 360 tables are first cast to the dtypes of
+    the schema registry. Remaining repetitive strings become categoricals,
+    date-named text columns are parsed once, integers are downcast to the
+    narrowest type and floats, schema-typed or not, to float32 only when no
+    value changes. The bytes saved are recorded in frame.attrs["normalize"]
+    and in normalization_stats().
+
+    Args:
+        frame: DataFrame returned by the API
+        datatable_code: Datatable code used to look up a schema
+
+    Returns:
+        A new DataFrame; the input is not modified
+    """
+    if frame.empty:
+        return frame
+
+    before = frame_nbytes(frame)
+    schema = _schema_for(datatable_code)
+    result = schema.cast(frame) if schema is not None else frame
+
+    converted = {}
+    for name in result.columns:
+        series = result[name]
+        if _is_text(series):
+            normalized = _normalize_text(name, series)
+        else:
+            normalized = _normalize_numeric(series)
+        if normalized is not None:
+            converted[name] = normalized
+    if converted:
+        result = result.assign(**converted)
+    elif result is frame:
+        result = frame.copy(deep=False)
+
+    after = frame_nbytes(result)
+    result.attrs["normalize"] = {
+        "bytes_before": before,
+        "bytes_after": after,
+        "bytes_saved": before - after,
+    }
+    with _stats_lock:
+        _stats["frames"] += 1
+        _stats["bytes_before"] += before
+        _stats["bytes_after"] += after
+    return result
+
+
+def normalization_stats() -> dict[str, int]:
+    """Return the number of frames normalized and the total bytes saved."""
+    with _stats_lock:
+        return {**_stats, "bytes_saved": _stats["bytes_before"] - _stats["bytes_after"]}
+
+
+def _schema_for(datatable_code: str | None) -> Any:
+    if not datatable_code:
+        return None
+    # Imported lazily: the registry imports the resource modules, which
+    # import the client that calls this module.
+    from nasdaq_data_link_mcp_os.resources.equities_360.registry import get_schema
+
+    return get_schema(datatable_code)
@@ -0,0 +1,119 @@
+import os
+import re
+from typing import Any
+
+import pandas as pd
+
+from nasdaq_data_link_mcp_os import mirror
+from nasdaq_data_link_mcp_os.cache import response_cache
+
+# Most rows a query may return to the caller
+QUERY_MAX_ROWS = int(os.getenv("NASDAQ_DATA_LINK_QUERY_MAX_ROWS", "1000"))
+
+_NAME_RE = re.compile(r"[^a-z0-9]+")
+
+
+def table_name(code: str) -> str:
+    """Return the SQL name of a datatable: 'NDAQ/RTAT10' -> 'ndaq_rtat10'."""
+    return _NAME_RE.sub("_", code.lower()).strip("_")
+
+
+def _import_duckdb() -> Any:
+    try:
+        import duckdb
+    except ImportError:
+        raise ImportError(
+            "query_tables requires duckdb; install it with "
+            "'pip install nasdaq-data-link-mcp-os[sql]'."
+        ) from None
+    return duckdb
+
+
+def _cached_tables() -> dict[str, pd.DataFrame]:
+    """Combine the cached responses of each datatable into one frame."""
+    by_code: dict[str, list[pd.DataFrame]] = {}
+    for code, frame in response_cache.frames("get_table"):
+        by_code.setdefault(code, []).append(frame)
+    tables = {}
+    for code, frames in by_code.items():
+        combined = (
+            pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        )
+        try:
+            # Overlapping requests (e.g. paged and filtered) repeat rows
+            combined = combined.drop_duplicates(ignore_index=True)
+        except TypeError:
+            pass
+        tables[code] = combined
+    return tables
+
+
+def available_tables() -> list[dict[str, Any]]:
+    """
+    Describe the tables query_tables can read.
+
+    Mirrored tables are read from their Parquet files; other datatables are
+    built from the responses currently held in the in-memory cache.
+    """
+    files = mirror.table_mirror.parquet_files()
+    tables = [
+        {"name": table_name(code), "code": code, "source": "mirror"} for code in files
+    ]
+    for code, frame in _cached_tables().items():
+        if code not in files:
+            tables.append(
+                {
+                    "name": table_name(code),
+                    "code": code,
+                    "source": "cache",
+                    "rows": len(frame),
+                    "columns": [str(c) for c in frame.columns],
+                }
+            )
+    return tables
+
+
+def run_query(sql: str, max_rows: int | None = None) -> tuple[pd.DataFrame, bool]:
+    """
+    Run a read-only SQL query over the mirrored and cached datatables.
+
+    Each table is available under its table_name (e.g. ndaq_rtat, ndaq_ca).
+    Mirrored tables are Parquet views, so DuckDB pushes filters and column
+    selection down into the file scan. The connection is in-memory, accepts
+    a single SELECT statement and cannot touch files outside the mirror.
+
+    Args:
+        sql: A single SELECT (or WITH ... SELECT) statement
+        max_rows: Row cap (default: NASDAQ_DATA_LINK_QUERY_MAX_ROWS)
+
+    Returns:
+        The result frame and whether it was truncated to max_rows
+    """
+    duckdb = _import_duckdb()
+    statements = duckdb.extract_statements(sql)
+    if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+        raise ValueError("query_tables accepts a single SELECT statement")
+    limit = max(1, max_rows or QUERY_MAX_ROWS)
+
+    files = mirror.table_mirror.parquet_files()
+    connection = duckdb.connect(":memory:")
+    try:
+        for code, path in files.items():
+            escaped = path.replace("'", "''")
+            connection.execute(
+                f'CREATE VIEW "{table_name(code)}" AS '  # noqa: S608
+                f"SELECT * FROM read_parquet('{escaped}')"
+            )
+        for code, frame in _cached_tables().items():
+            if code not in files:
+                connection.register(table_name(code), frame)
+
+        directories = sorted({os.path.dirname(path) for path in files.values()})
+        connection.execute("SET allowed_directories = ?", [directories])
+        connection.execute("SET enable_external_access = false")
+        connection.execute("SET lock_configuration = true")
+
+        result = connection.sql(sql).limit(limit + 1).df()
+    finally:
+        connection.close()
+    return result.head(limit), len(result) > limit
@@ -0,0 +1,221 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import Any
+
+import pandas as pd
+
+from nasdaq_data_link_mcp_os.cache import frame_nbytes, ttl_for
+
+# Memory budget for stored time series across all dataset codes
+RANGE_STORE_MAX_BYTES = int(
+    os.getenv("NASDAQ_DATA_LINK_RANGE_STORE_MAX_BYTES", str(128 << 20))
+)
+# The most recent days may still change upstream; they are refetched once this
+# many seconds have passed since they were downloaded.
+TAIL_TTL_SECONDS = float(os.getenv("NASDAQ_DATA_LINK_RANGE_TAIL_TTL", "900"))
+PROVISIONAL_DAYS = 1
+
+_ONE_DAY = timedelta(days=1)
+
+Fetcher = Callable[..., pd.DataFrame]
+
+
+def subtract_intervals(
+    start: date, end: date, covered: list[tuple[date, date]]
+) -> list[tuple[date, date]]:
+    """Return the parts of [start, end] not covered by the sorted intervals."""
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start - _ONE_DAY))
+        cursor = max(cursor, covered_end + _ONE_DAY)
+        if cursor > end:
+            return gaps
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def merge_intervals(intervals: list[tuple[date, date]]) -> list[tuple[date, date]]:
+    """Sort intervals and coalesce the ones that overlap or touch."""
+    merged: list[tuple[date, date]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + _ONE_DAY:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class _StoredSeries:
+    __slots__ = (
+        "expires_at",
+        "frame",
+        "intervals",
+        "nbytes",
+        "tail_expires_at",
+        "tail_start",
+    )
+
+    def __init__(self, expires_at: float = float("inf")) -> None:
+        self.expires_at = expires_at
+        self.frame: pd.DataFrame | None = None
+        self.intervals: list[tuple[date, date]] = []
+        self.nbytes = 0
+        self.tail_start: date | None = None
+        self.tail_expires_at = 0.0
+
+    def expire_tail(self, now: float) -> None:
+        """Forget coverage of the provisional tail once its TTL has passed."""
+        if self.tail_start is None or now < self.tail_expires_at:
+            return
+        cutoff = self.tail_start - _ONE_DAY
+        self.intervals = [
+            (start, min(end, cutoff))
+            for start, end in self.intervals
+            if start <= cutoff
+        ]
+        self.tail_start = None
+
+
+class TimeSeriesStore:
+    """
+    Range-aware store for time-series datasets fetched with nasdaqdatalink.get.
+
+    For each dataset code it keeps the merged DataFrame and the date intervals
+    already downloaded. A request only fetches the gaps between those
+    intervals, merges them into the stored frame and slices the result.
+    """
+
+    def __init__(self, max_bytes: int = RANGE_STORE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._series: OrderedDict[str, _StoredSeries] = OrderedDict()
+        self._bytes = 0
+
+    def get(
+        self,
+        dataset_code: str,
+        fetch: Fetcher,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Return dataset_code between start_date and end_date (inclusive).
+
+        Args:
+            dataset_code: Dataset code in format 'DATABASE/DATASET'
+            fetch: Called as fetch(dataset_code, **params) for each missing range
+            start_date: Optional start date in YYYY-MM-DD format
+            end_date: Optional end date in YYYY-MM-DD format
+        """
+        try:
+            start = date.fromisoformat(start_date) if start_date else date.min
+            end = date.fromisoformat(end_date) if end_date else date.today()
+        except ValueError:
+            # Let the API report malformed dates
+            return fetch(dataset_code, **_date_params(start_date, end_date))
+
+        key = dataset_code.strip().upper()
+        today = date.today()
+        with self._lock:
+            series = self._series.get(key)
+            if series is not None and time.monotonic() >= series.expires_at:
+                self._bytes -= series.nbytes
+                del self._series[key]
+                series = None
+            if series is not None:
+                series.expire_tail(time.monotonic())
+                gaps = subtract_intervals(start, end, series.intervals)
+            else:
+                gaps = [(start, end)]
+
+        fetched = []
+        for gap_start, gap_end in gaps:
+            # Open-ended edges stay open so unbounded requests remain unbounded
+            gap_from = None if gap_start == date.min else gap_start.isoformat()
+            open_end = end_date is None and gap_end == end
+            gap_to = None if open_end else gap_end.isoformat()
+            frame = fetch(dataset_code, **_date_params(gap_from, gap_to))
+            if not frame.empty and not isinstance(frame.index, pd.DatetimeIndex):
+                # Not a date-indexed series; range bookkeeping does not apply
+                if len(gaps) == 1 and series is None:
+                    return frame
+                return fetch(dataset_code, **_date_params(start_date, end_date))
+            fetched.append((gap_start, gap_end, frame))
+
+        with self._lock:
+            series = self._series.get(key) or _StoredSeries(
+                time.monotonic() + ttl_for(dataset_code)
+            )
+            frames = [series.frame] if series.frame is not None else []
+            for gap_start, gap_end, frame in fetched:
+                if not frame.empty:
+                    frames.append(frame)
+                series.intervals.append((gap_start, min(gap_end, today)))
+                if gap_end >= today - timedelta(days=PROVISIONAL_DAYS):
+                    tail_start = today - timedelta(days=PROVISIONAL_DAYS)
+                    series.tail_start = min(series.tail_start or tail_start, tail_start)
+                    series.tail_expires_at = time.monotonic() + TAIL_TTL_SECONDS
+            series.intervals = merge_intervals(series.intervals)
+            if fetched and frames:
+                merged = pd.concat(frames) if len(frames) > 1 else frames[0]
+                merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+                series.frame = merged
+            self._remember(key, series)
+            result = series.frame
+
+        if result is None:
+            return fetched[0][2] if fetched else pd.DataFrame()
+        lower = pd.Timestamp(start) if start_date else None
+        upper = pd.Timestamp(end) if end_date else None
+        return result.loc[lower:upper].copy()
+
+    def coverage(self, dataset_code: str) -> list[tuple[date, date]]:
+        """Return the date intervals stored for a dataset code."""
+        with self._lock:
+            series = self._series.get(dataset_code.strip().upper())
+            return list(series.intervals) if series else []
+
+    def invalidate(self, dataset_code: str | None = None) -> None:
+        """Forget one dataset code, or every stored series when None."""
+        with self._lock:
+            if dataset_code is None:
+                self._series.clear()
+                self._bytes = 0
+                return
+            series = self._series.pop(dataset_code.strip().upper(), None)
+            if series is not None:
+                self._bytes -= series.nbytes
+
+    def _remember(self, key: str, series: _StoredSeries) -> None:
+        """Account the series' size and evict least recently used series."""
+        self._bytes -= series.nbytes
+        series.nbytes = frame_nbytes(series.frame) if series.frame is not None else 0
+        self._bytes += series.nbytes
+        self._series[key] = series
+        self._series.move_to_end(key)
+        while self._bytes > self.max_bytes and len(self._series) > 1:
+            _, evicted = self._series.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+
+def _date_params(start_date: str | None, end_date: str | None) -> dict[str, Any]:
+    params = {}
+    if start_date:
+        params["start_date"] = start_date
+    if end_date:
+        params["end_date"] = end_date
+    return params
+
+
+timeseries_store = TimeSeriesStore()
@@ -0,0 +1,179 @@
+import hashlib
+import os
+import random
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+# Sustained requests per second and burst size allowed per API key. The
+# defaults stay inside Data Link's documented 300 calls per 10 seconds and
+# 2,000 calls per 10 minutes for authenticated users.
+RATE_LIMIT = float(os.getenv("NASDAQ_DATA_LINK_RATE_LIMIT", "3.3"))
+RATE_BURST = float(os.getenv("NASDAQ_DATA_LINK_RATE_BURST", "30"))
+# Longest pause honoured from a Retry-After header, in seconds
+MAX_RETRY_AFTER = float(os.getenv("NASDAQ_DATA_LINK_MAX_RETRY_AFTER", "60"))
+
+
+def _parse_limit_overrides(value: str | None) -> dict[str, tuple[float, float]]:
+    """Parse 'KEY=RATE[:BURST],...' into per-key (rate, burst) limits."""
+    overrides: dict[str, tuple[float, float]] = {}
+    for item in (value or "").split(","):
+        key, _, limit = item.partition("=")
+        if not key.strip() or not limit.strip():
+            continue
+        rate, _, burst = limit.partition(":")
+        overrides[key.strip()] = (float(rate), float(burst or RATE_BURST))
+    return overrides
+
+
+# Per-API-key limits, e.g. for premium keys with higher quotas
+RATE_LIMITS = _parse_limit_overrides(os.getenv("NASDAQ_DATA_LINK_RATE_LIMITS"))
+
+_stats_lock = threading.Lock()
+_stats = {
+    "requests": 0,
+    "delayed": 0,
+    "waited_seconds": 0.0,
+    "throttled": 0,
+    "retries": 0,
+}
+
+
+def _record(name: str, amount: float = 1) -> None:
+    with _stats_lock:
+        _stats[name] += amount
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with adaptive rate.
+
+    Every request takes one token. When the API answers 429 the bucket pauses
+    all callers and halves its rate; each successful request then restores a
+    tenth of the configured rate until it is back to full speed.
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT, burst: float = RATE_BURST):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 16
+        self.burst = max(burst, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the seconds waited."""
+        if self.max_rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+        _record("requests")
+        if waited:
+            _record("delayed")
+            _record("waited_seconds", waited)
+        return waited
+
+    def throttle(self, delay: float) -> None:
+        """Pause every caller for delay seconds and halve the rate."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._paused_until = max(self._paused_until, now + delay)
+        _record("throttled")
+
+    def recover(self) -> None:
+        """Step the rate back towards its configured value after a success."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+_buckets_lock = threading.Lock()
+_buckets: dict[str, TokenBucket] = {}
+
+
+def get_bucket(api_key: str | None) -> TokenBucket:
+    """Return the bucket shared by every request made with api_key."""
+    name = (
+        hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else "anonymous"
+    )
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            rate, burst = RATE_LIMITS.get(api_key or "", (RATE_LIMIT, RATE_BURST))
+            bucket = _buckets[name] = TokenBucket(rate, burst)
+        return bucket
+
+
+def reset_buckets() -> None:
+    """Forget every bucket, e.g. after the limits were reconfigured."""
+    with _buckets_lock:
+        _buckets.clear()
+
+
+def record_retry() -> None:
+    """Count a request that is sent again after a failure."""
+    _record("retries")
+
+
+def limiter_stats() -> dict[str, Any]:
+    """Return request, wait, throttle and retry counters plus current rates."""
+    with _buckets_lock:
+        rates = [bucket.rate for bucket in _buckets.values()]
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["waited_seconds"] = round(stats["waited_seconds"], 3)
+    stats["buckets"] = len(rates)
+    stats["min_rate"] = min(rates) if rates else RATE_LIMIT
+    return stats
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay requested by a Retry-After header in seconds."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def backoff_delay(
+    attempt: int, factor: float, cap: float, retry_after: float | None = None
+) -> float:
+    """
+    Return the wait before retry number attempt (0-based).
+
+    Without a Retry-After hint this is "full jitter" exponential backoff: a
+    random delay up to factor * 2**attempt, capped at cap, so clients that
+    failed together do not retry together.
+    """
+    if retry_after is not None:
+        return retry_after + random.uniform(0, factor)  # noqa: S311
+    return random.uniform(0, min(cap, factor * 2**attempt))  # noqa: S311
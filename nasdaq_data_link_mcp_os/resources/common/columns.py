@@ -0,0 +1,54 @@
+from collections.abc import Iterable
+
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+
+
+def split_values(values: str | Iterable[str] | None) -> list[str]:
+    """Split a list or comma-separated string, dropping blanks and repeats."""
+    if not values:
+        return []
+    if isinstance(values, str):
+        values = values.split(",")
+    return list(dict.fromkeys(v.strip() for v in values if v and v.strip()))
+
+
+def chunk_values(values: list[str], size: int) -> list[list[str]]:
+    """Split values into consecutive chunks of at most size values."""
+    size = max(1, size)
+    return [values[i : i + size] for i in range(0, len(values), size)]
+
+
+def parse_columns(columns: str | Iterable[str] | None) -> list[str]:
+    """Normalize a column list or comma-separated string, dropping repeats."""
+    return split_values(columns)
+
+
+def column_params(
+    columns: str | Iterable[str] | None,
+    schema: TableSchema | None = None,
+) -> dict[str, str]:
+    """
+    Build the qopts.columns parameter for a column projection.
+
+    Args:
+        columns: Requested columns, as a list or comma-separated string
+        schema: The table's schema, used to reject unknown columns before any
+            request is sent
+
+    Returns:
+        {'qopts.columns': 'a,b,c'}, or an empty dict when no projection is set
+
+    Raises:
+        ValueError: If a column is not documented for the table
+    """
+    names = parse_columns(columns)
+    if not names:
+        return {}
+    if schema is not None:
+        unknown = [name for name in names if name not in schema]
+        if unknown:
+            raise ValueError(
+                f"Unknown columns for {schema.code}: {', '.join(unknown)}. "
+                f"Available: {', '.join(schema.names)}"
+            )
+    return {"qopts.columns": ",".join(names)}
@@ -1,34 +1,263 @@
-from typing import TypeVar
-
-import pycountry
+import functools
+import re
+import threading
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 CountryCode = TypeVar("CountryCode", bound=str)
 
+# Names in common use that pycountry does not list, mapped to ISO alpha-3
+ALIASES: Mapping[str, str] = {
+    "america": "USA",
+    "united states of america": "USA",
+    "us": "USA",
+    "usa": "USA",
+    "uk": "GBR",
+    "britain": "GBR",
+    "great britain": "GBR",
+    "england": "GBR",
+    "south korea": "KOR",
+    "north korea": "PRK",
+    "russia": "RUS",
+    "iran": "IRN",
+    "syria": "SYR",
+    "vietnam": "VNM",
+    "laos": "LAO",
+    "bolivia": "BOL",
+    "venezuela": "VEN",
+    "tanzania": "TZA",
+    "moldova": "MDA",
+    "czech republic": "CZE",
+    "ivory coast": "CIV",
+    "macedonia": "MKD",
+    "burma": "MMR",
+    "holland": "NLD",
+    "turkey": "TUR",
+    "swaziland": "SWZ",
+    "cape verde": "CPV",
+    "east timor": "TLS",
+    "vatican": "VAT",
+    "vatican city": "VAT",
+    "palestine": "PSE",
+    "taiwan": "TWN",
+    "micronesia": "FSM",
+    "brunei": "BRN",
+    "uae": "ARE",
+    "emirates": "ARE",
+    "drc": "COD",
+    "dr congo": "COD",
+    "democratic republic of congo": "COD",
+    "congo kinshasa": "COD",
+    "congo brazzaville": "COG",
+    "republic of congo": "COG",
+}
+
+# Continents and regions that are part of a country name ('South Africa')
+# but never mean that country on their own
+REGIONS = frozenset({"africa", "americas", "asia", "caribbean", "europe", "oceania"})
+
+# Minimum trigram (Dice) similarity for a fuzzy match
+FUZZY_MIN_SIMILARITY = 0.5
+# In a fuzzy match every query word must be a word of the name, misspelt by
+# at most one edit (two from twice this length); shorter words match exactly
+FUZZY_MIN_WORD_LENGTH = 4
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SAINT_RE = re.compile(r"\bst\b")
+# Runs of single letters left by dotted abbreviations: 'u s a' from 'U.S.A.'
+_INITIALS_RE = re.compile(r"\b[a-z](?: [a-z])+\b")
+
+
+def fold(name: str) -> str:
+    """
+    Normalize a name for matching.
+
+    Lowercases, strips diacritics and punctuation, spells out '&' and 'St',
+    joins dotted initials ('U.S.' becomes 'us') and drops a leading 'the':
+    "Côte d'Ivoire" becomes 'cote d ivoire'.
+    """
+    decomposed = unicodedata.normalize("NFKD", name.replace("&", " and "))
+    ascii_name = "".join(c for c in decomposed if not unicodedata.combining(c))
+    folded = _NON_ALNUM_RE.sub(" ", ascii_name.lower()).strip()
+    folded = _INITIALS_RE.sub(lambda m: m.group().replace(" ", ""), folded)
+    return _SAINT_RE.sub("saint", folded.removeprefix("the "))
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """Return the number of insertions, deletions, substitutions or swaps."""
+    previous, current = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (a[i - 1] != b[j - 1]),
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+    return current[-1]
+
+
+def _allowed_edits(word: str) -> int:
+    if len(word) < FUZZY_MIN_WORD_LENGTH:
+        return 0
+    return 1 if len(word) < 2 * FUZZY_MIN_WORD_LENGTH else 2
+
+
+def _words_match(query: str, name: str) -> bool:
+    """
+    Return True if every word of query is a (slightly misspelt) word of name.
+
+    Keeps region names such as 'Latin America' or 'Southern Africa' from
+    matching a country on shared words alone.
+    """
+    words = name.split()
+    return all(
+        word in words
+        or any(_edit_distance(word, other) <= _allowed_edits(word) for other in words)
+        for word in query.split()
+    )
+
+
+class CountryIndex:
+    """
+    Lookup index from country names to ISO alpha-3 codes.
+
+    Codes, names, common names, official names and ALIASES are folded once
+    and kept in a dictionary for exact matches. Names are also indexed by
+    trigram. A query made of whole words of a single country's names
+    ('bosnia') or slightly misspelt ('Germny') is then resolved from its
+    trigram candidates instead of by scanning every country.
+    """
+
+    __slots__ = ("_exact", "_names", "_postings")
+
+    def __init__(self, countries: Iterable[Any], aliases: Mapping[str, str] = ALIASES):
+        self._exact: dict[str, str] = {}
+        self._names: list[tuple[str, str, int]] = []
+        self._postings: dict[str, list[int]] = {}
+
+        for country in countries:
+            code = country.alpha_3
+            for attribute in ("alpha_2", "alpha_3", "numeric"):
+                self._exact.setdefault(getattr(country, attribute).lower(), code)
+            for attribute in ("name", "common_name", "official_name"):
+                name = getattr(country, attribute, None)
+                if name:
+                    self._add_name(name, code)
+                    # 'Korea, Republic of' is also known as 'Republic of Korea'
+                    head, comma, tail = name.partition(", ")
+                    if comma:
+                        self._add_name(f"{tail} {head}", code)
+        for alias, code in aliases.items():
+            self._add_name(alias, code)
+
+    def _add_name(self, name: str, code: str) -> None:
+        folded = fold(name)
+        if not folded or folded in self._exact:
+            return
+        self._exact[folded] = code
+        grams = _trigrams(folded)
+        name_id = len(self._names)
+        self._names.append((folded, code, len(grams)))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(name_id)
+
+    def __len__(self) -> int:
+        return len(set(self._exact.values()))
+
+    def resolve(self, name: str) -> str | None:
+        """
+        Return the alpha-3 code for a country name, or None if nothing matches.
+
+        Exact (folded) matches win, then names containing the query as whole
+        words, then the most similar name by trigram similarity whose words
+        all match the query's. A query contained in the names of several
+        countries ('south') is ambiguous and returns None.
+        """
+        code = self._exact.get(name.strip().lower())
+        if code is not None:
+            return code
+        query = fold(name)
+        if not query:
+            return None
+        code = self._exact.get(query)
+        if code is not None or query in REGIONS:
+            return code
+
+        grams = _trigrams(query)
+        shared = Counter(
+            name_id for gram in grams for name_id in self._postings.get(gram, ())
+        )
+        padded = f" {query} "
+        contained: set[str] = set()
+        best: tuple[float, int] | None = None
+        best_code = None
+        for name_id, overlap in shared.items():
+            folded, code, size = self._names[name_id]
+            if padded in f" {folded} ":
+                contained.add(code)
+                continue
+            similarity = 2 * overlap / (len(grams) + size)
+            if similarity < FUZZY_MIN_SIMILARITY or not _words_match(query, folded):
+                continue
+            rank = (similarity, -name_id)
+            if best is None or rank > best:
+                best, best_code = rank, code
+        if contained:
+            return contained.pop() if len(contained) == 1 else None
+        return best_code
+
+
+_index_lock = threading.Lock()
+_index: CountryIndex | None = None
+
+
+def get_country_index() -> CountryIndex:
+    """Return the process-wide country index, building it on first use."""
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            # pycountry loads large JSON databases; import it only when needed
+            import pycountry
+
+            _index = CountryIndex(pycountry.countries)
+        return _index
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_country(country_name: str) -> str | None:
+    """Return the ISO alpha-3 code for a country name, or None."""
+    return get_country_index().resolve(country_name)
+
+
+def resolve_many(country_names: Iterable[str]) -> dict[str, str | None]:
+    """
+    Resolve many country names to ISO alpha-3 codes.
+
+    Returns:
+        Mapping of each distinct input name to its code, or None if unknown
+    """
+    return {name: resolve_country(name) for name in dict.fromkeys(country_names)}
+
 
 def get_country_code(country_name: str) -> str:
     """
     Get the 3-letter ISO country code for a given country name.
-    Searches through official country names and common names.
-    """
-    # Try exact match first
-    try:
-        country = pycountry.countries.lookup(country_name)
-        return country.alpha_3
-    except LookupError:
-        # Try fuzzy search
-        name_lower = country_name.lower()
-        for country in pycountry.countries:
-            if (
-                name_lower in country.name.lower()
-                or (
-                    hasattr(country, "common_name")
-                    and name_lower in country.common_name.lower()
-                )
-                or (
-                    hasattr(country, "official_name")
-                    and name_lower in country.official_name.lower()
-                )
-            ):
-                return country.alpha_3
+    Searches through codes, official names, common names and aliases, and
+    tolerates missing accents, partial names and small misspellings.
+    """
+    code = resolve_country(country_name)
+    if code is not None:
+        return code
 
     return f"Unknown country: {country_name}"
@@ -0,0 +1,197 @@
+from collections.abc import Iterable, Iterator
+from types import MappingProxyType
+from typing import Any
+
+import pandas as pd
+
+# Target pandas dtypes for the field types documented by the datatables
+DTYPES: MappingProxyType[str, str] = MappingProxyType(
+    {
+        "BigInt": "int64",
+        "Integer": "int64",
+        "Double": "float32",
+        "String": "category",
+        "Date": "datetime64[ns]",
+    }
+)
+
+# Strings are only made categorical when at most this share of values is unique
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+class Field:
+    """A single documented datatable column. Instances are immutable."""
+
+    __slots__ = ("description", "filterable", "name", "primary_key", "type")
+
+    name: str
+    description: str
+    type: str | None
+    filterable: bool
+    primary_key: bool
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        field_type: str | None = None,
+        filterable: bool = False,
+        primary_key: bool = False,
+    ):
+        for slot, value in (
+            ("name", name),
+            ("description", description),
+            ("type", field_type),
+            ("filterable", filterable),
+            ("primary_key", primary_key),
+        ):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"Field({self.name!r}, type={self.type!r})"
+
+    @property
+    def dtype(self) -> str | None:
+        """Memory-efficient pandas dtype for this field, if its type is known."""
+        return DTYPES.get(self.type) if self.type else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the field in the list_available_*_fields dictionary format."""
+        data: dict[str, Any] = {"name": self.name, "description": self.description}
+        if self.type is not None:
+            data["type"] = self.type
+        if self.filterable:
+            data["filterable"] = True
+        if self.primary_key:
+            data["primary_key"] = True
+        return data
+
+
+class TableSchema:
+    """
+    Frozen schema of a datatable, built once at import time.
+
+    Fields keep their documented order and are indexed by name, so column
+    validation and dtype lookups do not rebuild any lists.
+    """
+
+    __slots__ = ("_by_name", "code", "dtypes", "fields", "filterable", "primary_key")
+
+    def __init__(self, code: str, fields: Iterable[Field]):
+        fields = tuple(fields)
+        by_name = MappingProxyType({field.name: field for field in fields})
+        for slot, value in (
+            ("code", code),
+            ("fields", fields),
+            ("_by_name", by_name),
+            ("dtypes", MappingProxyType(_dtypes(fields))),
+            ("filterable", tuple(f.name for f in fields if f.filterable)),
+            ("primary_key", tuple(f.name for f in fields if f.primary_key)),
+        ):
+            object.__setattr__(self, slot, value)
+
+    @classmethod
+    def from_dicts(cls, code: str, fields: Iterable[dict[str, Any]]) -> "TableSchema":
+        """Build a schema from list_available_*_fields style dictionaries."""
+        return cls(
+            code,
+            (
+                Field(
+                    field["name"],
+                    field["description"],
+                    field.get("type"),
+                    field.get("filterable", False),
+                    field.get("primary_key", False),
+                )
+                for field in fields
+            ),
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"TableSchema({self.code!r}, {len(self.fields)} fields)"
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[Field]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __getitem__(self, name: str) -> Field:
+        return self._by_name[name]
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Field names in documented order."""
+        return tuple(self._by_name)
+
+    def get(self, name: str) -> Field | None:
+        """Return the field called name, or None."""
+        return self._by_name.get(name)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Return the fields in the list_available_*_fields dictionary format."""
+        return [field.to_dict() for field in self.fields]
+
+    def cast(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return frame with documented columns cast to their compact dtypes.
+
+        Integer columns holding missing values stay floating point, Double
+        columns are only narrowed to float32 when no value changes, and
+        string columns are only made categorical when values repeat enough
+        for it to save memory. Columns that cannot be converted are kept.
+        """
+        converted = {}
+        for column in frame.columns:
+            dtype = self.dtypes.get(column)
+            if dtype is None:
+                continue
+            series = _cast_series(frame[column], dtype)
+            if series is not None:
+                converted[column] = series
+        return frame.assign(**converted) if converted else frame
+
+
+def _dtypes(fields: tuple[Field, ...]) -> dict[str, str]:
+    return {field.name: field.dtype for field in fields if field.dtype is not None}
+
+
+def _cast_series(series: pd.Series, dtype: str) -> pd.Series | None:
+    """Convert one column to dtype, or return None to keep it unchanged."""
+    if str(series.dtype) == dtype:
+        return None
+    try:
+        if dtype == "int64":
+            if series.isna().any():
+                return None
+            numeric = pd.to_numeric(series)
+            if numeric.dtype.kind == "f" and not (numeric % 1 == 0).all():
+                return None
+            return numeric.astype("int64")
+        if dtype == "float32":
+            numeric = pd.to_numeric(series)
+            narrow = numeric.astype("float32")
+            # Only downcast when every value survives the round trip unchanged
+            if narrow.astype("float64").equals(numeric.astype("float64")):
+                return narrow
+            return numeric if numeric.dtype != series.dtype else None
+        if dtype == "category":
+            if series.nunique(dropna=True) > CATEGORY_MAX_UNIQUE_RATIO * len(series):
+                return None
+            return series.astype("category")
+        if dtype == "datetime64[ns]":
+            if series.dtype.kind == "M":
+                return None
+            return pd.to_datetime(series)
+    except (TypeError, ValueError):
+        return None
+    return None
@@ -1,14 +1,19 @@
 from typing import Any
 
-import nasdaqdatalink
 import pandas as pd
 
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import column_params
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+from nasdaq_data_link_mcp_os.resources.equities_360.batch import fetch_batch
+
 
 def get_balance_sheet(
     symbol: str | None = None,
     figi: str | None = None,
     calendardate: str | None = None,
     dimension: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame | str:
     """
     Fetch balance sheet data from Nasdaq Data Link E360 NDAQ/BS table.
@@ -18,6 +23,7 @@ def get_balance_sheet(
         figi: Bloomberg FIGI identifier (e.g., 'BBG000BPH459')
         calendardate: Calendar date in YYYY-MM-DD format
         dimension: MRQ (Quarterly), MRY (Annual), or MRT (Trailing-twelve-months)
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
         DataFrame containing balance sheet data or error message
@@ -36,8 +42,10 @@ def get_balance_sheet(
         if dimension:
             params["dimension"] = dimension
 
+        params.update(column_params(columns, BALANCE_SHEET_SCHEMA))
+
         # Fetch data from NDAQ/BS table
-        data = nasdaqdatalink.get_table("NDAQ/BS", **params)
+        data = client.get_table("NDAQ/BS", **params)
 
         if data.empty:
             return "No data found for the specified criteria."
@@ -47,14 +55,41 @@ def get_balance_sheet(
         return f"Error fetching balance sheet data: {e!s}"
 
 
-def list_available_balance_sheet_fields() -> list[dict[str, Any]]:
+def get_balance_sheet_batch(
+    symbols: list[str] | str | None = None,
+    figis: list[str] | str | None = None,
+    calendardate: str | None = None,
+    dimension: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | str:
     """
-    List available fields in the NDAQ/BS table with descriptions.
+    Fetch NDAQ/BS rows for many companies in a few concurrent requests.
+
+    Args:
+        symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT'] or 'AAPL,MSFT')
+        figis: Bloomberg FIGI identifiers
+        calendardate: Calendar date in YYYY-MM-DD format
+        dimension: MRQ (Quarterly), MRY (Annual), or MRT (Trailing-twelve-months)
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
-        List of dictionaries containing field name, description, and type
+        DataFrame containing balance sheet data for all companies or error message
     """
-    fields = [
+    return fetch_batch(
+        "NDAQ/BS",
+        "balance sheet data",
+        symbols,
+        figis,
+        calendardate=calendardate,
+        dimension=dimension,
+        columns=columns,
+        schema=BALANCE_SHEET_SCHEMA,
+    )
+
+
+BALANCE_SHEET_SCHEMA = TableSchema.from_dicts(
+    "NDAQ/BS",
+    [
         {
             "name": "calendardate",
             "description": "The Calendar Date represents the normalized reportperiod",
@@ -228,5 +263,15 @@ def list_available_balance_sheet_fields() -> list[dict[str, Any]]:
             "description": "Cash and equivalents in USD",
             "type": "BigInt",
         },
-    ]
-    return fields
+    ],
+)
+
+
+def list_available_balance_sheet_fields() -> list[dict[str, Any]]:
+    """
+    List available fields in the NDAQ/BS table with descriptions.
+
+    Returns:
+        List of dictionaries containing field name, description, and type
+    """
+    return BALANCE_SHEET_SCHEMA.to_dicts()
@@ -0,0 +1,60 @@
+from collections.abc import Iterable
+from typing import Any
+
+import pandas as pd
+
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import column_params
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+
+
+def fetch_batch(
+    datatable_code: str,
+    description: str,
+    symbols: str | Iterable[str] | None = None,
+    figis: str | Iterable[str] | None = None,
+    columns: list[str] | None = None,
+    schema: TableSchema | None = None,
+    **params: Any,
+) -> pd.DataFrame | str:
+    """
+    Fetch an Equities 360 table for many symbols and/or FIGIs.
+
+    Args:
+        datatable_code: Datatable code (e.g., 'NDAQ/BS')
+        description: Name of the data used in error messages
+        symbols: Stock ticker symbols, as a list or comma-separated string
+        figis: Bloomberg FIGI identifiers, as a list or comma-separated string
+        columns: Optional list of columns to return (qopts.columns)
+        schema: The table's schema, used to validate columns
+        **params: Further filters such as calendardate or dimension
+
+    Returns:
+        One DataFrame covering every requested company or error message
+    """
+    if not symbols and not figis:
+        return "Error: Either symbols or figis must be provided."
+
+    try:
+        params = {key: value for key, value in params.items() if value}
+        params.update(column_params(columns, schema))
+        frames = []
+        for filter_name, values in (("symbol", symbols), ("figi", figis)):
+            if values:
+                frames.append(
+                    client.get_table_batch(
+                        datatable_code, filter_name, values, **params
+                    )
+                )
+
+        data = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        if len(frames) > 1:
+            # Companies requested by both symbol and FIGI appear twice
+            data = data.drop_duplicates(ignore_index=True)
+
+        if data.empty:
+            return "No data found for the specified criteria."
+
+        return data
+    except Exception as e:
+        return f"Error fetching {description}: {e!s}"
@@ -1,14 +1,19 @@
 from typing import Any
 
-import nasdaqdatalink
 import pandas as pd
 
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import column_params
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+from nasdaq_data_link_mcp_os.resources.equities_360.batch import fetch_batch
+
 
 def get_cash_flow(
     symbol: str | None = None,
     figi: str | None = None,
     calendardate: str | None = None,
     dimension: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame | str:
     """
     Fetch cash flow statement data from Nasdaq Data Link E360 NDAQ/CF table.
@@ -18,6 +23,7 @@ def get_cash_flow(
         figi: Bloomberg FIGI identifier (e.g., 'BBG000BPH459')
         calendardate: Calendar date in YYYY-MM-DD format
         dimension: MRQ (Quarterly), MRY (Annual), or MRT (Trailing-twelve-months)
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
         DataFrame containing cash flow statement data or error message
@@ -36,8 +42,10 @@ def get_cash_flow(
         if dimension:
             params["dimension"] = dimension
 
+        params.update(column_params(columns, CASH_FLOW_SCHEMA))
+
         # Fetch data from NDAQ/CF table
-        data = nasdaqdatalink.get_table("NDAQ/CF", **params)
+        data = client.get_table("NDAQ/CF", **params)
 
         if data.empty:
             return "No data found for the specified criteria."
@@ -47,14 +55,41 @@ def get_cash_flow(
         return f"Error fetching cash flow statement data: {e!s}"
 
 
-def list_available_cash_flow_fields() -> list[dict[str, Any]]:
+def get_cash_flow_batch(
+    symbols: list[str] | str | None = None,
+    figis: list[str] | str | None = None,
+    calendardate: str | None = None,
+    dimension: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | str:
     """
-    List available fields in the NDAQ/CF table with descriptions.
+    Fetch NDAQ/CF rows for many companies in a few concurrent requests.
+
+    Args:
+        symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT'] or 'AAPL,MSFT')
+        figis: Bloomberg FIGI identifiers
+        calendardate: Calendar date in YYYY-MM-DD format
+        dimension: MRQ (Quarterly), MRY (Annual), or MRT (Trailing-twelve-months)
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
-        List of dictionaries containing field name, description, and type
+        DataFrame containing cash flow statement data for all companies or error message
     """
-    fields = [
+    return fetch_batch(
+        "NDAQ/CF",
+        "cash flow statement data",
+        symbols,
+        figis,
+        calendardate=calendardate,
+        dimension=dimension,
+        columns=columns,
+        schema=CASH_FLOW_SCHEMA,
+    )
+
+
+CASH_FLOW_SCHEMA = TableSchema.from_dicts(
+    "NDAQ/CF",
+    [
         {
             "name": "calendardate",
             "description": "The Calendar Date represents the normalized reportperiod",
@@ -149,5 +184,15 @@ def list_available_cash_flow_fields() -> list[dict[str, Any]]:
             "description": "Net cash flow from debt issuance/repayment",
             "type": "BigInt",
         },
-    ]
-    return fields
+    ],
+)
+
+
+def list_available_cash_flow_fields() -> list[dict[str, Any]]:
+    """
+    List available fields in the NDAQ/CF table with descriptions.
+
+    Returns:
+        List of dictionaries containing field name, description, and type
+    """
+    return CASH_FLOW_SCHEMA.to_dicts()
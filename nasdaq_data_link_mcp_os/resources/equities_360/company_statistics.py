@@ -1,9 +1,15 @@
-import nasdaqdatalink
 import pandas as pd
 
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import column_params
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+from nasdaq_data_link_mcp_os.resources.equities_360.batch import fetch_batch
+
 
 def get_company_stats(
-    symbol: str | None = None, figi: str | None = None
+    symbol: str | None = None,
+    figi: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame | str:
     """
     Fetch company statistics from Nasdaq Data Link E360 NDAQ/STAT table.
@@ -11,6 +17,7 @@ def get_company_stats(
     Args:
         symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
         figi: Bloomberg FIGI identifier (e.g., 'BBG000BPH459')
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
         DataFrame containing company statistics or error message
@@ -25,8 +32,10 @@ def get_company_stats(
         if figi:
             params["figi"] = figi
 
+        params.update(column_params(columns, COMPANY_STATS_SCHEMA))
+
         # Fetch data from NDAQ/STAT table
-        data = nasdaqdatalink.get_table("NDAQ/STAT", **params)
+        data = client.get_table("NDAQ/STAT", **params)
 
         if data.empty:
             return "No data found for the specified criteria."
@@ -36,14 +45,35 @@ def get_company_stats(
         return f"Error fetching company statistics: {e!s}"
 
 
-def list_available_fields() -> list[dict[str, str]]:
+def get_company_stats_batch(
+    symbols: list[str] | str | None = None,
+    figis: list[str] | str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | str:
     """
-    List available fields in the NDAQ/STAT table with descriptions.
+    Fetch NDAQ/STAT rows for many companies in a few concurrent requests.
+
+    Args:
+        symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT'] or 'AAPL,MSFT')
+        figis: Bloomberg FIGI identifiers
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
-        List of dictionaries containing field name and description
+        DataFrame containing company statistics for all companies or error message
     """
-    fields = [
+    return fetch_batch(
+        "NDAQ/STAT",
+        "company statistics",
+        symbols,
+        figis,
+        columns=columns,
+        schema=COMPANY_STATS_SCHEMA,
+    )
+
+
+COMPANY_STATS_SCHEMA = TableSchema.from_dicts(
+    "NDAQ/STAT",
+    [
         {"name": "symbol", "description": "Symbol of the company"},
         {"name": "figi", "description": "Unique Identifier given by Bloomberg"},
         {
@@ -144,5 +174,15 @@ def list_available_fields() -> list[dict[str, str]]:
                 "The free float percentage of shares available for trading (0-1)"
             ),
         },
-    ]
-    return fields
+    ],
+)
+
+
+def list_available_fields() -> list[dict[str, str]]:
+    """
+    List available fields in the NDAQ/STAT table with descriptions.
+
+    Returns:
+        List of dictionaries containing field name and description
+    """
+    return COMPANY_STATS_SCHEMA.to_dicts()
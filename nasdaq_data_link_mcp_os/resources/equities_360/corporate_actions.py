@@ -1,14 +1,18 @@
 from typing import Any
 
-import nasdaqdatalink
 import pandas as pd
 
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import column_params
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+
 
 def get_corporate_actions(
     symbol: str | None = None,
     figi: str | None = None,
     date: str | None = None,
     action: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame | str:
     """
     Fetch corporate actions data from Nasdaq Data Link E360 NDAQ/CA table.
@@ -18,6 +22,7 @@ def get_corporate_actions(
         figi: Bloomberg FIGI identifier (e.g., 'BBG000BPH459')
         date: Date of the corporate action in YYYY-MM-DD format
         action: Type of corporate action (e.g., 'split', 'merger')
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
         DataFrame containing corporate actions data or error message
@@ -33,8 +38,10 @@ def get_corporate_actions(
         if action:
             params["action"] = action
 
+        params.update(column_params(columns, CORPORATE_ACTIONS_SCHEMA))
+
         # Fetch data from NDAQ/CA table
-        data = nasdaqdatalink.get_table("NDAQ/CA", **params)
+        data = client.get_table("NDAQ/CA", **params)
 
         if data.empty:
             return "No corporate action data found for the specified criteria."
@@ -44,14 +51,9 @@ def get_corporate_actions(
         return f"Error fetching corporate actions data: {e!s}"
 
 
-def list_available_corporate_action_fields() -> list[dict[str, Any]]:
-    """
-    List available fields in the NDAQ/CA table with descriptions.
-
-    Returns:
-        List of dictionaries containing field name, description, and type
-    """
-    fields = [
+CORPORATE_ACTIONS_SCHEMA = TableSchema.from_dicts(
+    "NDAQ/CA",
+    [
         {
             "name": "date",
             "description": "The date of the corporate action",
@@ -95,5 +97,15 @@ def list_available_corporate_action_fields() -> list[dict[str, Any]]:
             "type": "String",
             "primary_key": True,
         },
-    ]
-    return fields
+    ],
+)
+
+
+def list_available_corporate_action_fields() -> list[dict[str, Any]]:
+    """
+    List available fields in the NDAQ/CA table with descriptions.
+
+    Returns:
+        List of dictionaries containing field name, description, and type
+    """
+    return CORPORATE_ACTIONS_SCHEMA.to_dicts()
@@ -1,14 +1,19 @@
 from typing import Any
 
-import nasdaqdatalink
 import pandas as pd
 
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import column_params
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+from nasdaq_data_link_mcp_os.resources.equities_360.batch import fetch_batch
+
 
 def get_fundamental_details(
     symbol: str | None = None,
     figi: str | None = None,
     calendardate: str | None = None,
     dimension: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame | str:
     """
     Fetch detailed fundamental data from Nasdaq Data Link E360 NDAQ/FD table.
@@ -18,6 +23,7 @@ def get_fundamental_details(
         figi: Bloomberg FIGI identifier (e.g., 'BBG000BPH459')
         calendardate: Calendar date in YYYY-MM-DD format
         dimension: MRQ (Quarterly), MRY (Annual), or MRT (Trailing-twelve-months)
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
         DataFrame containing detailed fundamental data or error message
@@ -36,8 +42,10 @@ def get_fundamental_details(
         if dimension:
             params["dimension"] = dimension
 
+        params.update(column_params(columns, FUNDAMENTAL_DETAILS_SCHEMA))
+
         # Fetch data from NDAQ/FD table
-        data = nasdaqdatalink.get_table("NDAQ/FD", **params)
+        data = client.get_table("NDAQ/FD", **params)
 
         if data.empty:
             return "No data found for the specified criteria."
@@ -47,14 +55,41 @@ def get_fundamental_details(
         return f"Error fetching fundamental details: {e!s}"
 
 
-def list_available_detail_fields() -> list[dict[str, Any]]:
+def get_fundamental_details_batch(
+    symbols: list[str] | str | None = None,
+    figis: list[str] | str | None = None,
+    calendardate: str | None = None,
+    dimension: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | str:
     """
-    List available fields in the NDAQ/FD table with descriptions.
+    Fetch NDAQ/FD rows for many companies in a few concurrent requests.
+
+    Args:
+        symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT'] or 'AAPL,MSFT')
+        figis: Bloomberg FIGI identifiers
+        calendardate: Calendar date in YYYY-MM-DD format
+        dimension: MRQ (Quarterly), MRY (Annual), or MRT (Trailing-twelve-months)
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
-        List of dictionaries containing field name, description, and type
+        DataFrame containing fundamental details for all companies or error message
     """
-    fields = [
+    return fetch_batch(
+        "NDAQ/FD",
+        "fundamental details",
+        symbols,
+        figis,
+        calendardate=calendardate,
+        dimension=dimension,
+        columns=columns,
+        schema=FUNDAMENTAL_DETAILS_SCHEMA,
+    )
+
+
+FUNDAMENTAL_DETAILS_SCHEMA = TableSchema.from_dicts(
+    "NDAQ/FD",
+    [
         {
             "name": "calendardate",
             "description": "The Calendar Date represents the normalized reportperiod",
@@ -428,5 +463,15 @@ def list_available_detail_fields() -> list[dict[str, Any]]:
             "description": "Basic shares outstanding after stock splits",
             "type": "BigInt",
         },
-    ]
-    return fields
+    ],
+)
+
+
+def list_available_detail_fields() -> list[dict[str, Any]]:
+    """
+    List available fields in the NDAQ/FD table with descriptions.
+
+    Returns:
+        List of dictionaries containing field name, description, and type
+    """
+    return FUNDAMENTAL_DETAILS_SCHEMA.to_dicts()
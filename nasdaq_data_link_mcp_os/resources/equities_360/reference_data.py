@@ -1,11 +1,16 @@
 from typing import Any
 
-import nasdaqdatalink
 import pandas as pd
 
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import column_params
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+
 
 def get_reference_data(
-    symbol: str | None = None, figi: str | None = None
+    symbol: str | None = None,
+    figi: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame | str:
     """
     Fetch reference data from Nasdaq Data Link E360 NDAQ/RD table.
@@ -13,6 +18,7 @@ def get_reference_data(
     Args:
         symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
         figi: Bloomberg FIGI identifier (e.g., 'BBG000BPH459')
+        columns: Optional list of columns to return (qopts.columns)
 
     Returns:
         DataFrame containing reference data or error message
@@ -24,8 +30,10 @@ def get_reference_data(
         if figi:
             params["figi"] = figi
 
+        params.update(column_params(columns, REFERENCE_SCHEMA))
+
         # Fetch data from NDAQ/RD table
-        data = nasdaqdatalink.get_table("NDAQ/RD", **params)
+        data = client.get_table("NDAQ/RD", **params)
 
         if data.empty:
             return "No reference data found for the specified criteria."
@@ -35,14 +43,9 @@ def get_reference_data(
         return f"Error fetching reference data: {e!s}"
 
 
-def list_available_reference_fields() -> list[dict[str, Any]]:
-    """
-    List available fields in the NDAQ/RD table with descriptions.
-
-    Returns:
-        List of dictionaries containing field name, description, and type
-    """
-    fields = [
+REFERENCE_SCHEMA = TableSchema.from_dicts(
+    "NDAQ/RD",
+    [
         {
             "name": "symbol",
             "description": "Symbol of the company",
@@ -120,5 +123,15 @@ def list_available_reference_fields() -> list[dict[str, Any]]:
             "description": "Company location as registered with the SEC",
             "type": "String",
         },
-    ]
-    return fields
+    ],
+)
+
+
+def list_available_reference_fields() -> list[dict[str, Any]]:
+    """
+    List available fields in the NDAQ/RD table with descriptions.
+
+    Returns:
+        List of dictionaries containing field name, description, and type
+    """
+    return REFERENCE_SCHEMA.to_dicts()
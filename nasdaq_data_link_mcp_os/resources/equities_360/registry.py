@@ -0,0 +1,43 @@
+from types import MappingProxyType
+
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+from nasdaq_data_link_mcp_os.resources.equities_360.balance_sheet import (
+    BALANCE_SHEET_SCHEMA,
+)
+from nasdaq_data_link_mcp_os.resources.equities_360.cash_flow import CASH_FLOW_SCHEMA
+from nasdaq_data_link_mcp_os.resources.equities_360.company_statistics import (
+    COMPANY_STATS_SCHEMA,
+)
+from nasdaq_data_link_mcp_os.resources.equities_360.corporate_actions import (
+    CORPORATE_ACTIONS_SCHEMA,
+)
+from nasdaq_data_link_mcp_os.resources.equities_360.fundamental_details import (
+    FUNDAMENTAL_DETAILS_SCHEMA,
+)
+from nasdaq_data_link_mcp_os.resources.equities_360.fundamentals import (
+    FUNDAMENTALS_SCHEMA,
+)
+from nasdaq_data_link_mcp_os.resources.equities_360.reference_data import (
+    REFERENCE_SCHEMA,
+)
+
+# Read-only registry of the Equities 360 table schemas keyed by datatable code
+SCHEMAS: MappingProxyType[str, TableSchema] = MappingProxyType(
+    {
+        schema.code: schema
+        for schema in (
+            FUNDAMENTALS_SCHEMA,
+            BALANCE_SHEET_SCHEMA,
+            CASH_FLOW_SCHEMA,
+            FUNDAMENTAL_DETAILS_SCHEMA,
+            COMPANY_STATS_SCHEMA,
+            REFERENCE_SCHEMA,
+            CORPORATE_ACTIONS_SCHEMA,
+        )
+    }
+)
+
+
+def get_schema(datatable_code: str) -> TableSchema | None:
+    """Return the schema registered for a datatable code, or None."""
+    return SCHEMAS.get(datatable_code.strip().upper())
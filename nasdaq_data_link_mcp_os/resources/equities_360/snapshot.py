@@ -0,0 +1,157 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pandas as pd
+
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.schema import TableSchema
+from nasdaq_data_link_mcp_os.resources.equities_360.registry import SCHEMAS
+
+# Tables reported per period, aligned on SNAPSHOT_KEYS
+PERIOD_TABLES: dict[str, TableSchema] = {
+    code: SCHEMAS[code] for code in ("NDAQ/FS", "NDAQ/BS", "NDAQ/CF")
+}
+# Tables with one row per company, joined on symbol
+COMPANY_TABLES: dict[str, TableSchema] = {
+    code: SCHEMAS[code] for code in ("NDAQ/STAT", "NDAQ/RD")
+}
+SNAPSHOT_KEYS = ["symbol", "calendardate", "dimension"]
+
+
+def _plan_requests(
+    columns: list[str] | None, base: dict[str, Any], period: dict[str, Any]
+) -> dict[str, dict[str, Any]]:
+    """
+    Build the request parameters for each table that contributes columns.
+
+    With a projection, each table is only asked for the requested columns it
+    documents (plus its join keys) and tables without any are skipped. A
+    projection of join keys only is answered from the first period table.
+    """
+    requests: dict[str, dict[str, Any]] = {}
+    for tables, keys, params in (
+        (PERIOD_TABLES, SNAPSHOT_KEYS, {**base, **period}),
+        (COMPANY_TABLES, ["symbol"], base),
+    ):
+        for code, schema in tables.items():
+            if not columns:
+                requests[code] = dict(params)
+                continue
+            wanted = [c for c in columns if c in schema and c not in keys]
+            if wanted:
+                requests[code] = {
+                    **params,
+                    "qopts.columns": ",".join([*keys, *wanted]),
+                }
+    if not requests:
+        code = next(iter(PERIOD_TABLES))
+        requests[code] = {
+            **base,
+            **period,
+            "qopts.columns": ",".join(SNAPSHOT_KEYS),
+        }
+    return requests
+
+
+def _combine(
+    frames: dict[str, pd.DataFrame],
+    keys: list[str],
+    tables: dict[str, TableSchema],
+) -> pd.DataFrame | None:
+    """Align the frames of one table group on keys, first table wins on overlap."""
+    aligned = []
+    seen: set[str] = set()
+    for code in tables:
+        frame = frames.get(code)
+        if frame is None or frame.empty:
+            continue
+        frame = frame.set_index(keys)
+        frame = frame.loc[~frame.index.duplicated(keep="last")]
+        frame = frame.drop(columns=[c for c in frame.columns if c in seen])
+        seen.update(frame.columns)
+        aligned.append(frame)
+    if not aligned:
+        return None
+    return pd.concat(aligned, axis=1, join="outer") if len(aligned) > 1 else aligned[0]
+
+
+def get_company_snapshot(
+    symbol: str | None = None,
+    figi: str | None = None,
+    calendardate: str | None = None,
+    dimension: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | str:
+    """
+    Fetch a wide company view from NDAQ/FS, BS, CF, STAT and RD in one fan-out.
+
+    The five tables are requested concurrently. Fundamentals, balance sheet and
+    cash flow rows are aligned on (symbol, calendardate, dimension) and the
+    company statistics and reference data are joined on symbol. Tables that
+    fail are left out and listed in the result's attrs["failed_tables"].
+
+    Args:
+        symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
+        figi: Bloomberg FIGI identifier (e.g., 'BBG000BPH459')
+        calendardate: Calendar date in YYYY-MM-DD format
+        dimension: MRQ (Quarterly), MRY (Annual), or MRT (Trailing-twelve-months)
+        columns: Optional list of fields to return besides the join keys
+
+    Returns:
+        DataFrame with one row per (symbol, calendardate, dimension) or error
+        message
+    """
+    if not symbol and not figi:
+        return "Error: Either symbol or figi must be provided."
+
+    base = {key: value for key, value in (("symbol", symbol), ("figi", figi)) if value}
+    period = {
+        key: value
+        for key, value in (("calendardate", calendardate), ("dimension", dimension))
+        if value
+    }
+
+    if columns:
+        schemas = (*PERIOD_TABLES.values(), *COMPANY_TABLES.values())
+        unknown = [c for c in columns if not any(c in s for s in schemas)]
+        if unknown:
+            return f"Error: Unknown snapshot columns: {', '.join(unknown)}"
+
+    requests = _plan_requests(columns, base, period)
+
+    def fetch(code: str) -> pd.DataFrame | Exception:
+        try:
+            return client.get_table(code, **requests[code])
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, len(requests))) as pool:
+        results = dict(zip(requests, pool.map(fetch, requests), strict=True))
+
+    failed = {code: r for code, r in results.items() if isinstance(r, Exception)}
+    if len(failed) == len(results):
+        errors = "; ".join(f"{code}: {e!s}" for code, e in failed.items())
+        return f"Error fetching company snapshot: {errors}"
+    frames = {code: r for code, r in results.items() if code not in failed}
+
+    periods = _combine(frames, SNAPSHOT_KEYS, PERIOD_TABLES)
+    company = _combine(frames, ["symbol"], COMPANY_TABLES)
+    if periods is None and company is None:
+        return "No data found for the specified criteria."
+
+    if periods is None:
+        data = company.reset_index()
+    elif company is None:
+        data = periods.reset_index()
+    else:
+        company = company.drop(columns=[c for c in company.columns if c in periods])
+        data = periods.reset_index().merge(
+            company, left_on="symbol", right_index=True, how="left"
+        )
+
+    if columns:
+        keys = [key for key in SNAPSHOT_KEYS if key in data.columns]
+        data = data[keys + [c for c in columns if c in data.columns and c not in keys]]
+
+    data.attrs["failed_tables"] = sorted(failed)
+    return data
@@ -1,11 +1,16 @@
-import nasdaqdatalink
+from collections.abc import Iterator
+
 import pandas as pd
 
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import column_params
+
 
 def get_mfrfm_data(
     fund_id: str | None = None,
     name: str | None = None,
     investment_company_type: str | None = None,
+    columns: list[str] | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
@@ -17,6 +22,7 @@ def get_mfrfm_data(
         investment_company_type: Optional investment company type (
             N-1A for Open-Ended mutual funds, N-2 for Closed-End funds
         )
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -33,9 +39,10 @@ def get_mfrfm_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRFM table
-        df = nasdaqdatalink.get_table("NFN/MFRFM", **params)
+        df = client.get_table("NFN/MFRFM", **params)
 
         if df.empty:
             return "No fund data found for the specified parameters."
@@ -48,6 +55,7 @@ def get_mfrfi_data(
     fund_id: str | None = None,
     name: str | None = None,
     investment_company_type: str | None = None,
+    columns: list[str] | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
@@ -59,6 +67,7 @@ def get_mfrfi_data(
         investment_company_type: Optional investment company type (
             N-1A for Open-Ended mutual funds, N-2 for Closed-End funds
         )
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -75,9 +84,10 @@ def get_mfrfi_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRFI table
-        df = nasdaqdatalink.get_table("NFN/MFRFI", **params)
+        df = client.get_table("NFN/MFRFI", **params)
 
         if df.empty:
             return "No fund data found for the specified parameters."
@@ -87,7 +97,10 @@ def get_mfrfi_data(
 
 
 def get_mfrsm_data(
-    fund_id: str | None = None, name: str | None = None, **kwargs
+    fund_id: str | None = None,
+    name: str | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Fetch Fund Share Class Master (NFN/MFRSM) data with optional filtering parameters.
@@ -95,6 +108,7 @@ def get_mfrsm_data(
     Args:
         fund_id: Optional unique fund identifier
         name: Optional fund name
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -109,9 +123,10 @@ def get_mfrsm_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRSM table
-        df = nasdaqdatalink.get_table("NFN/MFRSM", **params)
+        df = client.get_table("NFN/MFRSM", **params)
 
         if df.empty:
             return "No fund share class data found for the specified parameters."
@@ -121,7 +136,10 @@ def get_mfrsm_data(
 
 
 def get_mfrsi_data(
-    fund_id: str | None = None, ticker: str | None = None, **kwargs
+    fund_id: str | None = None,
+    ticker: str | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Fetch Fund Share Class Information (NFN/MFRSI) data with optional
@@ -130,6 +148,7 @@ def get_mfrsi_data(
     Args:
         fund_id: Optional unique fund identifier
         ticker: Optional ticker symbol
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -144,9 +163,10 @@ def get_mfrsi_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRSI table
-        df = nasdaqdatalink.get_table("NFN/MFRSI", **params)
+        df = client.get_table("NFN/MFRSI", **params)
 
         if df.empty:
             return "No fund share class information found for the specified parameters."
@@ -160,6 +180,7 @@ def get_mfrph_data(
     ticker: str | None = None,
     start_date: str | None = None,
     end_date: str | None = None,
+    columns: list[str] | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
@@ -170,6 +191,7 @@ def get_mfrph_data(
         ticker: Optional ticker symbol
         start_date: Optional start date for price history (YYYY-MM-DD format)
         end_date: Optional end date for price history (YYYY-MM-DD format)
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -188,9 +210,10 @@ def get_mfrph_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRPH table
-        df = nasdaqdatalink.get_table("NFN/MFRPH", **params)
+        df = client.get_table("NFN/MFRPH", **params)
 
         if df.empty:
             return "No fund price history found for the specified parameters."
@@ -199,11 +222,51 @@ def get_mfrph_data(
         return f"Error fetching fund price history: {e!s}"
 
 
+def iter_mfrph_data(
+    fund_id: str | None = None,
+    ticker: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    max_rows: int | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream Fund Price History (NFN/MFRPH) data one page at a time.
+
+    Args:
+        fund_id: Optional unique fund identifier
+        ticker: Optional ticker symbol
+        start_date: Optional start date for price history (YYYY-MM-DD format)
+        end_date: Optional end date for price history (YYYY-MM-DD format)
+        max_rows: Optional cap on the total number of rows yielded
+        columns: Optional list of columns to return (qopts.columns)
+        **kwargs: Additional filtering parameters to pass to the API
+
+    Yields:
+        DataFrames with consecutive chunks of Fund Price History data
+    """
+    params = {}
+    if fund_id:
+        params["fund_id"] = fund_id
+    if ticker:
+        params["ticker"] = ticker
+    if start_date:
+        params["date.gte"] = start_date
+    if end_date:
+        params["date.lte"] = end_date
+    params.update(kwargs)
+    params.update(column_params(columns))
+
+    yield from client.iter_table("NFN/MFRPH", max_rows=max_rows, **params)
+
+
 def get_mfrph10_data(
     fund_id: str | None = None,
     ticker: str | None = None,
     start_date: str | None = None,
     end_date: str | None = None,
+    columns: list[str] | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
@@ -215,6 +278,7 @@ def get_mfrph10_data(
         ticker: Optional ticker symbol
         start_date: Optional start date for price history (YYYY-MM-DD format)
         end_date: Optional end date for price history (YYYY-MM-DD format)
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -233,9 +297,10 @@ def get_mfrph10_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRPH10 table
-        df = nasdaqdatalink.get_table("NFN/MFRPH10", **params)
+        df = client.get_table("NFN/MFRPH10", **params)
 
         if df.empty:
             return "No 10-day fund price history found for the specified parameters."
@@ -245,7 +310,10 @@ def get_mfrph10_data(
 
 
 def get_mfrps_data(
-    fund_id: str | None = None, ticker: str | None = None, **kwargs
+    fund_id: str | None = None,
+    ticker: str | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Fetch Fund Performance Statistics (NFN/MFRPS) data with optional
@@ -254,6 +322,7 @@ def get_mfrps_data(
     Args:
         fund_id: Optional unique fund identifier
         ticker: Optional ticker symbol
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -268,9 +337,10 @@ def get_mfrps_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRPS table
-        df = nasdaqdatalink.get_table("NFN/MFRPS", **params)
+        df = client.get_table("NFN/MFRPS", **params)
 
         if df.empty:
             return "No fund performance statistics found for the specified parameters."
@@ -280,7 +350,10 @@ def get_mfrps_data(
 
 
 def get_mfrprb_data(
-    fund_id: str | None = None, ticker: str | None = None, **kwargs
+    fund_id: str | None = None,
+    ticker: str | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Fetch Fund Performance Benchmark (NFN/MFRPRB) data with optional
@@ -289,6 +362,7 @@ def get_mfrprb_data(
     Args:
         fund_id: Optional unique fund identifier
         ticker: Optional ticker symbol
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -303,9 +377,10 @@ def get_mfrprb_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRPRB table
-        df = nasdaqdatalink.get_table("NFN/MFRPRB", **params)
+        df = client.get_table("NFN/MFRPRB", **params)
 
         if df.empty:
             return (
@@ -317,7 +392,10 @@ def get_mfrprb_data(
 
 
 def get_mfrpa_data(
-    fund_id: str | None = None, ticker: str | None = None, **kwargs
+    fund_id: str | None = None,
+    ticker: str | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Fetch Fund Performance Analytics (NFN/MFRPA) data with optional
@@ -326,6 +404,7 @@ def get_mfrpa_data(
     Args:
         fund_id: Optional unique fund identifier
         ticker: Optional ticker symbol
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -340,9 +419,10 @@ def get_mfrpa_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRPA table
-        df = nasdaqdatalink.get_table("NFN/MFRPA", **params)
+        df = client.get_table("NFN/MFRPA", **params)
 
         if df.empty:
             return "No fund performance analytics found for the specified parameters."
@@ -352,7 +432,10 @@ def get_mfrpa_data(
 
 
 def get_mfrpm_data(
-    fund_id: str | None = None, ticker: str | None = None, **kwargs
+    fund_id: str | None = None,
+    ticker: str | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Fetch Fund Fee and Expense Data (NFN/MFRPM) with optional filtering parameters.
@@ -360,6 +443,7 @@ def get_mfrpm_data(
     Args:
         fund_id: Optional unique fund identifier
         ticker: Optional ticker symbol
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -374,9 +458,10 @@ def get_mfrpm_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRPM table
-        df = nasdaqdatalink.get_table("NFN/MFRPM", **params)
+        df = client.get_table("NFN/MFRPM", **params)
 
         if df.empty:
             return "No fund fee and expense data found for the specified parameters."
@@ -386,7 +471,10 @@ def get_mfrpm_data(
 
 
 def get_mfrmf_data(
-    fund_id: str | None = None, ticker: str | None = None, **kwargs
+    fund_id: str | None = None,
+    ticker: str | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Fetch Fund Monthly Flows (NFN/MFRMF) data with optional filtering parameters.
@@ -394,6 +482,7 @@ def get_mfrmf_data(
     Args:
         fund_id: Optional unique fund identifier
         ticker: Optional ticker symbol
+        columns: Optional list of columns to return (qopts.columns)
         **kwargs: Additional filtering parameters to pass to the API
 
     Returns:
@@ -408,9 +497,10 @@ def get_mfrmf_data(
 
         # Add additional parameters from kwargs
         params.update(kwargs)
+        params.update(column_params(columns))
 
         # Fetch data from NFN/MFRMF table
-        df = nasdaqdatalink.get_table("NFN/MFRMF", **params)
+        df = client.get_table("NFN/MFRMF", **params)
 
         if df.empty:
             return "No fund monthly flows found for the specified parameters."
@@ -1,7 +1,155 @@
-import nasdaqdatalink
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
+import pandas as pd
 
-def get_rtat10_data(dates: str, tickers: str | None = None):
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.columns import chunk_values, split_values
+
+# Dates per request in parallel mode. One date per request lets every day be
+# cached, retried and reported on its own.
+DATE_CHUNK_SIZE = int(os.getenv("NASDAQ_DATA_LINK_RTAT_DATE_CHUNK_SIZE", "1"))
+
+
+def fetch_chunks(
+    datatable_code: str,
+    dates: str | Iterable[str],
+    tickers: str | Iterable[str] | None = None,
+    date_chunk_size: int | None = None,
+    ticker_chunk_size: int | None = None,
+) -> pd.DataFrame:
+    """
+    Fetch a date/ticker table as concurrent chunks and merge the results.
+
+    Dates and tickers are split into chunks of at most date_chunk_size and
+    ticker_chunk_size values. Chunks already in the response cache are not
+    requested again; the rest run on up to client.BATCH_WORKERS threads,
+    each reading every page. A failing chunk does not fail the others.
+
+    Cached chunks expire with the NDAQ/RTAT TTL, which is the 900 second
+    default unless NASDAQ_DATA_LINK_CACHE_TTLS sets one, so past days are
+    fetched again after 15 minutes by default.
+
+    Args:
+        datatable_code: 'NDAQ/RTAT' or 'NDAQ/RTAT10'
+        dates: Dates as a list or a comma-separated string
+        tickers: Optional tickers as a list or a comma-separated string
+        date_chunk_size: Dates per request (default: DATE_CHUNK_SIZE)
+        ticker_chunk_size: Tickers per request (default: client.BATCH_CHUNK_SIZE)
+
+    Returns:
+        The merged DataFrame, in chunk order. frame.attrs["chunks"] reports
+        every chunk (dates, tickers, status 'cached', 'fetched' or 'failed',
+        rows, error) and frame.attrs["failed_chunks"] the failed ones.
+
+    Raises:
+        RuntimeError: If every chunk failed
+    """
+    date_values = split_values(dates)
+    if not date_values:
+        raise ValueError("No dates provided")
+    ticker_values = split_values(tickers)
+    ticker_chunks: list[list[str] | None] = (
+        list(chunk_values(ticker_values, ticker_chunk_size or client.BATCH_CHUNK_SIZE))
+        if ticker_values
+        else [None]
+    )
+    chunks = [
+        (date_chunk, ticker_chunk)
+        for date_chunk in chunk_values(date_values, date_chunk_size or DATE_CHUNK_SIZE)
+        for ticker_chunk in ticker_chunks
+    ]
+
+    def params_for(position: int) -> dict[str, Any]:
+        date_chunk, ticker_chunk = chunks[position]
+        params = {"date": ",".join(date_chunk)}
+        if ticker_chunk:
+            params["ticker"] = ",".join(ticker_chunk)
+        return params
+
+    frames: list[pd.DataFrame | None] = [None] * len(chunks)
+    report: list[dict[str, Any]] = [
+        {"dates": dates, "tickers": tickers, "status": "pending", "rows": 0}
+        for dates, tickers in chunks
+    ]
+    pending = []
+    for position in range(len(chunks)):
+        cached = client.cached_table(
+            datatable_code, paginate=True, **params_for(position)
+        )
+        if cached is None:
+            pending.append(position)
+        else:
+            frames[position] = cached
+            report[position].update(status="cached", rows=len(cached))
+
+    if pending:
+        with ThreadPoolExecutor(
+            max_workers=min(len(pending), client.BATCH_WORKERS)
+        ) as pool:
+            futures = {
+                position: pool.submit(
+                    client.get_table,
+                    datatable_code,
+                    paginate=True,
+                    **params_for(position),
+                )
+                for position in pending
+            }
+            for position, future in futures.items():
+                try:
+                    frames[position] = future.result()
+                except Exception as e:
+                    report[position].update(status="failed", error=str(e))
+                else:
+                    report[position].update(
+                        status="fetched", rows=len(frames[position])
+                    )
+
+    failed = [chunk for chunk in report if chunk["status"] == "failed"]
+    if len(failed) == len(chunks):
+        raise RuntimeError(
+            f"All {len(chunks)} chunks failed; first error: {failed[0]['error']}"
+        )
+    results = [frame for frame in frames if frame is not None]
+    non_empty = [frame for frame in results if not frame.empty] or results[:1]
+    merged = (
+        pd.concat(non_empty, ignore_index=True) if len(non_empty) > 1 else non_empty[0]
+    )
+    merged.attrs["chunks"] = report
+    merged.attrs["failed_chunks"] = failed
+    return merged
+
+
+def _get_table(
+    datatable_code: str,
+    dates: str,
+    tickers: str | None,
+    paginate: bool,
+    max_rows: int | None,
+    parallel: bool,
+) -> pd.DataFrame:
+    if parallel:
+        df = fetch_chunks(datatable_code, dates, tickers)
+        return df.head(max_rows) if max_rows is not None else df
+
+    params = {"date": dates}
+    if tickers:
+        params["ticker"] = tickers
+    return client.get_table(
+        datatable_code, paginate=paginate, max_rows=max_rows, **params
+    )
+
+
+def get_rtat10_data(
+    dates: str,
+    tickers: str | None = None,
+    paginate: bool = False,
+    max_rows: int | None = None,
+    parallel: bool = False,
+):
     """
     Fetch Retail Trading Activity Tracker 10 (RTAT10) data for specific dates
     and tickers.
@@ -9,16 +157,17 @@ def get_rtat10_data(dates: str, tickers: str | None = None):
     Args:
         dates: Comma-separated list of dates in format 'YYYY-MM-DD'
         tickers: Optional comma-separated list of ticker symbols
+        paginate: Read every page instead of only the first one
+        max_rows: Optional row cap when paginating
+        parallel: Split dates and tickers into chunks fetched concurrently
+            (see fetch_chunks); failed chunks are listed in
+            df.attrs["failed_chunks"]
 
     Returns:
         DataFrame with RTAT10 data or error message
     """
     try:
-        params = {"date": dates}
-        if tickers:
-            params["ticker"] = tickers
-
-        df = nasdaqdatalink.get_table("NDAQ/RTAT10", **params)
+        df = _get_table("NDAQ/RTAT10", dates, tickers, paginate, max_rows, parallel)
 
         if df.empty:
             return "No RTAT10 data found for the specified parameters."
@@ -27,26 +176,73 @@ def get_rtat10_data(dates: str, tickers: str | None = None):
         return f"Error fetching RTAT10 data: {e!s}"
 
 
-def get_rtat_data(dates: str, tickers: str | None = None):
+def get_rtat_data(
+    dates: str,
+    tickers: str | None = None,
+    paginate: bool = False,
+    max_rows: int | None = None,
+    parallel: bool = False,
+):
     """
     Fetch Retail Trading Activity (RTAT) data for specific dates and tickers.
 
     Args:
         dates: Comma-separated list of dates in format 'YYYY-MM-DD'
         tickers: Optional comma-separated list of ticker symbols
+        paginate: Read every page instead of only the first one
+        max_rows: Optional row cap when paginating
+        parallel: Split dates and tickers into chunks fetched concurrently
+            (see fetch_chunks); failed chunks are listed in
+            df.attrs["failed_chunks"]
 
     Returns:
         DataFrame with RTAT data or error message
     """
     try:
-        params = {"date": dates}
-        if tickers:
-            params["ticker"] = tickers
-
-        df = nasdaqdatalink.get_table("NDAQ/RTAT", **params)
+        df = _get_table("NDAQ/RTAT", dates, tickers, paginate, max_rows, parallel)
 
         if df.empty:
             return "No RTAT data found for the specified parameters."
         return df
     except Exception as e:
         return f"Error fetching RTAT data: {e!s}"
+
+
+def iter_rtat10_data(
+    dates: str, tickers: str | None = None, max_rows: int | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream RTAT10 data one page at a time.
+
+    Args:
+        dates: Comma-separated list of dates in format 'YYYY-MM-DD'
+        tickers: Optional comma-separated list of ticker symbols
+        max_rows: Optional cap on the total number of rows yielded
+
+    Yields:
+        DataFrames with consecutive chunks of RTAT10 data
+    """
+    params = {"date": dates}
+    if tickers:
+        params["ticker"] = tickers
+    yield from client.iter_table("NDAQ/RTAT10", max_rows=max_rows, **params)
+
+
+def iter_rtat_data(
+    dates: str, tickers: str | None = None, max_rows: int | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream RTAT data one page at a time.
+
+    Args:
+        dates: Comma-separated list of dates in format 'YYYY-MM-DD'
+        tickers: Optional comma-separated list of ticker symbols
+        max_rows: Optional cap on the total number of rows yielded
+
+    Yields:
+        DataFrames with consecutive chunks of RTAT data
+    """
+    params = {"date": dates}
+    if tickers:
+        params["ticker"] = tickers
+    yield from client.iter_table("NDAQ/RTAT", max_rows=max_rows, **params)
@@ -1,9 +1,14 @@
+from collections.abc import Iterator
 from typing import Any
 
-import nasdaqdatalink
+import pandas as pd
 
+from nasdaq_data_link_mcp_os import client
 
-def get_trade_summary(**kwargs: dict[str, Any]):
+
+def get_trade_summary(
+    paginate: bool = False, max_rows: int | None = None, **kwargs: dict[str, Any]
+):
     """
     Fetch Trade Summary data with optional filtering parameters.
 
@@ -11,6 +16,8 @@ def get_trade_summary(**kwargs: dict[str, Any]):
     trade data including open, high, low, close, and volume for various symbols.
 
     Args:
+        paginate: Read every page instead of only the first one
+        max_rows: Optional row cap when paginating
         **kwargs: Optional filtering parameters to pass to the API:
             - symbol: Filter by symbol
             - timestamp: Filter by timestamp
@@ -21,10 +28,30 @@ def get_trade_summary(**kwargs: dict[str, Any]):
     """
     try:
         # All parameters are passed directly to the API
-        df = nasdaqdatalink.get_table("NDAQ/TS", **kwargs)
+        df = client.get_table("NDAQ/TS", paginate=paginate, max_rows=max_rows, **kwargs)
 
         if df.empty:
             return "No Trade Summary data found for the specified parameters."
         return df
     except Exception as e:
         return f"Error fetching Trade Summary data: {e!s}"
+
+
+def iter_trade_summary(
+    max_rows: int | None = None, **kwargs: dict[str, Any]
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream Trade Summary data one page at a time.
+
+    Use this for large NDAQ/TS pulls: pages are fetched lazily as the iterator
+    is consumed, and iteration stops early once max_rows rows were yielded.
+    API errors are raised rather than returned as messages.
+
+    Args:
+        max_rows: Optional cap on the total number of rows yielded
+        **kwargs: Filtering parameters as accepted by get_trade_summary
+
+    Yields:
+        DataFrames with consecutive chunks of Trade Summary data
+    """
+    yield from client.iter_table("NDAQ/TS", max_rows=max_rows, **kwargs)
@@ -1,25 +1,168 @@
-import nasdaqdatalink
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
 
+import pandas as pd
 
-# Define a function to load indicators from Nasdaq Data Link directly
-def load_indicator_metadata() -> dict[str, dict[str, str]]:
-    """Load indicator metadata from WB/METADATA dataset."""
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.common.countries import resolve_many
+from nasdaq_data_link_mcp_os.resources.world_data_bank.metadata import (
+    IndicatorMetadata,
+)
+from nasdaq_data_link_mcp_os.resources.world_data_bank.search_index import (
+    IndicatorIndex,
+)
+
+# How long the WB/METADATA table is reused before it is downloaded again.
+METADATA_TTL_SECONDS = float(os.getenv("NASDAQ_WB_METADATA_TTL", "86400"))
+# Optional JSON snapshot of the metadata so warm restarts skip the download.
+METADATA_SNAPSHOT_PATH = os.getenv("NASDAQ_WB_METADATA_SNAPSHOT")
+
+_metadata_lock = threading.Lock()
+_metadata_cache: IndicatorMetadata | None = None
+_metadata_loaded_at = 0.0
+
+_index_lock = threading.Lock()
+_index: IndicatorIndex | None = None
+_index_source: IndicatorMetadata | None = None
+_indicator_lines: list[str] = []
+
+
+def _fetch_indicator_metadata() -> IndicatorMetadata:
+    """Download the WB/METADATA table and convert it to the compact store."""
+    # Metadata has its own cache below, so skip the generic response cache
+    metadata_df = client.get_table("WB/METADATA", cache=False)
+    return IndicatorMetadata.from_frame(metadata_df)
+
+
+def _read_metadata_snapshot() -> tuple[IndicatorMetadata, float] | None:
+    """
+    Return the on-disk metadata snapshot and its age in seconds, if one exists
+    and is still fresh.
+    """
+    if not METADATA_SNAPSHOT_PATH:
+        return None
+    try:
+        with open(METADATA_SNAPSHOT_PATH, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        age = max(0.0, time.time() - float(snapshot["fetched_at"]))
+        if age > METADATA_TTL_SECONDS:
+            return None
+        metadata = IndicatorMetadata.from_dict(snapshot["metadata"])
+        return (metadata, age) if metadata else None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_metadata_snapshot(metadata: IndicatorMetadata) -> None:
+    """Persist the metadata snapshot, ignoring filesystem errors."""
+    if not METADATA_SNAPSHOT_PATH:
+        return
+    tmp_path = f"{METADATA_SNAPSHOT_PATH}.tmp"
     try:
-        metadata_df = nasdaqdatalink.get_table("WB/METADATA")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "metadata": metadata.to_dict()}, f)
+        os.replace(tmp_path, METADATA_SNAPSHOT_PATH)
+    except OSError:
+        pass
+
+
+def load_indicator_metadata(force_refresh: bool = False) -> IndicatorMetadata:
+    """
+    Load indicator metadata from WB/METADATA dataset.
 
-        # Convert DataFrame to dictionary
-        metadata_dict = {}
-        for _, row in metadata_df.iterrows():
-            series_id = row.get("series_id", "")
-            name = row.get("name", "")
-            description = row.get("description", "")
+    The table is downloaded at most once per METADATA_TTL_SECONDS and shared by
+    every caller in the process as an IndicatorMetadata mapping of series_id to
+    name and description. When NASDAQ_WB_METADATA_SNAPSHOT is set, the
+    metadata is also read from and written to that file.
+
+    Args:
+        force_refresh: Skip the in-memory cache and snapshot and download again
+    """
+    global _metadata_cache, _metadata_loaded_at
+
+    with _metadata_lock:
+        if (
+            not force_refresh
+            and _metadata_cache is not None
+            and time.monotonic() - _metadata_loaded_at < METADATA_TTL_SECONDS
+        ):
+            return _metadata_cache
 
-            if series_id:
-                metadata_dict[series_id] = {"name": name, "description": description}
+        snapshot = None if force_refresh else _read_metadata_snapshot()
+        if snapshot is not None:
+            metadata, age = snapshot
+        else:
+            try:
+                metadata = _fetch_indicator_metadata()
+            except Exception:
+                return IndicatorMetadata()
+            age = 0.0
+            _write_metadata_snapshot(metadata)
 
-        return metadata_dict
-    except Exception:
-        return {}
+        # Empty results are not cached so the next call retries the download
+        if metadata:
+            _metadata_cache = metadata
+            # A snapshot expires by the time it was fetched, not when it was read
+            _metadata_loaded_at = time.monotonic() - age
+        return metadata
+
+
+def invalidate_indicator_metadata(remove_snapshot: bool = False) -> None:
+    """
+    Drop the cached indicator metadata so the next lookup downloads it again.
+
+    Args:
+        remove_snapshot: Also delete the on-disk snapshot, if configured
+    """
+    global _metadata_cache, _metadata_loaded_at
+
+    with _metadata_lock:
+        _metadata_cache = None
+        _metadata_loaded_at = 0.0
+        if remove_snapshot and METADATA_SNAPSHOT_PATH:
+            try:
+                os.remove(METADATA_SNAPSHOT_PATH)
+            except FileNotFoundError:
+                pass
+
+
+def get_indicator_index() -> IndicatorIndex:
+    """
+    Return the full-text search index for the cached indicator metadata.
+
+    The index is rebuilt only when the underlying metadata has been reloaded.
+    """
+    global _index, _index_source, _indicator_lines
+
+    metadata = load_indicator_metadata()
+    with _index_lock:
+        if _index is None or _index_source is not metadata:
+            _index = IndicatorIndex(
+                metadata.series_ids, metadata.names, metadata.descriptions
+            )
+            _indicator_lines = [
+                f"{series_id}: {name} - {description}"
+                for series_id, name, description in zip(
+                    metadata.series_ids,
+                    metadata.names,
+                    metadata.descriptions,
+                    strict=True,
+                )
+            ]
+            _index_source = metadata
+        return _index
+
+
+def _resolve_indicator(metadata: IndicatorMetadata, indicator: str) -> str | None:
+    """Return indicator itself if it is a series_id, else the best keyword match."""
+    if indicator in metadata:
+        return indicator
+    matches = get_indicator_index().search(indicator, limit=1)
+    return matches[0][0] if matches else None
 
 
 def get_indicator_value(country: str, indicator: str) -> str:
@@ -40,22 +183,16 @@ def get_indicator_value(country: str, indicator: str) -> str:
     # Check if the indicator is a direct code or needs to be searched
     metadata = load_indicator_metadata()
 
-    # If indicator is not a direct code, try to find a match
-    if indicator not in metadata:
-        # Search for matching indicators
-        matches = search_indicators(indicator)
-
-        if not matches:
-            return (
-                f"No indicators found matching '{indicator}'. "
-                "Try a different search term."
-            )
-
-        # Use the first match's series_id
-        indicator = matches[0].split(":")[0].strip()
+    # If indicator is not a direct code, resolve it to the best ranked series_id
+    series_id = _resolve_indicator(metadata, indicator)
+    if series_id is None:
+        return (
+            f"No indicators found matching '{indicator}'. Try a different search term."
+        )
+    indicator = series_id
 
     try:
-        df = nasdaqdatalink.get_table(
+        df = client.get_table(
             "WB/DATA",
             series_id=indicator,
             country_code=country,
@@ -68,7 +205,7 @@ def get_indicator_value(country: str, indicator: str) -> str:
         df = df.sort_values("year", ascending=False)
 
         # Format the response
-        indicator_name = metadata.get(indicator, {}).get("name", indicator)
+        indicator_name = metadata.name(indicator, indicator)
         most_recent = df.iloc[0]
         return {
             "indicator": indicator,
@@ -82,29 +219,142 @@ def get_indicator_value(country: str, indicator: str) -> str:
         return f"Error fetching data for indicator '{indicator}': {e!s}"
 
 
-def search_indicators(keyword: str) -> list[str]:
+def fetch_indicator_panel(
+    country_codes: Iterable[str],
+    series_ids: Iterable[str],
+    start_year: int | None = None,
+    end_year: int | None = None,
+) -> pd.DataFrame:
+    """
+    Fetch WB/DATA for many countries and indicators in few requests.
+
+    Countries are sent in chunks as a multi-value country_code filter, each
+    request also carrying every series_id, and the rows are pivoted into a
+    (country_code, year) x series_id frame.
+
+    Args:
+        country_codes: ISO alpha-3 country codes
+        series_ids: Indicator series_ids
+        start_year: Optional first year to include
+        end_year: Optional last year to include
+
+    Returns:
+        Panel DataFrame indexed by country_code and year, one column per
+        indicator
+    """
+    params: dict[str, Any] = {"series_id": ",".join(dict.fromkeys(series_ids))}
+    if start_year is not None:
+        params["year.gte"] = start_year
+    if end_year is not None:
+        params["year.lte"] = end_year
+    rows = client.get_table_batch("WB/DATA", "country_code", country_codes, **params)
+    if rows.empty:
+        return pd.DataFrame(
+            index=pd.MultiIndex.from_arrays([[], []], names=["country_code", "year"])
+        )
+    return rows.pivot_table(
+        index=["country_code", "year"],
+        columns="series_id",
+        values="value",
+        aggfunc="last",
+    ).rename_axis(columns=None)
+
+
+def latest_values(panel: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the most recent non-null value per country and indicator.
+
+    Returns:
+        DataFrame with country_code, series_id, year and value columns
+    """
+    long = panel.stack().dropna().rename("value").reset_index()
+    long.columns = ["country_code", "year", "series_id", "value"]
+    if long.empty:
+        return long[["country_code", "series_id", "year", "value"]]
+    latest = long.loc[long.groupby(["country_code", "series_id"])["year"].idxmax()]
+    return latest[["country_code", "series_id", "year", "value"]].reset_index(drop=True)
+
+
+def get_indicator_panel(
+    countries: list[str],
+    indicators: list[str],
+    start_year: int | None = None,
+    end_year: int | None = None,
+) -> dict[str, Any] | str:
+    """
+    Fetch World Bank indicators for several countries at once.
+
+    Countries may be names or ISO codes, and indicators series_ids or
+    keywords resolved like in get_indicator_value. All combinations are
+    fetched with one WB/DATA request per chunk of countries instead of one
+    request per country and indicator.
+
+    Examples:
+    - get_indicator_panel(["Italy", "France"], ["NY.GDP.MKTP.CD", "population"])
+    - get_indicator_panel(["USA", "CHN"], ["CO2 emissions"], start_year=2000)
+
+    Returns:
+        Dictionary with the resolved countries and indicators, the latest value
+        per country and indicator, and the panel rows (country_code, year and
+        one column per indicator)
+    """
+    codes = resolve_many(countries)
+    unknown = [name for name, code in codes.items() if code is None]
+    if unknown:
+        return f"Unknown country: {', '.join(unknown)}"
+
+    metadata = load_indicator_metadata()
+    series = {
+        indicator: _resolve_indicator(metadata, indicator) for indicator in indicators
+    }
+    missing = [
+        indicator for indicator, series_id in series.items() if series_id is None
+    ]
+    if missing:
+        return (
+            f"No indicators found matching {', '.join(map(repr, missing))}. "
+            "Try a different search term."
+        )
+    series_ids = list(dict.fromkeys(series.values()))
+
+    try:
+        panel = fetch_indicator_panel(
+            codes.values(), series_ids, start_year=start_year, end_year=end_year
+        )
+    except Exception as e:
+        return f"Error fetching indicator panel: {e!s}"
+    if panel.empty:
+        return "No data found for the requested countries and indicators."
+
+    return {
+        "countries": codes,
+        "indicators": {
+            series_id: metadata.name(series_id, series_id) for series_id in series_ids
+        },
+        "latest": json.loads(latest_values(panel).to_json(orient="records")),
+        "panel": json.loads(panel.reset_index().to_json(orient="records")),
+    }
+
+
+def search_indicators(keyword: str, limit: int = 10) -> list[str]:
     """
     Search for indicator descriptions matching a given keyword.
-    Returns a list of indicators matching the keyword.
+    Returns a list of indicators matching the keyword, best match first.
+
+    Every word of the keyword must appear in the series_id, name or
+    description, either whole or as a prefix (e.g., 'emiss' finds 'emissions').
     """
+    index = get_indicator_index()
     metadata = load_indicator_metadata()
-    keyword_lower = keyword.lower()
     matches = []
 
-    for series_id, info in metadata.items():
+    for series_id, _ in index.search(keyword, limit=limit):
+        info = metadata.get(series_id, {})
         name = info.get("name", "")
         description = info.get("description", "")
+        matches.append(f"{series_id}: {name} - {description}")
 
-        # Search in both name and description
-        if (
-            keyword_lower in name.lower()
-            or keyword_lower in description.lower()
-            or keyword_lower in series_id.lower()
-        ):
-            matches.append(f"{series_id}: {name} - {description}")
-
-    # Return up to 10 matches
-    return matches[:10]
+    return matches
 
 
 def list_all_indicators() -> list[str]:
@@ -112,12 +362,5 @@ def list_all_indicators() -> list[str]:
     List all available indicator codes and descriptions.
     Returns a list of all World Bank indicators.
     """
-    metadata = load_indicator_metadata()
-    results = []
-
-    for series_id, info in metadata.items():
-        name = info.get("name", "")
-        description = info.get("description", "")
-        results.append(f"{series_id}: {name} - {description}")
-
-    return results
+    get_indicator_index()
+    return list(_indicator_lines)
@@ -0,0 +1,83 @@
+import sys
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import pandas as pd
+
+METADATA_COLUMNS = ["series_id", "name", "description"]
+
+
+class IndicatorMetadata(Mapping[str, dict[str, str]]):
+    """
+    Compact, read-only store of World Bank indicator metadata.
+
+    Rows are kept as parallel tuples of interned series_ids, names and
+    descriptions plus a series_id -> position lookup, instead of one dict per
+    indicator. It still behaves as a mapping of series_id to
+    {"name": ..., "description": ...} for existing callers.
+    """
+
+    __slots__ = ("_positions", "descriptions", "names", "series_ids")
+
+    def __init__(
+        self,
+        series_ids: tuple[str, ...] = (),
+        names: tuple[str, ...] = (),
+        descriptions: tuple[str, ...] = (),
+    ):
+        self.series_ids = series_ids
+        self.names = names
+        self.descriptions = descriptions
+        self._positions = {series_id: i for i, series_id in enumerate(series_ids)}
+
+    @classmethod
+    def from_frame(cls, metadata_df: pd.DataFrame) -> "IndicatorMetadata":
+        """Build the store from a WB/METADATA DataFrame using columnar operations."""
+        frame = metadata_df.reindex(columns=METADATA_COLUMNS).fillna("")
+        frame = frame[frame["series_id"].astype(str) != ""]
+        # Later rows win, matching the previous dict-building behavior
+        frame = frame.drop_duplicates("series_id", keep="last")
+
+        return cls(
+            tuple(map(sys.intern, frame["series_id"].astype(str).tolist())),
+            tuple(frame["name"].astype(str).tolist()),
+            tuple(frame["description"].astype(str).tolist()),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "IndicatorMetadata":
+        """Rebuild the store from the output of to_dict()."""
+        return cls(
+            tuple(map(sys.intern, data["series_ids"])),
+            tuple(data["names"]),
+            tuple(data["descriptions"]),
+        )
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """Return a JSON-serializable columnar representation."""
+        return {
+            "series_ids": list(self.series_ids),
+            "names": list(self.names),
+            "descriptions": list(self.descriptions),
+        }
+
+    def name(self, series_id: str, default: str | None = None) -> str | None:
+        """Return the indicator name for a series_id."""
+        position = self._positions.get(series_id)
+        return default if position is None else self.names[position]
+
+    def __getitem__(self, series_id: str) -> dict[str, str]:
+        position = self._positions[series_id]
+        return {
+            "name": self.names[position],
+            "description": self.descriptions[position],
+        }
+
+    def __contains__(self, series_id: object) -> bool:
+        return series_id in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.series_ids)
+
+    def __len__(self) -> int:
+        return len(self.series_ids)
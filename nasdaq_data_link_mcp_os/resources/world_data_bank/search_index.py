@@ -0,0 +1,143 @@
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Sequence
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Matches in the series_id and name count for more than description matches
+SERIES_ID_WEIGHT = 3.0
+NAME_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Prefix-only matches score slightly below exact token matches
+PREFIX_PENALTY = 0.8
+MIN_PREFIX_LENGTH = 3
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class IndicatorIndex:
+    """
+    Inverted index over World Bank indicator metadata.
+
+    Every query term must match (AND semantics), either as a whole token or, for
+    terms of at least MIN_PREFIX_LENGTH characters, as a token prefix. Results
+    are ranked with BM25 over field-weighted term frequencies.
+    """
+
+    __slots__ = ("_avg_length", "_lengths", "_postings", "_vocabulary", "series_ids")
+
+    def __init__(
+        self,
+        series_ids: Sequence[str],
+        names: Sequence[str],
+        descriptions: Sequence[str],
+    ):
+        self.series_ids = list(series_ids)
+        self._postings: dict[str, dict[int, float]] = {}
+        self._lengths: list[float] = []
+
+        for doc_id, (series_id, name, description) in enumerate(
+            zip(self.series_ids, names, descriptions, strict=True)
+        ):
+            weights: Counter[str] = Counter()
+            # The full series_id is indexed too so exact codes rank first
+            weights[series_id.lower()] += SERIES_ID_WEIGHT
+            for token in tokenize(series_id):
+                weights[token] += SERIES_ID_WEIGHT
+            for token in tokenize(name):
+                weights[token] += NAME_WEIGHT
+            for token in tokenize(description):
+                weights[token] += DESCRIPTION_WEIGHT
+
+            for token, weight in weights.items():
+                self._postings.setdefault(token, {})[doc_id] = weight
+            self._lengths.append(sum(weights.values()))
+
+        self._avg_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        )
+        self._vocabulary = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self.series_ids)
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Return the indexed tokens matching a query term with their boost."""
+        matches = []
+        if term in self._postings:
+            matches.append((term, 1.0))
+        if len(term) >= MIN_PREFIX_LENGTH:
+            position = bisect_left(self._vocabulary, term)
+            while position < len(self._vocabulary):
+                token = self._vocabulary[position]
+                if not token.startswith(term):
+                    break
+                if token != term:
+                    matches.append((token, PREFIX_PENALTY))
+                position += 1
+        return matches
+
+    def _term_scores(self, term: str) -> dict[int, float]:
+        """Score every document matching a single query term."""
+        total = len(self.series_ids)
+        scores: dict[int, float] = {}
+        for token, boost in self._expand(term):
+            postings = self._postings[token]
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = 1 - B + B * self._lengths[doc_id] / self._avg_length
+                score = boost * idf * frequency * (K1 + 1) / (frequency + K1 * norm)
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        return scores
+
+    def search(self, query: str, limit: int | None = 10) -> list[tuple[str, float]]:
+        """
+        Rank indicators against a free-text query.
+
+        Args:
+            query: Keywords or an indicator code (e.g., 'GDP per capita')
+            limit: Maximum number of results, or None for all matches
+
+        Returns:
+            List of (series_id, score) tuples, best match first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        full_code = query.strip().lower()
+        if full_code in self._postings and full_code not in terms:
+            terms.insert(0, full_code)
+        if not terms or not self.series_ids:
+            return []
+
+        # Intersect the rarest terms first to keep the candidate set small
+        per_term = sorted((self._term_scores(term) for term in terms), key=len)
+        if not per_term[0]:
+            return []
+        totals = dict(per_term[0])
+        for scores in per_term[1:]:
+            totals = {
+                doc_id: total + scores[doc_id]
+                for doc_id, total in totals.items()
+                if doc_id in scores
+            }
+            if not totals:
+                return []
+
+        ranked = ((score, -doc_id) for doc_id, score in totals.items())
+        top = (
+            heapq.nlargest(limit, ranked)
+            if limit is not None
+            else sorted(ranked, reverse=True)
+        )
+        return [(self.series_ids[-neg_id], score) for score, neg_id in top]
@@ -1,13 +1,20 @@
 import argparse
+import json
 import sys
+from collections.abc import Callable
 from typing import Any
 
-import nasdaqdatalink as ndl
 from mcp.server.fastmcp import FastMCP
 
+from nasdaq_data_link_mcp_os.concurrency import offload
 from nasdaq_data_link_mcp_os.config import initialize_api
+from nasdaq_data_link_mcp_os.ratelimit import limiter_stats
 from nasdaq_data_link_mcp_os.resources_registry import get_databases_resource
 
+# nasdaqdatalink, pandas and the modules built on them are imported inside the
+# tools: MCP clients spawn a fresh stdio process per session, and loading them
+# up front would roughly double the time until the server answers initialize.
+
 mcp = FastMCP("NASDAQ Data Link MCP", dependencies=["nasdaq-data-link", "pycountry"])
 
 api_initialized = False
@@ -15,13 +22,72 @@ if "pytest" not in sys.modules:
     api_initialized = initialize_api()
 
 
+def _data_link() -> Any:
+    """Import nasdaqdatalink on first use, routed through the shared session."""
+    # Importing the client installs its session into nasdaqdatalink
+    from nasdaq_data_link_mcp_os import client
+
+    return client.nasdaqdatalink
+
+
+def blocking_tool() -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Register a tool that does blocking network I/O.
+
+    The tool is exposed to MCP clients as an async variant that runs in the
+    bounded worker pool, so one slow request does not stall other sessions on
+    the streamable-http and sse transports. The decorated function itself is
+    returned unchanged and stays callable synchronously.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        mcp.add_tool(offload(fn))
+        return fn
+
+    return decorator
+
+
 @mcp.resource("nasdaq://databases")
 def list_available_databases() -> str:
     """List all available Nasdaq Data Link databases with descriptions."""
     return get_databases_resource()
 
 
-@mcp.tool()
+@mcp.resource("nasdaq://cache/stats")
+def cache_statistics() -> str:
+    """Cache, normalization, coalescing, rate limiter and mirror statistics."""
+    from nasdaq_data_link_mcp_os.cache import response_cache
+    from nasdaq_data_link_mcp_os.mirror import table_mirror
+    from nasdaq_data_link_mcp_os.normalize import normalization_stats
+    from nasdaq_data_link_mcp_os.singleflight import flights
+
+    stats = {
+        **response_cache.stats(),
+        "normalization": normalization_stats(),
+        "single_flight": flights.stats(),
+        "rate_limit": limiter_stats(),
+        "mirror": table_mirror.stats(),
+    }
+    return json.dumps(stats, indent=2)
+
+
+@mcp.resource("nasdaq://query/tables")
+def list_query_tables() -> str:
+    """Tables that query_tables can read, from the mirror or the response cache."""
+    from nasdaq_data_link_mcp_os.query import available_tables
+
+    return json.dumps(available_tables(), indent=2)
+
+
+@mcp.resource("nasdaq://exports/{export_id}")
+def read_export(export_id: str) -> str | bytes:
+    """Contents of a file written by export_dataset; binary for parquet/arrow."""
+    from nasdaq_data_link_mcp_os import exports
+
+    return exports.read_export(export_id)
+
+
+@blocking_tool()
 def search_datasets(query: str) -> list[dict[str, Any]]:
     """
     Search for datasets by keyword.
@@ -31,7 +97,7 @@ def search_datasets(query: str) -> list[dict[str, Any]]:
 
     Example: search_datasets(query='oil prices')
     """
-    results = ndl.Dataset.search(query, per_page=10)
+    results = _data_link().Dataset.search(query, per_page=10)
     return [
         {
             "code": r.code,
@@ -42,11 +108,16 @@ def search_datasets(query: str) -> list[dict[str, Any]]:
     ]
 
 
-@mcp.tool()
+@blocking_tool()
 def get_dataset(
     dataset_code: str,
     start_date: str | None = None,
     end_date: str | None = None,
+    frequency: str | None = None,
+    aggregation: str | None = None,
+    last_n: int | None = None,
+    encoding: str = "split",
+    max_rows: int | None = None,
 ) -> str:
     """
     Get data from a specific dataset.
@@ -55,20 +126,26 @@ def get_dataset(
       - dataset_code: Dataset code in format 'DATABASE/DATASET' (e.g., 'WIKI/AAPL')
       - start_date: Optional start date in YYYY-MM-DD format
       - end_date: Optional end date in YYYY-MM-DD format
-
-    Example: get_dataset(dataset_code='WIKI/AAPL', start_date='2020-01-01')
+      - frequency: Optional downsampling: 'weekly', 'monthly', 'quarterly', 'yearly'
+      - aggregation: Per-period rollup: 'last' (default), 'first', 'mean', 'sum',
+        'min', 'max', 'ohlc'; or 'describe' for summary statistics
+      - last_n: Optional number of most recent rows to return
+      - encoding: 'split' (default), 'columnar' (compact: dictionary-encoded
+        strings, delta-encoded dates) or 'summary' (statistics and edge rows)
+      - max_rows: Optional cap; longer results are sampled evenly
+
+    Example: get_dataset(dataset_code='WIKI/AAPL', frequency='monthly', last_n=12)
     """
-    params = {}
-    if start_date:
-        params["start_date"] = start_date
-    if end_date:
-        params["end_date"] = end_date
+    from nasdaq_data_link_mcp_os import client
+    from nasdaq_data_link_mcp_os.aggregate import aggregate_frame
+    from nasdaq_data_link_mcp_os.encoding import encode_frame
 
-    data = ndl.get(dataset_code, **params)
-    return data.to_json(orient="split", date_format="iso")
+    data = client.get_range(dataset_code, start_date=start_date, end_date=end_date)
+    data = aggregate_frame(data, frequency, aggregation, last_n)
+    return encode_frame(data, encoding=encoding, max_rows=max_rows)
 
 
-@mcp.tool()
+@blocking_tool()
 def get_dataset_metadata(dataset_code: str) -> dict[str, Any]:
     """
     Get metadata about a dataset without downloading data.
@@ -78,7 +155,7 @@ def get_dataset_metadata(dataset_code: str) -> dict[str, Any]:
 
     Example: get_dataset_metadata(dataset_code='WIKI/AAPL')
     """
-    dataset = ndl.Dataset(dataset_code)
+    dataset = _data_link().Dataset(dataset_code)
     return {
         "code": dataset.code,
         "name": dataset.name,
@@ -87,14 +164,20 @@ def get_dataset_metadata(dataset_code: str) -> dict[str, Any]:
     }
 
 
-@mcp.tool()
+@blocking_tool()
 def list_databases() -> list[dict[str, Any]]:
     """
     List available databases.
 
     Example: list_databases()
     """
-    databases = ndl.Database.all(per_page=20)
+    from nasdaq_data_link_mcp_os.singleflight import flights
+
+    ndl = _data_link()
+    # Concurrent sessions asking for the list share one upstream call
+    databases = flights.do(
+        "databases:per_page=20", lambda: list(ndl.Database.all(per_page=20))
+    )
 
     return [
         {
@@ -106,42 +189,99 @@ def list_databases() -> list[dict[str, Any]]:
     ]
 
 
-@mcp.tool()
+@blocking_tool()
 def export_dataset(
     dataset_code: str,
     output_format: str = "csv",
     start_date: str | None = None,
     end_date: str | None = None,
+    delivery: str = "auto",
+    columns: list[str] | None = None,
+    compression: str | None = None,
 ) -> str:
     """
     Export dataset in different formats.
 
+    Large exports are written to a file in fixed-size chunks and returned as a
+    handle whose 'uri' can be read as a nasdaq://exports/{export_id} resource.
+    Parquet and Arrow exports are always delivered as files.
+
     Parameters:
       - dataset_code: Dataset code in format 'DATABASE/DATASET'
-      - output_format: Export format: 'csv', 'json', or 'xml' (default: csv)
+      - output_format: Export format: 'csv', 'json', 'ndjson', 'xml', 'parquet'
+        or 'arrow' (Arrow IPC / Feather v2) (default: csv)
       - start_date: Optional start date in YYYY-MM-DD format
       - end_date: Optional end date in YYYY-MM-DD format
-
-    Example: export_dataset(dataset_code='WIKI/AAPL', output_format='json')
+      - delivery: 'inline' returns the data, 'file' returns an export handle,
+        'auto' (default) uses a file once the result exceeds the inline row limit
+      - columns: Optional list of columns to export; the date index is kept
+      - compression: Codec for parquet ('snappy', 'zstd', 'gzip', 'brotli',
+        'lz4', 'none') or arrow ('lz4', 'zstd', 'none') files
+
+    Example: export_dataset(dataset_code='WIKI/AAPL', output_format='parquet',
+             columns=['Close'], compression='zstd')
     """
-    params = {}
-    if start_date:
-        params["start_date"] = start_date
-    if end_date:
-        params["end_date"] = end_date
+    from nasdaq_data_link_mcp_os import client, exports
+
+    if output_format not in ("csv", "json", "ndjson", "xml", *exports.BINARY_FORMATS):
+        raise ValueError(
+            f"Unsupported format: {output_format}. "
+            "Use 'csv', 'json', 'ndjson', 'xml', 'parquet', or 'arrow'"
+        )
+    if delivery not in ("auto", "inline", "file"):
+        raise ValueError(
+            f"Unsupported delivery: {delivery}. Use 'auto', 'inline', or 'file'"
+        )
+    binary = output_format in exports.BINARY_FORMATS
+    if binary and delivery == "inline":
+        raise ValueError(f"The {output_format} format can only be delivered as a file")
+
+    data = client.get_range(dataset_code, start_date=start_date, end_date=end_date)
+    data = exports.project(data, columns)
 
-    data = ndl.get(dataset_code, **params)
+    to_file = (
+        binary
+        or delivery == "file"
+        or (delivery == "auto" and len(data) > exports.INLINE_MAX_ROWS)
+    )
+    if to_file and output_format in exports.STREAMING_FORMATS:
+        handle = exports.write_export(
+            exports.iter_chunks(data), output_format, compression=compression
+        )
+        return json.dumps(handle, indent=2)
 
     if output_format == "csv":
         return data.to_csv(index=True)
     elif output_format == "json":
         return data.to_json(orient="records", date_format="iso")
-    elif output_format == "xml":
-        return data.to_xml(index=True)
+    elif output_format == "ndjson":
+        return data.to_json(orient="records", date_format="iso", lines=True)
     else:
-        raise ValueError(
-            f"Unsupported format: {output_format}. Use 'csv', 'json', or 'xml'"
-        )
+        return data.to_xml(index=True)
+
+
+@blocking_tool()
+def query_tables(sql: str, max_rows: int | None = None) -> str:
+    """
+    Run a read-only SQL query over locally cached and mirrored datatables.
+
+    Tables are named after their datatable code (NDAQ/RTAT -> ndaq_rtat,
+    NDAQ/CA -> ndaq_ca, WB/DATA -> wb_data); the nasdaq://query/tables
+    resource lists what is available. Queries run in DuckDB (requires the
+    'sql' extra) and never reach the network.
+
+    Parameters:
+      - sql: A single SELECT statement
+      - max_rows: Optional cap on returned rows (default: 1000)
+
+    Example: query_tables(sql="SELECT r.date, r.activity, c.action FROM ndaq_rtat r
+             JOIN ndaq_ca c ON r.ticker = c.symbol AND r.date = c.date")
+    """
+    from nasdaq_data_link_mcp_os.query import run_query
+
+    result, truncated = run_query(sql, max_rows=max_rows)
+    data = json.loads(result.to_json(orient="split", index=False, date_format="iso"))
+    return json.dumps({"rows": len(result), "truncated": truncated, "data": data})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+
+class _Call:
+    __slots__ = ("done", "error", "followers", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result (DataFrames are
+    copied per caller) or the same exception. Nothing is remembered once the
+    call completes, so this complements rather than replaces the caches.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._counters = {"executed": 0, "coalesced": 0}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn for key, or wait for the identical call already running."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self._counters["executed"] += 1
+            else:
+                call.followers += 1
+                leader = False
+                self._counters["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return _copy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        # The leader keeps the original; followers get copies
+        return call.result
+
+    def stats(self) -> dict[str, int]:
+        """Return how many calls ran and how many were served by another."""
+        with self._lock:
+            return {**self._counters, "in_flight": len(self._calls)}
+
+
+def _copy(result: Any) -> Any:
+    if isinstance(result, pd.DataFrame | pd.Series):
+        return result.copy()
+    return result
+
+
+flights = SingleFlight()
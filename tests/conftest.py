@@ -0,0 +1,14 @@
+import pytest
+
+from nasdaq_data_link_mcp_os.cache import response_cache
+from nasdaq_data_link_mcp_os.range_store import timeseries_store
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached Data Link responses from leaking between tests."""
+    response_cache.clear()
+    timeseries_store.invalidate()
+    yield
+    response_cache.clear()
+    timeseries_store.invalidate()
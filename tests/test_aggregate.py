@@ -0,0 +1,83 @@
+"""
+Tests for server-side time-series aggregation
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os.aggregate import aggregate_frame
+
+
+@pytest.fixture
+def daily():
+    index = pd.bdate_range("2024-01-01", "2024-03-29", name="Date")
+    close = np.arange(len(index), dtype=float)
+    return pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": np.ones(len(index)),
+        },
+        index=index,
+    )
+
+
+class TestAggregateFrame:
+    def test_monthly_last(self, daily):
+        result = aggregate_frame(daily, frequency="monthly")
+
+        assert len(result) == 3
+        assert result["Close"].tolist() == [
+            daily.loc["2024-01", "Close"].iloc[-1],
+            daily.loc["2024-02", "Close"].iloc[-1],
+            daily.loc["2024-03", "Close"].iloc[-1],
+        ]
+
+    def test_price_ohlc_rollup(self, daily):
+        result = aggregate_frame(daily, frequency="monthly", aggregation="ohlc")
+        january = daily.loc["2024-01"]
+
+        first = result.iloc[0]
+        assert first["Open"] == january["Open"].iloc[0]
+        assert first["High"] == january["High"].max()
+        assert first["Low"] == january["Low"].min()
+        assert first["Close"] == january["Close"].iloc[-1]
+        assert first["Volume"] == len(january)
+
+    def test_generic_ohlc_bars(self, daily):
+        result = aggregate_frame(
+            daily[["Close"]], frequency="weekly", aggregation="ohlc"
+        )
+
+        assert list(result.columns) == [
+            "Close_open",
+            "Close_high",
+            "Close_low",
+            "Close_close",
+        ]
+
+    def test_describe_and_last_n(self, daily):
+        assert aggregate_frame(daily, aggregation="describe").loc["count", "Close"] == (
+            len(daily)
+        )
+        assert aggregate_frame(daily, last_n=1).index[0] == daily.index[-1]
+        assert len(aggregate_frame(daily, frequency="weekly", last_n=4)) == 4
+
+    def test_empty_periods_are_dropped(self):
+        index = pd.DatetimeIndex(["2024-01-15", "2024-03-15"])
+        frame = pd.DataFrame({"Value": [1.0, 2.0]}, index=index)
+
+        result = aggregate_frame(frame, frequency="monthly", aggregation="sum")
+
+        assert result["Value"].tolist() == [1.0, 2.0]
+
+    def test_validation(self, daily):
+        with pytest.raises(ValueError, match="Unsupported frequency"):
+            aggregate_frame(daily, frequency="hourly")
+        with pytest.raises(ValueError, match="requires a frequency"):
+            aggregate_frame(daily, aggregation="mean")
+        with pytest.raises(ValueError, match="date-indexed"):
+            aggregate_frame(daily.reset_index(), frequency="monthly")
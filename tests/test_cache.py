@@ -0,0 +1,140 @@
+"""
+Tests for the Data Link response cache
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os import cache, client
+from nasdaq_data_link_mcp_os.cache import ResponseCache, make_key, ttl_for
+
+
+def make_frame(rows: int = 3) -> pd.DataFrame:
+    return pd.DataFrame({"symbol": ["MSFT"] * rows, "value": range(rows)})
+
+
+class TestCacheKeys:
+    def test_equivalent_requests_share_key(self):
+        first = make_key("get_table", "ndaq/fs", {"symbol": " MSFT", "figi": None})
+        second = make_key("get_table", "NDAQ/FS", {"symbol": "MSFT"})
+
+        assert first == second
+
+    def test_different_params_differ(self):
+        first = make_key("get_table", "NDAQ/FS", {"symbol": "MSFT"})
+        second = make_key("get_table", "NDAQ/FS", {"symbol": "AAPL"})
+
+        assert first != second
+
+    def test_ttl_uses_longest_prefix(self, monkeypatch):
+        monkeypatch.setitem(cache.DATASET_TTL_SECONDS, "NDAQ/", 10)
+        monkeypatch.setitem(cache.DATASET_TTL_SECONDS, "NDAQ/BS", 20)
+
+        assert ttl_for("ndaq/bs") == 20
+        assert ttl_for("NDAQ/RTAT") == 10
+        assert ttl_for("WIKI/AAPL") == cache.DEFAULT_TTL_SECONDS
+
+
+class TestMemoryTier:
+    def test_hit_and_miss_counters(self):
+        store = ResponseCache(cache_dir=None)
+
+        assert store.get("key", 60) is None
+        store.put("key", make_frame(), 60)
+        assert store.get("key", 60).equals(make_frame())
+
+        stats = store.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["bytes"] == cache.frame_nbytes(make_frame())
+
+    def test_returned_frames_are_copies(self):
+        store = ResponseCache(cache_dir=None)
+        store.put("key", make_frame(), 60)
+
+        frame = store.get("key", 60)
+        frame.loc[0, "value"] = 99
+
+        assert store.get("key", 60).loc[0, "value"] == 0
+
+    def test_lru_eviction_by_bytes(self):
+        size = cache.frame_nbytes(make_frame())
+        store = ResponseCache(max_bytes=size * 2, cache_dir=None)
+
+        store.put("a", make_frame(), 60)
+        store.put("b", make_frame(), 60)
+        store.get("a", 60)
+        store.put("c", make_frame(), 60)
+
+        assert store.get("b", 60) is None
+        assert store.get("a", 60) is not None
+        assert store.stats()["evictions"] == 1
+
+    def test_expired_entries_miss(self):
+        store = ResponseCache(cache_dir=None)
+        store.put("key", make_frame(), -1)
+
+        assert store.get("key", 60) is None
+
+    def test_disabled_cache(self):
+        store = ResponseCache(cache_dir=None, enabled=False)
+        store.put("key", make_frame(), 60)
+
+        assert store.get("key", 60) is None
+
+
+class TestDiskTier:
+    def test_disk_tier_survives_restart(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        ResponseCache(cache_dir=str(tmp_path)).put("key", make_frame(), 60)
+
+        restarted = ResponseCache(cache_dir=str(tmp_path))
+        frame = restarted.get("key", 60)
+
+        assert frame.equals(make_frame())
+        assert restarted.stats()["disk_hits"] == 1
+
+    def test_disk_entries_expire(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        ResponseCache(cache_dir=str(tmp_path)).put("key", make_frame(), 60)
+        for name in os.listdir(tmp_path):
+            os.utime(tmp_path / name, (0, 0))
+
+        assert ResponseCache(cache_dir=str(tmp_path)).get("key", 60) is None
+
+    def test_promoted_entries_keep_their_age(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        ResponseCache(cache_dir=str(tmp_path)).put("key", make_frame(), 60)
+        stored_at = time.time() - 50
+        for name in os.listdir(tmp_path):
+            os.utime(tmp_path / name, (stored_at, stored_at))
+
+        restarted = ResponseCache(cache_dir=str(tmp_path))
+        assert restarted.get("key", 60) is not None
+
+        _, expires_at, _ = restarted._entries["key"]
+        assert expires_at - time.monotonic() <= 10
+
+
+class TestClientCaching:
+    def test_get_table_cached(self):
+        with patch("nasdaqdatalink.get_table", return_value=make_frame()) as mock:
+            client.get_table("NDAQ/BS", symbol="MSFT")
+            client.get_table("NDAQ/BS", symbol="MSFT")
+            client.get_table("NDAQ/BS", symbol="MSFT", cache=False)
+
+        assert mock.call_count == 2
+
+    def test_errors_not_cached(self):
+        with patch("nasdaqdatalink.get", side_effect=Exception("boom")):
+            with pytest.raises(Exception, match="boom"):
+                client.get("WIKI/AAPL")
+        with patch("nasdaqdatalink.get", return_value=make_frame()) as mock:
+            client.get("WIKI/AAPL")
+
+        mock.assert_called_once_with("WIKI/AAPL")
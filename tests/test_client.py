@@ -0,0 +1,166 @@
+"""
+Tests for the shared Data Link client layer
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from nasdaqdatalink.connection import Connection
+from requests.adapters import HTTPAdapter
+
+from nasdaq_data_link_mcp_os import client
+
+
+class TestSharedSession:
+    def test_session_is_reused(self):
+        assert client.get_session() is client.get_session()
+
+    def test_library_uses_shared_session(self):
+        assert Connection.get_session() is client.get_session()
+
+    def test_pool_configuration(self):
+        adapter = client.get_session().get_adapter("https://data.nasdaq.com")
+
+        assert adapter._pool_maxsize == client.POOL_MAXSIZE
+        assert adapter._pool_connections == client.POOL_CONNECTIONS
+
+    def test_default_timeout_applied(self):
+        adapter = client.get_session().get_adapter("https://data.nasdaq.com")
+
+        with patch.object(HTTPAdapter, "send", return_value="ok") as mock_send:
+            adapter.send("request")
+            adapter.send("request", timeout=1)
+
+        first, second = mock_send.call_args_list
+        assert first.kwargs["timeout"] == (
+            client.CONNECT_TIMEOUT,
+            client.READ_TIMEOUT,
+        )
+        assert second.kwargs["timeout"] == 1
+
+    def test_close_session_recreates(self):
+        session = client.get_session()
+        client.close_session()
+
+        assert client.get_session() is not session
+
+
+class TestClientCalls:
+    def test_get_table_delegates(self):
+        frame = pd.DataFrame({"symbol": ["MSFT"]})
+        with patch("nasdaqdatalink.get_table", return_value=frame) as mock_get:
+            result = client.get_table("NDAQ/STAT", symbol="MSFT")
+
+        assert result is frame
+        mock_get.assert_called_once_with("NDAQ/STAT", symbol="MSFT")
+
+    def test_get_delegates(self):
+        frame = pd.DataFrame({"Close": [1.0]})
+        with patch("nasdaqdatalink.get", return_value=frame) as mock_get:
+            result = client.get("WIKI/AAPL", start_date="2020-01-01")
+
+        assert result is frame
+        mock_get.assert_called_once_with("WIKI/AAPL", start_date="2020-01-01")
+
+
+def make_pages(*sizes):
+    """Build fake datatable pages linked by cursor ids."""
+    pages = []
+    offset = 0
+    for number, size in enumerate(sizes):
+        page = MagicMock()
+        page.to_pandas.return_value = pd.DataFrame(
+            {"row": range(offset, offset + size)}
+        )
+        is_last = number == len(sizes) - 1
+        page.meta = {"next_cursor_id": None if is_last else f"cursor-{number + 1}"}
+        pages.append(page)
+        offset += size
+    return pages
+
+
+@pytest.fixture
+def mock_datatable():
+    with patch("nasdaqdatalink.Datatable") as mock_cls:
+        yield mock_cls
+
+
+class TestPagination:
+    def test_iter_table_follows_cursor(self, mock_datatable):
+        mock_datatable.return_value.data.side_effect = make_pages(2, 2, 1)
+
+        chunks = list(client.iter_table("NDAQ/TS", symbol="AAPL"))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        params = [
+            c.kwargs["params"] for c in mock_datatable.return_value.data.call_args_list
+        ]
+        assert params[0] == {"symbol": "AAPL"}
+        assert params[2] == {"symbol": "AAPL", "qopts.cursor_id": "cursor-2"}
+
+    def test_iter_table_row_cap_stops_early(self, mock_datatable):
+        mock_datatable.return_value.data.side_effect = make_pages(2, 2, 2)
+
+        chunks = list(client.iter_table("NDAQ/TS", max_rows=3))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert mock_datatable.return_value.data.call_count == 2
+
+    def test_iter_table_is_lazy(self, mock_datatable):
+        mock_datatable.return_value.data.side_effect = make_pages(2, 2)
+
+        next(client.iter_table("NDAQ/TS"))
+
+        assert mock_datatable.return_value.data.call_count == 1
+
+    def test_get_table_paginate_concatenates(self, mock_datatable):
+        mock_datatable.return_value.data.side_effect = make_pages(2, 3)
+
+        frame = client.get_table("NDAQ/RTAT", paginate=True, date="2024-01-02")
+
+        assert frame["row"].tolist() == [0, 1, 2, 3, 4]
+
+    def test_get_table_default_cap_warns(self, mock_datatable, monkeypatch):
+        monkeypatch.setattr(client, "MAX_ROWS", 3)
+        mock_datatable.return_value.data.side_effect = make_pages(2, 2)
+
+        with pytest.warns(UserWarning, match="capped at 3 rows"):
+            frame = client.get_table("NDAQ/TS", paginate=True)
+
+        assert len(frame) == 3
+
+
+class TestBatchFetch:
+    def test_values_are_chunked_into_multi_value_filters(self, monkeypatch):
+        calls = []
+
+        def fake_get_table(code, paginate=False, **params):
+            calls.append(params)
+            return pd.DataFrame({"symbol": params["symbol"].split(",")})
+
+        monkeypatch.setattr(client, "get_table", fake_get_table)
+
+        frame = client.get_table_batch(
+            "NDAQ/FS",
+            "symbol",
+            ["A", "B", "C", "B", " "],
+            chunk_size=2,
+            dimension="MRY",
+        )
+
+        assert frame["symbol"].tolist() == ["A", "B", "C"]
+        assert sorted(c["symbol"] for c in calls) == ["A,B", "C"]
+        assert all(c["dimension"] == "MRY" for c in calls)
+
+    def test_comma_separated_string(self, monkeypatch):
+        mock_get = MagicMock(return_value=pd.DataFrame({"symbol": ["A"]}))
+        monkeypatch.setattr(client, "get_table", mock_get)
+
+        client.get_table_batch("NDAQ/STAT", "figi", "X, Y")
+
+        mock_get.assert_called_once_with("NDAQ/STAT", paginate=True, figi="X,Y")
+
+    def test_empty_values_rejected(self):
+        with pytest.raises(ValueError, match="No symbol values"):
+            client.get_table_batch("NDAQ/FS", "symbol", [])
@@ -0,0 +1,66 @@
+"""
+Tests for offloading blocking Data Link calls from the event loop
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+
+import anyio
+
+from nasdaq_data_link_mcp_os import concurrency
+
+
+def slow_call(delay: float = 0.2) -> str:
+    """Blocking call used by the tests."""
+    time.sleep(delay)
+    return threading.current_thread().name
+
+
+class TestOffload:
+    def test_wrapper_keeps_signature(self):
+        wrapper = concurrency.offload(slow_call)
+
+        assert inspect.iscoroutinefunction(wrapper)
+        assert wrapper.__name__ == "slow_call"
+        assert wrapper.__doc__ == slow_call.__doc__
+        assert list(inspect.signature(wrapper).parameters) == ["delay"]
+
+    def test_runs_outside_event_loop_thread(self):
+        wrapper = concurrency.offload(slow_call)
+        thread_name = asyncio.run(wrapper(0))
+
+        assert thread_name != threading.current_thread().name
+
+    def test_calls_run_concurrently(self):
+        wrapper = concurrency.offload(slow_call)
+
+        async def main():
+            start = time.perf_counter()
+            await asyncio.gather(*(wrapper(0.2) for _ in range(4)))
+            return time.perf_counter() - start
+
+        assert asyncio.run(main()) < 0.6
+
+    def test_concurrency_limit(self, monkeypatch):
+        monkeypatch.setattr(concurrency, "_limiter", anyio.CapacityLimiter(1))
+        wrapper = concurrency.offload(slow_call)
+
+        async def main():
+            start = time.perf_counter()
+            await asyncio.gather(*(wrapper(0.1) for _ in range(3)))
+            return time.perf_counter() - start
+
+        assert asyncio.run(main()) >= 0.3
+
+
+class TestServerTools:
+    def test_tools_registered_as_async(self):
+        from nasdaq_data_link_mcp_os.server import get_dataset, mcp
+
+        tool = mcp._tool_manager.get_tool("get_dataset")
+
+        assert tool.is_async
+        assert not inspect.iscoroutinefunction(get_dataset)
+        assert "dataset_code" in tool.parameters["properties"]
@@ -62,6 +62,36 @@ class TestGetDataset:
             "WIKI/AAPL", start_date="2020-01-01", end_date="2020-12-31"
         )
 
+    def test_get_dataset_uses_response_cache(self, mock_ndl):
+        from nasdaq_data_link_mcp_os.cache import response_cache
+        from nasdaq_data_link_mcp_os.range_store import timeseries_store
+        from nasdaq_data_link_mcp_os.server import get_dataset
+
+        index = pd.date_range("2020-01-01", periods=3, freq="D", name="Date")
+        mock_ndl["get"].return_value = pd.DataFrame({"Close": [1.0, 2.0, 3.0]}, index)
+
+        get_dataset("WIKI/AAPL", start_date="2020-01-01", end_date="2020-01-03")
+        timeseries_store.invalidate()
+        get_dataset("WIKI/AAPL", start_date="2020-01-01", end_date="2020-01-03")
+
+        mock_ndl["get"].assert_called_once()
+        stats = response_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_get_dataset_aggregated(self, mock_ndl):
+        from nasdaq_data_link_mcp_os.server import get_dataset
+
+        index = pd.date_range("2020-01-01", "2020-03-31", freq="D", name="Date")
+        mock_df = pd.DataFrame({"Close": range(len(index))}, index=index)
+        mock_ndl["get"].return_value = mock_df
+
+        result = get_dataset("WIKI/AAPL", frequency="monthly", last_n=2)
+        data = json.loads(result)
+
+        assert len(data["data"]) == 2
+        assert data["data"][-1] == [len(index) - 1]
+
 
 class TestGetDatasetMetadata:
     def test_get_dataset_metadata(self, mock_ndl):
@@ -129,3 +159,48 @@ class TestExportDataset:
 
         with pytest.raises(ValueError, match="Unsupported format"):
             export_dataset("WIKI/AAPL", output_format="invalid")
+
+    def test_export_large_result_returns_handle(self, mock_ndl, tmp_path, monkeypatch):
+        from nasdaq_data_link_mcp_os import exports
+        from nasdaq_data_link_mcp_os.server import export_dataset, read_export
+
+        monkeypatch.setattr(exports, "EXPORT_DIR", str(tmp_path))
+        monkeypatch.setattr(exports, "INLINE_MAX_ROWS", 1)
+        mock_df = pd.DataFrame({"Close": [100.0, 101.0, 102.0]})
+        mock_ndl["get"].return_value = mock_df
+
+        handle = json.loads(export_dataset("WIKI/AAPL", output_format="ndjson"))
+
+        assert handle["rows"] == 3
+        assert handle["uri"].startswith("nasdaq://exports/")
+        assert len(read_export(handle["export_id"]).splitlines()) == 3
+
+    def test_export_xml_to_file(self, mock_ndl, tmp_path, monkeypatch):
+        from nasdaq_data_link_mcp_os import exports
+        from nasdaq_data_link_mcp_os.server import export_dataset, read_export
+
+        monkeypatch.setattr(exports, "EXPORT_DIR", str(tmp_path))
+        mock_df = pd.DataFrame({"Close": [100.0, 101.0]})
+        mock_ndl["get"].return_value = mock_df
+
+        handle = json.loads(
+            export_dataset("WIKI/AAPL", output_format="xml", delivery="file")
+        )
+
+        assert handle["format"] == "xml"
+        assert handle["rows"] == 2
+        assert read_export(handle["export_id"]).count("<row>") == 2
+
+    def test_export_parquet_with_columns(self, mock_ndl, tmp_path, monkeypatch):
+        from nasdaq_data_link_mcp_os import exports
+        from nasdaq_data_link_mcp_os.server import export_dataset
+
+        monkeypatch.setattr(exports, "EXPORT_DIR", str(tmp_path))
+        mock_df = pd.DataFrame({"Open": [99.0], "Close": [100.0]})
+        mock_ndl["get"].return_value = mock_df
+
+        handle = json.loads(
+            export_dataset("WIKI/AAPL", output_format="parquet", columns=["Close"])
+        )
+
+        assert list(pd.read_parquet(handle["path"]).columns) == ["Close"]
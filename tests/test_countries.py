@@ -0,0 +1,130 @@
+"""
+Tests for the country-name index behind get_country_code
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from nasdaq_data_link_mcp_os.resources.common import countries
+from nasdaq_data_link_mcp_os.resources.common.countries import (
+    CountryIndex,
+    fold,
+    get_country_code,
+    resolve_many,
+)
+
+
+def country(alpha_2, alpha_3, numeric, name, **names):
+    return SimpleNamespace(
+        alpha_2=alpha_2, alpha_3=alpha_3, numeric=numeric, name=name, **names
+    )
+
+
+@pytest.fixture
+def index():
+    return CountryIndex(
+        [
+            country("DE", "DEU", "276", "Germany"),
+            country(
+                "KR", "KOR", "410", "Korea, Republic of", common_name="South Korea"
+            ),
+            country("CI", "CIV", "384", "Côte d'Ivoire"),
+            country("BA", "BIH", "070", "Bosnia and Herzegovina"),
+            country("ZA", "ZAF", "710", "South Africa"),
+            country("SS", "SSD", "728", "South Sudan"),
+            country("US", "USA", "840", "United States"),
+            country("GB", "GBR", "826", "United Kingdom"),
+        ],
+        aliases={"ivory coast": "CIV", "america": "USA"},
+    )
+
+
+class TestFold:
+    def test_strips_accents_case_and_punctuation(self):
+        assert fold("Côte d'Ivoire") == "cote d ivoire"
+
+    def test_spells_out_ampersand_and_saint(self):
+        assert fold("St Kitts & Nevis") == "saint kitts and nevis"
+
+    def test_joins_dotted_initials(self):
+        assert fold("U.S.") == "us"
+        assert fold("U. K.") == "uk"
+        assert fold("Cote d'Ivoire") == "cote d ivoire"
+
+    def test_drops_leading_article(self):
+        assert fold("The Gambia") == "gambia"
+
+
+class TestCountryIndex:
+    @pytest.mark.parametrize(
+        ("name", "code"),
+        [
+            ("Germany", "DEU"),
+            ("germany", "DEU"),
+            ("de", "DEU"),
+            ("DEU", "DEU"),
+            ("276", "DEU"),
+            ("South Korea", "KOR"),
+            ("Republic of Korea", "KOR"),
+            ("Cote d'Ivoire", "CIV"),
+            ("Ivory Coast", "CIV"),
+        ],
+    )
+    def test_exact_matches(self, index, name, code):
+        assert index.resolve(name) == code
+
+    def test_partial_name(self, index):
+        assert index.resolve("Bosnia") == "BIH"
+
+    def test_misspelling(self, index):
+        assert index.resolve("Germny") == "DEU"
+
+    def test_swapped_letters(self, index):
+        assert index.resolve("Untied Kingdom") == "GBR"
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "Latin America",
+            "North America",
+            "Central America",
+            "South America",
+            "South Asia",
+            "Southern Africa",
+            "Africa",
+        ],
+    )
+    def test_regions_are_not_countries(self, index, name):
+        assert index.resolve(name) is None
+
+    def test_ambiguous_partial_name(self, index):
+        assert index.resolve("South") is None
+
+    def test_unknown_name(self, index):
+        assert index.resolve("Atlantis") is None
+        assert index.resolve("  ") is None
+
+
+class TestResolvers:
+    def test_get_country_code(self):
+        assert get_country_code("United States") == "USA"
+        assert get_country_code("U.S.") == "USA"
+        assert get_country_code("U.S.A.") == "USA"
+        assert get_country_code("U.K.") == "GBR"
+        assert get_country_code("Virgin Islands, U.S.") == "VIR"
+        assert get_country_code("Türkiye") == "TUR"
+
+    def test_unknown_country_message(self):
+        assert get_country_code("Atlantis") == "Unknown country: Atlantis"
+        assert get_country_code("Latin America") == "Unknown country: Latin America"
+
+    def test_resolve_many(self):
+        assert resolve_many(["Italy", "UK", "Italy", "Atlantis"]) == {
+            "Italy": "ITA",
+            "UK": "GBR",
+            "Atlantis": None,
+        }
+
+    def test_index_is_built_once(self):
+        assert countries.get_country_index() is countries.get_country_index()
@@ -0,0 +1,94 @@
+"""
+Tests for compact tool result encodings
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os.encoding import (
+    decode_columnar,
+    encode_columnar,
+    encode_frame,
+    sample_rows,
+)
+
+
+@pytest.fixture
+def prices():
+    index = pd.date_range("2024-01-01", periods=30, freq="D", name="Date")
+    return pd.DataFrame(
+        {
+            "Close": np.linspace(100.0, 129.0, 30),
+            "Volume": np.arange(30, dtype="int64"),
+            "Exchange": ["XNAS"] * 29 + [None],
+        },
+        index=index,
+    )
+
+
+class TestColumnarEncoding:
+    def test_round_trip(self, prices):
+        payload = json.loads(json.dumps(encode_columnar(prices)))
+
+        result = decode_columnar(payload)
+
+        expected = prices.set_axis(prices.index.as_unit("ns"))
+        pd.testing.assert_frame_equal(
+            result, expected, check_freq=False, check_dtype=False
+        )
+
+    def test_regular_dates_and_repeated_strings_are_compact(self, prices):
+        payload = encode_columnar(prices)
+
+        assert payload["index"]["values"] == {
+            "type": "dates",
+            "start": "2024-01-01T00:00:00",
+            "unit": "D",
+            "step": 1,
+            "count": 30,
+        }
+        exchange = payload["columns"]["Exchange"]
+        assert exchange["values"] == ["XNAS"]
+        assert exchange["codes"][-1] == -1
+        assert len(encode_frame(prices, "columnar")) < len(encode_frame(prices))
+
+    def test_irregular_dates_use_deltas(self):
+        index = pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-05"])
+        frame = pd.DataFrame({"Close": [1.0, 2.0, 3.0]}, index=index)
+
+        payload = encode_columnar(frame)
+
+        assert payload["index"]["values"]["deltas"] == [1, 3]
+        pd.testing.assert_index_equal(
+            decode_columnar(payload).index, index.as_unit("ns"), check_names=False
+        )
+
+
+class TestEncodeFrame:
+    def test_split_is_default(self, prices):
+        assert encode_frame(prices) == prices.to_json(orient="split", date_format="iso")
+
+    def test_sampling_keeps_edges(self, prices):
+        sampled = sample_rows(prices, 5)
+
+        assert len(sampled) == 5
+        assert sampled.index[0] == prices.index[0]
+        assert sampled.index[-1] == prices.index[-1]
+        payload = json.loads(encode_frame(prices, "columnar", max_rows=5))
+        assert payload["sampled_from"] == 30
+        assert payload["rows"] == 5
+
+    def test_summary(self, prices):
+        payload = json.loads(encode_frame(prices, "summary"))
+
+        assert payload["rows"] == 30
+        assert payload["range"] == ["2024-01-01T00:00:00", "2024-01-30T00:00:00"]
+        assert payload["columns"]["Close"]["max"] == 129.0
+        assert len(payload["edges"]["data"]) == 6
+
+    def test_unknown_encoding(self, prices):
+        with pytest.raises(ValueError, match="Unsupported encoding"):
+            encode_frame(prices, "xml")
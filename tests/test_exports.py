@@ -0,0 +1,110 @@
+"""
+Tests for chunked file exports
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os import exports
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(exports, "EXPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def frame():
+    index = pd.date_range("2020-01-01", periods=10, freq="D", name="Date")
+    return pd.DataFrame({"Close": range(10)}, index=index).astype(float)
+
+
+class TestChunkedExport:
+    def test_iter_chunks(self, frame):
+        assert [len(chunk) for chunk in exports.iter_chunks(frame, 4)] == [4, 4, 2]
+
+    def test_csv_matches_single_write(self, frame):
+        handle = exports.write_export(exports.iter_chunks(frame, 3), "csv")
+
+        assert exports.read_export(handle["export_id"]) == frame.to_csv(index=True)
+        assert handle["rows"] == 10
+        assert handle["uri"] == f"nasdaq://exports/{handle['export_id']}"
+
+    def test_json_chunks_form_one_array(self, frame):
+        handle = exports.write_export(exports.iter_chunks(frame, 3), "json")
+
+        records = json.loads(exports.read_export(handle["export_id"]))
+        assert [r["Close"] for r in records] == list(range(10))
+
+    def test_ndjson_one_record_per_line(self, frame):
+        handle = exports.write_export(exports.iter_chunks(frame, 3), "ndjson")
+
+        lines = exports.read_export(handle["export_id"]).splitlines()
+        assert len(lines) == 10
+        assert json.loads(lines[-1]) == {"Close": 9.0}
+
+    def test_xml_chunks_form_one_document(self, frame):
+        from xml.etree import ElementTree
+
+        handle = exports.write_export(exports.iter_chunks(frame, 3), "xml")
+
+        root = ElementTree.fromstring(exports.read_export(handle["export_id"]))  # noqa: S314
+        assert root.tag == "data"
+        assert [float(row.findtext("Close")) for row in root] == list(range(10))
+        assert handle["rows"] == 10
+
+    def test_empty_json_export(self):
+        handle = exports.write_export(exports.iter_chunks(pd.DataFrame()), "json")
+
+        assert exports.read_export(handle["export_id"]) == "[]"
+
+    def test_unknown_export_id(self):
+        with pytest.raises(ValueError, match="Invalid export id"):
+            exports.read_export("../secrets")
+        with pytest.raises(ValueError, match="not found"):
+            exports.read_export("0" * 32)
+
+    def test_expired_exports_are_pruned(self, frame, monkeypatch):
+        old = exports.write_export(exports.iter_chunks(frame), "csv")
+        monkeypatch.setattr(exports, "EXPORT_TTL_SECONDS", -1)
+
+        exports.write_export(exports.iter_chunks(frame), "csv")
+
+        with pytest.raises(ValueError, match="not found"):
+            exports.find_export(old["export_id"])
+
+
+class TestColumnarExport:
+    def test_parquet_round_trip(self, frame):
+        handle = exports.write_export(
+            exports.iter_chunks(frame, 3), "parquet", compression="zstd"
+        )
+
+        result = pd.read_parquet(handle["path"])
+        pd.testing.assert_frame_equal(result, frame, check_freq=False)
+        assert isinstance(exports.read_export(handle["export_id"]), bytes)
+
+    def test_arrow_round_trip(self, frame):
+        handle = exports.write_export(exports.iter_chunks(frame, 3), "arrow")
+
+        result = pd.read_feather(handle["path"])
+        pd.testing.assert_frame_equal(result, frame, check_freq=False)
+        assert handle["rows"] == 10
+
+    def test_invalid_compression(self, frame):
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            exports.write_export(
+                exports.iter_chunks(frame), "arrow", compression="gzip"
+            )
+        with pytest.raises(ValueError, match="not supported for csv"):
+            exports.write_export(exports.iter_chunks(frame), "csv", compression="zstd")
+
+    def test_project_columns(self, frame):
+        frame["Open"] = frame["Close"]
+
+        assert list(exports.project(frame, ["Open"]).columns) == ["Open"]
+        with pytest.raises(ValueError, match="Unknown columns: High"):
+            exports.project(frame, ["High"])
@@ -0,0 +1,331 @@
+"""
+Tests for the World Bank indicator helpers
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os.resources.world_data_bank import indicators
+from nasdaq_data_link_mcp_os.resources.world_data_bank.metadata import (
+    IndicatorMetadata,
+)
+from nasdaq_data_link_mcp_os.resources.world_data_bank.search_index import (
+    IndicatorIndex,
+)
+
+METADATA_DF = pd.DataFrame(
+    {
+        "series_id": ["NY.GDP.MKTP.CD", "SP.POP.TOTL"],
+        "name": ["GDP (current US$)", "Population, total"],
+        "description": ["Gross domestic product", "Total population"],
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_metadata_cache():
+    indicators.invalidate_indicator_metadata()
+    yield
+    indicators.invalidate_indicator_metadata()
+
+
+class TestIndicatorMetadataCache:
+    def test_metadata_downloaded_once(self):
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF) as mock_get:
+            first = indicators.load_indicator_metadata()
+            second = indicators.load_indicator_metadata()
+
+        assert first is second
+        assert first["SP.POP.TOTL"]["name"] == "Population, total"
+        assert isinstance(first, IndicatorMetadata)
+        mock_get.assert_called_once_with("WB/METADATA")
+
+    def test_invalidate_forces_download(self):
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF) as mock_get:
+            indicators.load_indicator_metadata()
+            indicators.invalidate_indicator_metadata()
+            indicators.load_indicator_metadata()
+
+        assert mock_get.call_count == 2
+
+    def test_ttl_expiry(self, monkeypatch):
+        monkeypatch.setattr(indicators, "METADATA_TTL_SECONDS", 0)
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF) as mock_get:
+            indicators.load_indicator_metadata()
+            indicators.load_indicator_metadata()
+
+        assert mock_get.call_count == 2
+
+    def test_failed_download_is_not_cached(self):
+        with patch("nasdaqdatalink.get_table", side_effect=Exception("boom")):
+            assert indicators.load_indicator_metadata() == {}
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF) as mock_get:
+            assert "NY.GDP.MKTP.CD" in indicators.load_indicator_metadata()
+
+        mock_get.assert_called_once()
+
+    def test_snapshot_skips_download(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            indicators, "METADATA_SNAPSHOT_PATH", str(tmp_path / "wb.json")
+        )
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF):
+            indicators.load_indicator_metadata()
+
+        indicators.invalidate_indicator_metadata()
+        with patch("nasdaqdatalink.get_table") as mock_get:
+            metadata = indicators.load_indicator_metadata()
+
+        mock_get.assert_not_called()
+        assert "SP.POP.TOTL" in metadata
+
+    def test_snapshot_expires_by_fetch_time(self, monkeypatch, tmp_path):
+        path = tmp_path / "wb.json"
+        monkeypatch.setattr(indicators, "METADATA_SNAPSHOT_PATH", str(path))
+        monkeypatch.setattr(indicators, "METADATA_TTL_SECONDS", 100)
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF):
+            indicators.load_indicator_metadata()
+        snapshot = json.loads(path.read_text())
+        snapshot["fetched_at"] -= 90
+        path.write_text(json.dumps(snapshot))
+
+        indicators.invalidate_indicator_metadata()
+        with patch("nasdaqdatalink.get_table") as mock_get:
+            indicators.load_indicator_metadata()
+
+        mock_get.assert_not_called()
+        assert time.monotonic() - indicators._metadata_loaded_at >= 90
+
+    def test_search_reuses_cached_metadata(self):
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF) as mock_get:
+            indicators.search_indicators("population")
+            indicators.search_indicators("gdp")
+
+        mock_get.assert_called_once()
+
+
+def _iterrows_conversion(metadata_df):
+    """The row-by-row conversion IndicatorMetadata.from_frame replaced."""
+    metadata_dict = {}
+    for _, row in metadata_df.iterrows():
+        series_id = row.get("series_id", "")
+        if series_id:
+            metadata_dict[series_id] = {
+                "name": row.get("name", ""),
+                "description": row.get("description", ""),
+            }
+    return metadata_dict
+
+
+def _best_of(func, *args, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestIndicatorMetadataStore:
+    def test_from_frame_matches_row_conversion(self):
+        frame = pd.DataFrame(
+            {
+                "series_id": ["A.1", "", "B.2", "A.1"],
+                "name": ["first", "skipped", "second", "first again"],
+                "description": ["d1", "d0", None, "d3"],
+            }
+        )
+        metadata = IndicatorMetadata.from_frame(frame)
+
+        assert len(metadata) == 2
+        assert metadata["A.1"] == {"name": "first again", "description": "d3"}
+        assert metadata["B.2"] == {"name": "second", "description": ""}
+        assert metadata.name("missing", "fallback") == "fallback"
+        assert "" not in metadata
+
+    def test_dict_round_trip(self):
+        metadata = IndicatorMetadata.from_frame(METADATA_DF)
+        restored = IndicatorMetadata.from_dict(metadata.to_dict())
+
+        assert dict(restored) == dict(metadata)
+
+    def test_from_frame_benchmark(self):
+        rows = 5000
+        frame = pd.DataFrame(
+            {
+                "series_id": [f"IND.{i:05d}" for i in range(rows)],
+                "name": [f"Indicator {i}" for i in range(rows)],
+                "description": [f"Description of indicator {i}" for i in range(rows)],
+            }
+        )
+
+        legacy = _best_of(_iterrows_conversion, frame)
+        vectorized = _best_of(IndicatorMetadata.from_frame, frame)
+
+        assert dict(IndicatorMetadata.from_frame(frame)) == _iterrows_conversion(frame)
+        # iterrows is typically 50-100x slower; pin a conservative 5x floor
+        assert legacy / vectorized >= 5
+
+
+class TestIndicatorSearchIndex:
+    @pytest.fixture
+    def index(self):
+        return IndicatorIndex(
+            [
+                "NY.GDP.MKTP.CD",
+                "NY.GDP.PCAP.CD",
+                "EN.ATM.CO2E.KT",
+                "SP.POP.TOTL",
+            ],
+            [
+                "GDP (current US$)",
+                "GDP per capita (current US$)",
+                "CO2 emissions (kt)",
+                "Population, total",
+            ],
+            [
+                "Gross domestic product at purchaser's prices",
+                "Gross domestic product divided by midyear population",
+                "Carbon dioxide emissions from burning fossil fuels",
+                "Total population counts all residents",
+            ],
+        )
+
+    def test_multi_term_and(self, index):
+        results = [series_id for series_id, _ in index.search("gdp capita")]
+        assert results == ["NY.GDP.PCAP.CD"]
+
+    def test_prefix_match(self, index):
+        results = [series_id for series_id, _ in index.search("emiss")]
+        assert results == ["EN.ATM.CO2E.KT"]
+
+    def test_name_match_outranks_description(self, index):
+        results = [series_id for series_id, _ in index.search("population")]
+        assert results[0] == "SP.POP.TOTL"
+        assert "NY.GDP.PCAP.CD" in results
+
+    def test_exact_code_ranks_first(self, index):
+        results = index.search("NY.GDP.MKTP.CD")
+        assert results[0][0] == "NY.GDP.MKTP.CD"
+
+    def test_no_match(self, index):
+        assert index.search("inflation") == []
+        assert index.search("") == []
+
+    def test_limit(self, index):
+        assert len(index.search("gdp", limit=1)) == 1
+        assert len(index.search("gdp", limit=None)) == 2
+
+
+class TestIndicatorLookups:
+    def test_search_indicators_ranked(self):
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF):
+            results = indicators.search_indicators("total population")
+
+        assert results == ["SP.POP.TOTL: Population, total - Total population"]
+
+    def test_list_all_indicators(self):
+        with patch("nasdaqdatalink.get_table", return_value=METADATA_DF):
+            results = indicators.list_all_indicators()
+
+        assert len(results) == 2
+        assert results[0].startswith("NY.GDP.MKTP.CD: GDP (current US$)")
+
+    def test_get_indicator_value_resolves_keyword(self):
+        data_df = pd.DataFrame({"year": [2020, 2021], "value": [1.0, 2.0]})
+
+        def fake_get_table(code, **kwargs):
+            return METADATA_DF if code == "WB/METADATA" else data_df
+
+        with patch("nasdaqdatalink.get_table", side_effect=fake_get_table) as mock:
+            result = indicators.get_indicator_value("ITA", "population")
+
+        assert result["indicator"] == "SP.POP.TOTL"
+        assert result["year"] == 2021
+        mock.assert_called_with("WB/DATA", series_id="SP.POP.TOTL", country_code="ITA")
+
+
+PANEL_DF = pd.DataFrame(
+    {
+        "series_id": ["SP.POP.TOTL"] * 4 + ["NY.GDP.MKTP.CD"] * 3,
+        "country_code": ["ITA", "ITA", "FRA", "FRA", "ITA", "ITA", "FRA"],
+        "year": [2020, 2021, 2020, 2021, 2020, 2021, 2020],
+        "value": [59.0, 58.0, 67.0, 67.5, 1.9, None, 2.6],
+    }
+)
+
+
+class TestIndicatorPanel:
+    @pytest.fixture
+    def fake_get_table(self, monkeypatch):
+        calls = []
+
+        def fake(code, **params):
+            calls.append((code, params))
+            return METADATA_DF if code == "WB/METADATA" else PANEL_DF
+
+        monkeypatch.setattr(indicators.client, "get_table", fake)
+        return calls
+
+    def test_one_request_for_all_combinations(self, fake_get_table):
+        indicators.get_indicator_panel(
+            ["Italy", "FRA"], ["population", "NY.GDP.MKTP.CD"], start_year=2020
+        )
+
+        data_calls = [params for code, params in fake_get_table if code == "WB/DATA"]
+        assert data_calls == [
+            {
+                "paginate": True,
+                "country_code": "ITA,FRA",
+                "series_id": "SP.POP.TOTL,NY.GDP.MKTP.CD",
+                "year.gte": 2020,
+            }
+        ]
+
+    def test_panel_is_pivoted(self, fake_get_table):
+        panel = indicators.fetch_indicator_panel(
+            ["ITA", "FRA"], ["SP.POP.TOTL", "NY.GDP.MKTP.CD"]
+        )
+
+        assert panel.index.names == ["country_code", "year"]
+        assert list(panel.columns) == ["NY.GDP.MKTP.CD", "SP.POP.TOTL"]
+        assert panel.loc[("ITA", 2021), "SP.POP.TOTL"] == 58.0
+
+    def test_latest_skips_missing_values(self, fake_get_table):
+        result = indicators.get_indicator_panel(
+            ["Italy", "France"], ["NY.GDP.MKTP.CD", "SP.POP.TOTL"]
+        )
+
+        latest = {(r["country_code"], r["series_id"]): r for r in result["latest"]}
+        assert latest[("ITA", "NY.GDP.MKTP.CD")]["year"] == 2020
+        assert latest[("FRA", "SP.POP.TOTL")]["value"] == 67.5
+        assert result["countries"] == {"Italy": "ITA", "France": "FRA"}
+        assert len(result["panel"]) == 4
+
+    def test_unknown_country(self, fake_get_table):
+        result = indicators.get_indicator_panel(["Atlantis"], ["SP.POP.TOTL"])
+
+        assert result == "Unknown country: Atlantis"
+        assert fake_get_table == []
+
+    def test_unknown_indicator(self, fake_get_table):
+        result = indicators.get_indicator_panel(["Italy"], ["inflation"])
+
+        assert result.startswith("No indicators found matching 'inflation'")
+
+    def test_empty_result(self, monkeypatch):
+        monkeypatch.setattr(
+            indicators.client,
+            "get_table",
+            lambda code, **params: (
+                METADATA_DF if code == "WB/METADATA" else PANEL_DF.iloc[:0]
+            ),
+        )
+
+        panel = indicators.fetch_indicator_panel(["ITA"], ["SP.POP.TOTL"])
+
+        assert panel.empty
+        assert indicators.latest_values(panel).empty
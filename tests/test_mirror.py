@@ -0,0 +1,222 @@
+"""
+Tests for the local datatable mirror
+"""
+
+import json
+import os
+import time
+import zipfile
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os import client, mirror
+from nasdaq_data_link_mcp_os.mirror import TableMirror
+
+pytest.importorskip("pyarrow")
+
+RD_ROWS = pd.DataFrame(
+    {
+        "symbol": ["AAPL", "MSFT", "IBM", "ORCL"],
+        "figi": ["BBG1", "BBG2", "BBG3", "BBG4"],
+        "exchange": ["NASDAQ", "NASDAQ", "NYSE", "NYSE"],
+        "sector": ["Tech", "Tech", "Tech", "Software"],
+        "cusips": ["037833100", "594918104", "459200101", "882508104"],
+    }
+)
+# Column types reported by the datatable metadata
+COLUMN_TYPES = {
+    "NDAQ/RD": {
+        "symbol": "String",
+        "figi": "String",
+        "exchange": "String",
+        "sector": "String",
+        "cusips": "String",
+    },
+    "NDAQ/STAT": {"symbol": "String", "high52week_date": "Date"},
+}
+
+
+@pytest.fixture(autouse=True)
+def column_types():
+    with patch.object(
+        TableMirror, "_column_types", lambda self, code: COLUMN_TYPES.get(code, {})
+    ):
+        yield
+
+
+def fake_export(frame):
+    def download(self, code, path):
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(f"{code.replace('/', '_')}.csv", frame.to_csv(index=False))
+
+    return download
+
+
+@pytest.fixture
+def table_mirror(tmp_path):
+    store = TableMirror(str(tmp_path), tables=["NDAQ/RD"], ttl=3600)
+    with patch.object(TableMirror, "_download", fake_export(RD_ROWS)):
+        store.refresh("NDAQ/RD")
+    return store
+
+
+class TestRefresh:
+    def test_refresh_writes_parquet_and_metadata(self, table_mirror, tmp_path):
+        assert os.path.exists(tmp_path / "NDAQ_RD.parquet")
+        meta = json.loads((tmp_path / "NDAQ_RD.json").read_text())
+        assert meta["rows"] == 4
+        assert not [p for p in os.listdir(tmp_path) if p.endswith((".zip", ".tmp"))]
+
+    def test_fresh_until_ttl(self, table_mirror):
+        assert table_mirror.is_fresh("ndaq/rd")
+        table_mirror.ttl = 0
+        assert not table_mirror.is_fresh("NDAQ/RD")
+
+    def test_reloaded_from_disk(self, table_mirror, tmp_path):
+        reopened = TableMirror(str(tmp_path), tables=["NDAQ/RD"], ttl=3600)
+
+        result = reopened.lookup("NDAQ/RD", {"symbol": "IBM"})
+
+        assert result["figi"].tolist() == ["BBG3"]
+
+    def test_string_columns_keep_leading_zeros(self, table_mirror):
+        result = table_mirror.lookup("NDAQ/RD", {"symbol": "AAPL"})
+
+        assert result["cusips"].tolist() == ["037833100"]
+
+    def test_date_columns_are_parsed(self, tmp_path):
+        store = TableMirror(str(tmp_path), tables=["NDAQ/STAT"], ttl=3600)
+        stat = pd.DataFrame({"symbol": ["AAPL"], "high52week_date": ["2024-12-26"]})
+        with patch.object(TableMirror, "_download", fake_export(stat)):
+            store.refresh("NDAQ/STAT")
+
+        result = store.lookup("NDAQ/STAT", {"symbol": "AAPL"})
+
+        assert result["high52week_date"].tolist() == [pd.Timestamp("2024-12-26")]
+
+    def test_failed_refresh_is_not_retried_immediately(self, table_mirror):
+        table_mirror.ttl = 0
+        attempts = []
+
+        def failing_download(self, code, path):
+            attempts.append(code)
+            raise RuntimeError("no bulk export access")
+
+        with patch.object(TableMirror, "_download", failing_download):
+            table_mirror.lookup("NDAQ/RD", {"symbol": "AAPL"})
+            deadline = time.monotonic() + 5
+            while table_mirror.stats()["errors"] < 1:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            while table_mirror.stats()["refreshing"]:
+                time.sleep(0.01)
+            table_mirror.lookup("NDAQ/RD", {"symbol": "AAPL"})
+
+        assert attempts == ["NDAQ/RD"]
+
+    def test_refresh_stale_skips_fresh_tables(self, table_mirror):
+        assert table_mirror.refresh_stale() == {"NDAQ/RD": "fresh"}
+
+
+class TestLookup:
+    def test_primary_key_lookup(self, table_mirror):
+        result = table_mirror.lookup("NDAQ/RD", {"symbol": "MSFT,AAPL"})
+
+        assert result["symbol"].tolist() == ["AAPL", "MSFT"]
+
+    def test_combined_filters(self, table_mirror):
+        result = table_mirror.lookup(
+            "NDAQ/RD", {"exchange": "NYSE", "sector": "Software"}
+        )
+
+        assert result["symbol"].tolist() == ["ORCL"]
+
+    def test_column_projection(self, table_mirror):
+        result = table_mirror.lookup(
+            "NDAQ/RD", {"figi": "BBG2", "qopts.columns": "symbol,exchange"}
+        )
+
+        assert result.to_dict("records") == [{"symbol": "MSFT", "exchange": "NASDAQ"}]
+
+    def test_range_filter(self, table_mirror):
+        result = table_mirror.lookup("NDAQ/RD", {"symbol.gte": "MSFT"})
+
+        assert sorted(result["symbol"]) == ["MSFT", "ORCL"]
+
+    def test_no_match_is_empty_frame(self, table_mirror):
+        result = table_mirror.lookup("NDAQ/RD", {"symbol": "NOPE"})
+
+        assert result is not None
+        assert result.empty
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"qopts.per_page": 10},
+            {"unknown": "x"},
+            {"symbol.ne": "AAPL"},
+            {"qopts.columns": "symbol,unknown"},
+        ],
+    )
+    def test_unsupported_parameters_fall_back(self, table_mirror, params):
+        assert table_mirror.lookup("NDAQ/RD", params) is None
+
+    def test_unmirrored_table(self, table_mirror):
+        assert table_mirror.lookup("NDAQ/FS", {"symbol": "AAPL"}) is None
+
+    def test_stale_table_refreshes_in_background(self, table_mirror):
+        table_mirror.ttl = 0
+        updated = pd.concat([RD_ROWS, RD_ROWS.iloc[:1].assign(symbol="NVDA")])
+
+        with patch.object(TableMirror, "_download", fake_export(updated)):
+            assert table_mirror.lookup("NDAQ/RD", {"symbol": "NVDA"}) is None
+            deadline = time.monotonic() + 5
+            while table_mirror.stats()["refreshes"] < 2:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+        table_mirror.ttl = 3600
+        assert len(table_mirror.lookup("NDAQ/RD", {"symbol": "NVDA"})) == 1
+
+
+class TestClientIntegration:
+    def test_get_table_answers_from_mirror(self, table_mirror, monkeypatch):
+        monkeypatch.setattr(mirror, "table_mirror", table_mirror)
+
+        with patch("nasdaqdatalink.get_table") as mock_get:
+            result = client.get_table("NDAQ/RD", symbol="AAPL")
+
+        assert result["figi"].tolist() == ["BBG1"]
+        mock_get.assert_not_called()
+
+    def test_get_table_falls_back_to_network(self, table_mirror, monkeypatch):
+        monkeypatch.setattr(mirror, "table_mirror", table_mirror)
+        frame = pd.DataFrame({"symbol": ["AAPL"]})
+
+        with patch("nasdaqdatalink.get_table", return_value=frame) as mock_get:
+            client.get_table("NDAQ/RD", **{"qopts.per_page": 1})
+
+        mock_get.assert_called_once()
+
+    def test_cache_false_skips_mirror(self, table_mirror, monkeypatch):
+        monkeypatch.setattr(mirror, "table_mirror", table_mirror)
+        frame = pd.DataFrame({"symbol": ["AAPL"]})
+
+        with patch("nasdaqdatalink.get_table", return_value=frame) as mock_get:
+            client.get_table("NDAQ/RD", symbol="AAPL", cache=False)
+
+        mock_get.assert_called_once()
+
+    def test_mirror_keeps_live_dtypes(self, table_mirror, monkeypatch):
+        monkeypatch.setattr(mirror, "table_mirror", table_mirror)
+
+        plain = client.get_table("NDAQ/RD", exchange="NASDAQ", normalize=False)
+        normalized = client.get_table("NDAQ/RD", exchange="NASDAQ", normalize=True)
+
+        assert plain["exchange"].dtype == RD_ROWS["exchange"].dtype
+        assert normalized["exchange"].dtype == "category"
+
+    def test_disabled_without_directory(self):
+        assert TableMirror(None).lookup("NDAQ/RD", {"symbol": "AAPL"}) is None
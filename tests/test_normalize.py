@@ -0,0 +1,95 @@
+"""
+Tests for post-fetch dtype normalization
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from nasdaq_data_link_mcp_os import client, normalize
+from nasdaq_data_link_mcp_os.normalize import normalize_frame
+
+
+def fund_frame(rows: int = 1000) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ticker": [f"T{i % 10}" for i in range(rows)],
+            "investment_company_type": ["N-1A"] * rows,
+            "fund_name": [f"Fund {i}" for i in range(rows)],
+            "date": ["2024-01-02"] * rows,
+            "shares": np.arange(rows, dtype="int64"),
+            "nav": np.full(rows, 10.5),
+            "price": np.linspace(1.01, 9.99, rows),
+        }
+    )
+
+
+class TestNormalizeFrame:
+    def test_conversions(self):
+        frame = fund_frame()
+
+        result = normalize_frame(frame)
+
+        assert result["ticker"].dtype == "category"
+        assert result["investment_company_type"].dtype == "category"
+        assert result["fund_name"].dtype == frame["fund_name"].dtype
+        assert result["date"].dtype.kind == "M"
+        assert result["shares"].dtype == "int16"
+        assert result["nav"].dtype == "float32"
+        assert result["price"].dtype == "float64"
+        pd.testing.assert_series_equal(
+            result["price"], frame["price"], check_names=False
+        )
+
+    def test_reports_bytes_saved(self):
+        frame = fund_frame()
+        before = normalize.normalization_stats()["bytes_saved"]
+
+        result = normalize_frame(frame)
+
+        report = result.attrs["normalize"]
+        assert report["bytes_saved"] == report["bytes_before"] - report["bytes_after"]
+        assert report["bytes_after"] < report["bytes_before"]
+        saved = normalize.normalization_stats()["bytes_saved"] - before
+        assert saved == report["bytes_saved"]
+
+    def test_input_frame_is_untouched(self):
+        frame = fund_frame(10)
+
+        normalize_frame(frame)
+
+        assert frame["ticker"].dtype != "category"
+        assert "normalize" not in frame.attrs
+
+    def test_schema_types_are_applied(self):
+        frame = pd.DataFrame(
+            {"symbol": ["MSFT", "AAPL"], "dimension": ["MRY"] * 2, "assets": [1.0, 2.0]}
+        )
+
+        result = normalize_frame(frame, "NDAQ/BS")
+
+        assert result["assets"].dtype.kind == "i"
+        assert result["dimension"].dtype == "category"
+
+    def test_typed_doubles_keep_exact_values(self):
+        frame = pd.DataFrame(
+            {"symbol": ["MSFT", "AAPL"], "pe": [28.37, 31.12], "ps": ["1.5", "2.25"]}
+        )
+
+        result = normalize_frame(frame, "NDAQ/FS")
+
+        assert result["pe"].tolist() == [28.37, 31.12]
+        assert result["ps"].tolist() == [1.5, 2.25]
+        assert result["ps"].dtype == "float32"
+
+
+class TestClientNormalization:
+    def test_get_table_opt_in(self):
+        frame = fund_frame(100)
+        with patch("nasdaqdatalink.get_table", return_value=frame):
+            plain = client.get_table("NFN/MFRPH", ticker="T1")
+            normalized = client.get_table("NFN/MFRPH", ticker="T1", normalize=True)
+
+        assert plain["ticker"].dtype != "category"
+        assert normalized["ticker"].dtype == "category"
@@ -0,0 +1,137 @@
+"""
+Tests for SQL queries over cached and mirrored datatables
+"""
+
+import json
+import sys
+import zipfile
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os import client, mirror, query
+from nasdaq_data_link_mcp_os.mirror import TableMirror
+
+RTAT = pd.DataFrame(
+    {
+        "date": pd.to_datetime(["2024-01-02", "2024-01-02", "2024-01-03"]),
+        "ticker": ["AAPL", "TSLA", "AAPL"],
+        "activity": [0.02, 0.05, 0.03],
+    }
+)
+ACTIONS = pd.DataFrame(
+    {
+        "symbol": ["AAPL", "MSFT"],
+        "date": ["2024-01-03", "2024-01-03"],
+        "action": ["dividend", "split"],
+    }
+)
+
+
+@pytest.fixture
+def cached_tables():
+    with patch("nasdaqdatalink.get_table", return_value=RTAT):
+        client.get_table("NDAQ/RTAT", date="2024-01-02,2024-01-03")
+    with patch("nasdaqdatalink.get_table", return_value=RTAT.iloc[:1]):
+        client.get_table("NDAQ/RTAT", ticker="AAPL")
+
+
+def test_table_name():
+    assert query.table_name("NDAQ/RTAT10") == "ndaq_rtat10"
+    assert query.table_name("WB/METADATA") == "wb_metadata"
+
+
+def test_available_tables_from_cache(cached_tables):
+    tables = query.available_tables()
+
+    assert tables == [
+        {
+            "name": "ndaq_rtat",
+            "code": "NDAQ/RTAT",
+            "source": "cache",
+            "rows": 3,
+            "columns": ["date", "ticker", "activity"],
+        }
+    ]
+
+
+def test_missing_duckdb_is_reported():
+    with (
+        patch.dict(sys.modules, {"duckdb": None}),
+        pytest.raises(ImportError, match=r"\[sql\]"),
+    ):
+        query.run_query("SELECT 1")
+
+
+class TestRunQuery:
+    @pytest.fixture(autouse=True)
+    def require_duckdb(self):
+        pytest.importorskip("duckdb")
+
+    def test_aggregates_cached_rows(self, cached_tables):
+        result, truncated = query.run_query(
+            "SELECT ticker, count(*) AS days FROM ndaq_rtat "
+            "GROUP BY ticker ORDER BY ticker"
+        )
+
+        assert result.to_dict("records") == [
+            {"ticker": "AAPL", "days": 2},
+            {"ticker": "TSLA", "days": 1},
+        ]
+        assert not truncated
+
+    def test_joins_mirrored_and_cached_tables(self, cached_tables, tmp_path):
+        pytest.importorskip("pyarrow")
+        store = TableMirror(str(tmp_path), tables=["NDAQ/CA"], ttl=3600)
+
+        def download(self, code, path):
+            with zipfile.ZipFile(path, "w") as archive:
+                archive.writestr("NDAQ_CA.csv", ACTIONS.to_csv(index=False))
+
+        with (
+            patch.object(TableMirror, "_download", download),
+            patch.object(TableMirror, "_column_types", lambda self, code: {}),
+        ):
+            store.refresh("NDAQ/CA")
+
+        with patch.object(mirror, "table_mirror", store):
+            result, _ = query.run_query(
+                "SELECT r.ticker, r.activity, c.action FROM ndaq_rtat r "
+                "JOIN ndaq_ca c ON r.ticker = c.symbol "
+                "AND r.date = CAST(c.date AS TIMESTAMP)"
+            )
+
+        assert result.to_dict("records") == [
+            {"ticker": "AAPL", "activity": 0.03, "action": "dividend"}
+        ]
+
+    def test_result_is_capped(self, cached_tables):
+        result, truncated = query.run_query("SELECT * FROM ndaq_rtat", max_rows=2)
+
+        assert len(result) == 2
+        assert truncated
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "DROP TABLE ndaq_rtat",
+            "SELECT 1; SELECT 2",
+            "COPY (SELECT 1) TO '/tmp/out.csv'",
+        ],
+    )
+    def test_only_single_select_allowed(self, sql):
+        with pytest.raises(ValueError, match="single SELECT"):
+            query.run_query(sql)
+
+    def test_files_outside_mirror_are_blocked(self):
+        with pytest.raises(Exception, match="Permission"):
+            query.run_query("SELECT * FROM read_csv('/etc/hostname')")
+
+    def test_tool_returns_json(self, cached_tables):
+        from nasdaq_data_link_mcp_os.server import query_tables
+
+        payload = json.loads(query_tables("SELECT ticker FROM ndaq_rtat LIMIT 1"))
+
+        assert payload["rows"] == 1
+        assert payload["data"]["columns"] == ["ticker"]
@@ -0,0 +1,148 @@
+"""
+Tests for incremental date-range fetching of time-series datasets
+"""
+
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os import range_store
+from nasdaq_data_link_mcp_os.range_store import (
+    TimeSeriesStore,
+    merge_intervals,
+    subtract_intervals,
+)
+
+D = date.fromisoformat
+
+
+def daily_frame(start: str, end: str) -> pd.DataFrame:
+    index = pd.date_range(start, end, freq="D", name="Date")
+    return pd.DataFrame({"Close": range(len(index))}, index=index).astype(float)
+
+
+class FakeFetcher:
+    """Records requested ranges and serves them from a full daily history."""
+
+    def __init__(self, start="2010-01-01", end="2020-12-31"):
+        self.history = daily_frame(start, end)
+        self.calls = []
+
+    def __call__(self, dataset_code, start_date=None, end_date=None):
+        self.calls.append((start_date, end_date))
+        return self.history.loc[start_date:end_date]
+
+
+class TestIntervals:
+    def test_subtract_intervals(self):
+        covered = [
+            (D("2015-01-01"), D("2015-12-31")),
+            (D("2017-01-01"), D("2017-06-30")),
+        ]
+
+        gaps = subtract_intervals(D("2014-06-01"), D("2018-01-01"), covered)
+
+        assert gaps == [
+            (D("2014-06-01"), D("2014-12-31")),
+            (D("2016-01-01"), D("2016-12-31")),
+            (D("2017-07-01"), D("2018-01-01")),
+        ]
+
+    def test_subtract_fully_covered(self):
+        covered = [(D("2010-01-01"), D("2020-01-01"))]
+
+        assert subtract_intervals(D("2012-01-01"), D("2013-01-01"), covered) == []
+
+    def test_merge_touching_intervals(self):
+        merged = merge_intervals(
+            [(D("2012-01-01"), D("2012-12-31")), (D("2010-01-01"), D("2011-12-31"))]
+        )
+
+        assert merged == [(D("2010-01-01"), D("2012-12-31"))]
+
+
+class TestTimeSeriesStore:
+    def test_overlapping_request_fetches_only_gap(self):
+        store = TimeSeriesStore()
+        fetch = FakeFetcher()
+
+        store.get("WIKI/AAPL", fetch, "2015-01-01", "2016-12-31")
+        result = store.get("WIKI/AAPL", fetch, "2014-01-01", "2016-06-30")
+
+        assert fetch.calls == [
+            ("2015-01-01", "2016-12-31"),
+            ("2014-01-01", "2014-12-31"),
+        ]
+        expected = fetch.history.loc["2014-01-01":"2016-06-30"]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_contained_request_is_served_locally(self):
+        store = TimeSeriesStore()
+        fetch = FakeFetcher()
+
+        store.get("WIKI/AAPL", fetch, "2010-01-01", "2020-12-31")
+        result = store.get("WIKI/AAPL", fetch, "2015-03-01", "2015-03-31")
+
+        assert len(fetch.calls) == 1
+        assert len(result) == 31
+
+    def test_unbounded_request_passes_no_dates(self):
+        store = TimeSeriesStore()
+        fetch = FakeFetcher()
+
+        store.get("WIKI/AAPL", fetch)
+        store.get("WIKI/AAPL", fetch, "2012-01-01")
+
+        assert fetch.calls == [(None, None)]
+        assert store.coverage("wiki/aapl") == [(date.min, date.today())]
+
+    def test_provisional_tail_is_refetched(self, monkeypatch):
+        monkeypatch.setattr(range_store, "TAIL_TTL_SECONDS", -1)
+        store = TimeSeriesStore()
+        fetch = FakeFetcher()
+
+        store.get("WIKI/AAPL", fetch, "2020-01-01")
+        store.get("WIKI/AAPL", fetch, "2020-01-01")
+
+        yesterday = date.today() - timedelta(days=1)
+        assert fetch.calls == [("2020-01-01", None), (yesterday.isoformat(), None)]
+
+    def test_series_expire_with_dataset_ttl(self, monkeypatch):
+        monkeypatch.setattr(range_store, "ttl_for", lambda code: -1)
+        store = TimeSeriesStore()
+        fetch = FakeFetcher()
+
+        store.get("WIKI/AAPL", fetch, "2015-01-01", "2015-12-31")
+        store.get("WIKI/AAPL", fetch, "2015-01-01", "2015-12-31")
+
+        assert fetch.calls == [("2015-01-01", "2015-12-31")] * 2
+
+    def test_non_date_index_bypasses_store(self):
+        store = TimeSeriesStore()
+        frame = pd.DataFrame({"Date": ["2020-01-01"], "Close": [100.0]})
+
+        result = store.get("WIKI/AAPL", lambda code, **params: frame)
+
+        assert result is frame
+        assert store.coverage("WIKI/AAPL") == []
+
+    def test_eviction_by_bytes(self):
+        store = TimeSeriesStore(max_bytes=1)
+        fetch = FakeFetcher()
+
+        store.get("WIKI/AAPL", fetch, "2015-01-01", "2015-12-31")
+        store.get("WIKI/MSFT", fetch, "2015-01-01", "2015-12-31")
+
+        assert store.coverage("WIKI/AAPL") == []
+        assert store.coverage("WIKI/MSFT") != []
+
+    def test_fetch_errors_propagate(self):
+        store = TimeSeriesStore()
+
+        def failing_fetch(code, **params):
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError, match="upstream down"):
+            store.get("WIKI/AAPL", failing_fetch, "2015-01-01", "2015-12-31")
+        assert store.coverage("WIKI/AAPL") == []
@@ -0,0 +1,179 @@
+"""
+Tests for the per-key rate limiter and the retrying HTTP adapter
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from nasdaq_data_link_mcp_os import client, ratelimit
+from nasdaq_data_link_mcp_os.ratelimit import TokenBucket
+
+
+def response(status, headers=None):
+    resp = MagicMock(status_code=status)
+    resp.headers = headers or {}
+    return resp
+
+
+def prepared(api_key="key-a"):
+    return requests.Request(
+        "GET",
+        "https://data.nasdaq.com/api/v3/datasets/WIKI/AAPL.json",
+        headers={"x-api-token": api_key},
+    ).prepare()
+
+
+@pytest.fixture(autouse=True)
+def fresh_buckets():
+    ratelimit.reset_buckets()
+    yield
+    ratelimit.reset_buckets()
+
+
+class TestTokenBucket:
+    def test_burst_is_not_delayed(self):
+        bucket = TokenBucket(rate=1, burst=5)
+
+        assert sum(bucket.acquire() for _ in range(5)) == 0
+
+    def test_waits_for_refill_when_empty(self):
+        bucket = TokenBucket(rate=20, burst=1)
+        bucket.acquire()
+
+        started = time.monotonic()
+        bucket.acquire()
+
+        assert time.monotonic() - started >= 0.04
+
+    def test_throttle_pauses_and_halves_rate(self):
+        bucket = TokenBucket(rate=10, burst=10)
+        bucket.throttle(0.1)
+
+        assert bucket.rate == 5
+        started = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - started >= 0.09
+
+    def test_recover_restores_rate_gradually(self):
+        bucket = TokenBucket(rate=10, burst=10)
+        bucket.throttle(0)
+        bucket.recover()
+
+        assert bucket.rate == 6
+        for _ in range(10):
+            bucket.recover()
+        assert bucket.rate == 10
+
+    def test_zero_rate_disables_limiting(self):
+        bucket = TokenBucket(rate=0, burst=1)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+
+
+class TestBuckets:
+    def test_bucket_shared_per_key(self):
+        assert ratelimit.get_bucket("a") is ratelimit.get_bucket("a")
+        assert ratelimit.get_bucket("a") is not ratelimit.get_bucket("b")
+
+    def test_per_key_override(self):
+        with patch.dict(ratelimit.RATE_LIMITS, {"premium": (50.0, 100.0)}):
+            bucket = ratelimit.get_bucket("premium")
+
+        assert (bucket.max_rate, bucket.burst) == (50.0, 100.0)
+
+    def test_parse_limit_overrides(self):
+        parsed = ratelimit._parse_limit_overrides("a=10:20, b=5,,bad")
+
+        assert parsed == {"a": (10.0, 20.0), "b": (5.0, ratelimit.RATE_BURST)}
+
+
+class TestBackoff:
+    def test_full_jitter_is_capped(self):
+        delays = [ratelimit.backoff_delay(10, 0.5, 8) for _ in range(50)]
+
+        assert all(0 <= delay <= 8 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_is_honoured(self):
+        assert ratelimit.backoff_delay(0, 0.5, 8, retry_after=3) >= 3
+
+    def test_parse_retry_after(self):
+        assert ratelimit.parse_retry_after("2") == 2
+        assert ratelimit.parse_retry_after("100000") == ratelimit.MAX_RETRY_AFTER
+        assert ratelimit.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert ratelimit.parse_retry_after("soon") is None
+        assert ratelimit.parse_retry_after(None) is None
+
+
+class TestRateLimitedAdapter:
+    def adapter(self):
+        return client.get_session().get_adapter("https://data.nasdaq.com")
+
+    def test_retries_server_errors(self):
+        replies = [response(503), response(502), response(200)]
+        with (
+            patch.object(HTTPAdapter, "send", side_effect=replies) as mock_send,
+            patch.object(ratelimit, "backoff_delay", return_value=0),
+        ):
+            result = self.adapter().send(prepared())
+
+        assert result.status_code == 200
+        assert mock_send.call_count == 3
+
+    def test_gives_up_after_configured_retries(self):
+        with (
+            patch.object(HTTPAdapter, "send", return_value=response(500)) as mock_send,
+            patch.object(ratelimit, "backoff_delay", return_value=0),
+            patch("nasdaqdatalink.ApiConfig.number_of_retries", 2),
+        ):
+            result = self.adapter().send(prepared())
+
+        assert result.status_code == 500
+        assert mock_send.call_count == 3
+
+    def test_no_retry_when_disabled(self):
+        with (
+            patch.object(HTTPAdapter, "send", return_value=response(500)) as mock_send,
+            patch("nasdaqdatalink.ApiConfig.use_retries", False),
+        ):
+            self.adapter().send(prepared())
+
+        assert mock_send.call_count == 1
+
+    def test_connection_errors_are_retried(self):
+        replies = [requests.ConnectionError("reset"), response(200)]
+        with (
+            patch.object(HTTPAdapter, "send", side_effect=replies),
+            patch.object(ratelimit, "backoff_delay", return_value=0),
+        ):
+            assert self.adapter().send(prepared()).status_code == 200
+
+    def test_429_throttles_the_key_bucket(self):
+        replies = [response(429, {"Retry-After": "0"}), response(200)]
+        with patch.object(HTTPAdapter, "send", side_effect=replies):
+            self.adapter().send(prepared("key-a"))
+
+        assert ratelimit.get_bucket("key-a").rate < ratelimit.RATE_LIMIT
+        assert ratelimit.get_bucket("key-b").rate == ratelimit.RATE_LIMIT
+
+    def test_client_errors_are_not_retried(self):
+        with patch.object(HTTPAdapter, "send", return_value=response(404)) as mock_send:
+            assert self.adapter().send(prepared()).status_code == 404
+
+        assert mock_send.call_count == 1
+
+    def test_stats_count_retries(self):
+        before = ratelimit.limiter_stats()["retries"]
+        replies = [response(503), response(200)]
+        with (
+            patch.object(HTTPAdapter, "send", side_effect=replies),
+            patch.object(ratelimit, "backoff_delay", return_value=0),
+        ):
+            self.adapter().send(prepared())
+
+        assert ratelimit.limiter_stats()["retries"] == before + 1
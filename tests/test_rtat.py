@@ -0,0 +1,118 @@
+"""
+Tests for the parallel RTAT fan-out
+"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.resources.rtat import retail_activity
+from nasdaq_data_link_mcp_os.resources.rtat.retail_activity import (
+    fetch_chunks,
+    get_rtat_data,
+)
+
+DATES = "2024-01-02,2024-01-03,2024-01-04"
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """Serve one row per (date, ticker) and record every upstream request."""
+    calls = []
+    failing = set()
+    lock = threading.Lock()
+
+    def collect_pages(code, max_rows, params):
+        with lock:
+            calls.append(dict(params))
+        if params["date"] in failing:
+            raise RuntimeError(f"upstream error for {params['date']}")
+        tickers = params.get("ticker", "AAPL").split(",")
+        return pd.DataFrame(
+            [
+                {"date": date, "ticker": ticker, "activity": 0.01}
+                for date in params["date"].split(",")
+                for ticker in tickers
+            ]
+        )
+
+    monkeypatch.setattr(client, "_collect_pages", collect_pages)
+    collect_pages.calls = calls
+    collect_pages.failing = failing
+    return collect_pages
+
+
+def test_dates_and_tickers_are_chunked(pages):
+    result = fetch_chunks(
+        "NDAQ/RTAT", DATES, "AAPL,TSLA,MSFT", date_chunk_size=2, ticker_chunk_size=2
+    )
+
+    assert sorted((c["date"], c["ticker"]) for c in pages.calls) == [
+        ("2024-01-02,2024-01-03", "AAPL,TSLA"),
+        ("2024-01-02,2024-01-03", "MSFT"),
+        ("2024-01-04", "AAPL,TSLA"),
+        ("2024-01-04", "MSFT"),
+    ]
+    assert len(result) == 9
+    assert result["date"].tolist()[:2] == ["2024-01-02", "2024-01-02"]
+    assert [c["status"] for c in result.attrs["chunks"]] == ["fetched"] * 4
+    assert result.attrs["failed_chunks"] == []
+
+
+def test_cached_dates_are_skipped(pages):
+    client.get_table("NDAQ/RTAT", paginate=True, date="2024-01-02")
+    pages.calls.clear()
+
+    result = fetch_chunks("NDAQ/RTAT", DATES)
+
+    assert sorted(c["date"] for c in pages.calls) == ["2024-01-03", "2024-01-04"]
+    assert [c["status"] for c in result.attrs["chunks"]] == [
+        "cached",
+        "fetched",
+        "fetched",
+    ]
+    assert len(result) == 3
+
+
+def test_failed_chunks_are_reported(pages):
+    pages.failing.add("2024-01-03")
+
+    result = fetch_chunks("NDAQ/RTAT", DATES)
+
+    assert len(result) == 2
+    failed = result.attrs["failed_chunks"]
+    assert [c["dates"] for c in failed] == [["2024-01-03"]]
+    assert "upstream error" in failed[0]["error"]
+
+
+def test_all_chunks_failing_raises(pages):
+    pages.failing.update(DATES.split(","))
+
+    with pytest.raises(RuntimeError, match="All 3 chunks failed"):
+        fetch_chunks("NDAQ/RTAT", DATES)
+
+
+def test_default_date_chunk_size(pages, monkeypatch):
+    monkeypatch.setattr(retail_activity, "DATE_CHUNK_SIZE", 3)
+
+    fetch_chunks("NDAQ/RTAT", DATES)
+
+    assert [c["date"] for c in pages.calls] == [DATES]
+
+
+class TestGetRtatData:
+    def test_parallel_merges_and_caps_rows(self, pages):
+        result = get_rtat_data(DATES, tickers="AAPL", max_rows=2, parallel=True)
+
+        assert len(pages.calls) == 3
+        assert len(result) == 2
+        assert len(result.attrs["chunks"]) == 3
+
+    def test_parallel_failure_is_an_error_message(self, pages):
+        pages.failing.add("2024-01-02")
+
+        result = get_rtat_data("2024-01-02", parallel=True)
+
+        assert result.startswith("Error fetching RTAT data:")
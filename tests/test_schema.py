@@ -0,0 +1,109 @@
+"""
+Tests for the Equities 360 schema registry
+"""
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os.resources.common.schema import Field, TableSchema
+from nasdaq_data_link_mcp_os.resources.equities_360.balance_sheet import (
+    list_available_balance_sheet_fields,
+)
+from nasdaq_data_link_mcp_os.resources.equities_360.registry import (
+    SCHEMAS,
+    get_schema,
+)
+
+
+class TestSchemaRegistry:
+    def test_registry_covers_equities_tables(self):
+        assert set(SCHEMAS) == {
+            "NDAQ/FS",
+            "NDAQ/BS",
+            "NDAQ/CF",
+            "NDAQ/FD",
+            "NDAQ/STAT",
+            "NDAQ/RD",
+            "NDAQ/CA",
+        }
+        assert get_schema(" ndaq/bs ") is SCHEMAS["NDAQ/BS"]
+
+    def test_list_functions_are_served_from_schema(self):
+        schema = SCHEMAS["NDAQ/BS"]
+
+        assert list_available_balance_sheet_fields() == schema.to_dicts()
+        assert schema["assets"].type == "BigInt"
+        assert "symbol" in schema.primary_key
+        assert "calendardate" in schema.filterable
+
+    def test_schema_is_frozen(self):
+        schema = SCHEMAS["NDAQ/BS"]
+
+        with pytest.raises(AttributeError):
+            schema.code = "NDAQ/XX"
+        with pytest.raises(AttributeError):
+            schema["assets"].type = "String"
+        with pytest.raises(TypeError):
+            SCHEMAS["NDAQ/XX"] = schema
+
+    def test_dtype_map(self):
+        schema = SCHEMAS["NDAQ/BS"]
+
+        assert schema.dtypes["assets"] == "int64"
+        assert schema.dtypes["bvps"] == "float32"
+        assert schema.dtypes["symbol"] == "category"
+        assert "figi" in schema.dtypes
+
+
+class TestCast:
+    schema = TableSchema(
+        "TEST/T",
+        [
+            Field("symbol", "Symbol", "String"),
+            Field("assets", "Assets", "BigInt"),
+            Field("debt", "Debt", "BigInt"),
+            Field("pe", "P/E", "Double"),
+            Field("calendardate", "Date", "Date"),
+            Field("note", "Untyped"),
+        ],
+    )
+
+    def test_cast_to_compact_dtypes(self):
+        frame = pd.DataFrame(
+            {
+                "symbol": ["MSFT"] * 4,
+                "assets": [1.0, 2.0, 3.0, 4.0],
+                "debt": [1.0, None, 3.0, 4.0],
+                "pe": [30.5, 31.0, 32.0, 33.0],
+                "calendardate": ["2024-03-31"] * 4,
+                "note": ["a", "b", "c", "d"],
+            }
+        )
+
+        result = self.schema.cast(frame)
+
+        assert result["symbol"].dtype == "category"
+        assert result["assets"].dtype == "int64"
+        assert result["debt"].dtype == "float64"
+        assert result["pe"].dtype == "float32"
+        assert result["calendardate"].dtype.kind == "M"
+        assert result["note"].dtype == frame["note"].dtype
+        assert frame["assets"].dtype == "float64"
+
+    def test_inexact_doubles_stay_float64(self):
+        frame = pd.DataFrame({"pe": [28.37, None, 30.5]})
+
+        result = self.schema.cast(frame)
+
+        assert result["pe"].dtype == "float64"
+        pd.testing.assert_series_equal(result["pe"], frame["pe"])
+
+    def test_numeric_strings_are_parsed_without_rounding(self):
+        frame = pd.DataFrame({"pe": ["28.37", "30.5"]})
+
+        assert self.schema.cast(frame)["pe"].tolist() == [28.37, 30.5]
+
+    def test_unique_strings_stay_strings(self):
+        frame = pd.DataFrame({"symbol": ["A", "B", "C"]})
+
+        assert self.schema.cast(frame)["symbol"].dtype != "category"
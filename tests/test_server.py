@@ -4,6 +4,7 @@ Note: These tests focus on server integration rather than individual functions
 """
 
 import os
+import subprocess
 import sys
 
 import pytest
@@ -51,6 +52,22 @@ class TestModuleImports:
             except ImportError as e:
                 pytest.fail(f"Failed to import {module_name}: {e}")
 
+    def test_server_import_defers_heavy_modules(self):
+        """Starting the server must not load pandas, nasdaqdatalink or pycountry"""
+        code = (
+            "import sys, nasdaq_data_link_mcp_os.server; "
+            "print(','.join(m for m in ('pandas', 'nasdaqdatalink', 'pycountry') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == ""
+
 
 class TestConfigurationHandling:
     """Test configuration and environment variable handling"""
@@ -0,0 +1,90 @@
+"""
+Tests for coalescing concurrent identical requests
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from nasdaq_data_link_mcp_os import client
+from nasdaq_data_link_mcp_os.singleflight import SingleFlight
+
+
+def slow(result, calls, delay=0.2):
+    def fn():
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        return result
+
+    return fn
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+        frame = pd.DataFrame({"a": [1]})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda _: flight.do("key", slow(frame, calls)), range(8))
+            )
+
+        assert len(calls) == 1
+        assert all(r.equals(frame) for r in results)
+        # Followers receive their own copies
+        assert len({id(r) for r in results}) == 8
+        assert flight.stats() == {"executed": 1, "coalesced": 7, "in_flight": 0}
+
+    def test_errors_reach_every_waiter(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError("upstream down")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", failing)
+            started.wait()
+            follower = pool.submit(flight.do, "key", failing)
+
+            for future in (leader, follower):
+                with pytest.raises(RuntimeError, match="upstream down"):
+                    future.result()
+
+    def test_sequential_calls_are_not_remembered(self):
+        flight = SingleFlight()
+        calls = []
+
+        flight.do("key", slow(1, calls, 0))
+        flight.do("key", slow(1, calls, 0))
+
+        assert len(calls) == 2
+
+
+class TestClientCoalescing:
+    def test_uncached_get_table_is_coalesced(self):
+        calls = []
+        frame = pd.DataFrame({"series_id": ["X"]})
+
+        def fake_get_table(code, **params):
+            return slow(frame, calls)()
+
+        with (
+            patch("nasdaqdatalink.get_table", side_effect=fake_get_table),
+            ThreadPoolExecutor(max_workers=4) as pool,
+        ):
+            results = list(
+                pool.map(
+                    lambda _: client.get_table("WB/METADATA", cache=False), range(4)
+                )
+            )
+
+        assert len(calls) == 1
+        assert all(len(r) == 1 for r in results)
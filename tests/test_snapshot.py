@@ -0,0 +1,103 @@
+"""
+Tests for the joined company snapshot
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+
+from nasdaq_data_link_mcp_os.resources.equities_360.snapshot import (
+    get_company_snapshot,
+)
+
+KEYS = {"symbol": ["MSFT", "MSFT"], "calendardate": ["2023-12-31", "2024-12-31"]}
+
+TABLES = {
+    "NDAQ/FS": pd.DataFrame({**KEYS, "dimension": ["MRY", "MRY"], "pe": [30.0, 35.0]}),
+    "NDAQ/BS": pd.DataFrame(
+        {**KEYS, "dimension": ["MRY", "MRY"], "assets": [1, 2], "figi": ["F", "F"]}
+    ),
+    "NDAQ/CF": pd.DataFrame(
+        {"symbol": ["MSFT"], "calendardate": ["2024-12-31"], "dimension": ["MRY"]}
+        | {"ncfo": [5]}
+    ),
+    "NDAQ/STAT": pd.DataFrame({"symbol": ["MSFT"], "marketcap": [3e12]}),
+    "NDAQ/RD": pd.DataFrame({"symbol": ["MSFT"], "name": ["Microsoft"]}),
+}
+
+
+def fake_get_table(code, **params):
+    return TABLES[code]
+
+
+class TestCompanySnapshot:
+    @patch("nasdaq_data_link_mcp_os.resources.equities_360.snapshot.client")
+    def test_tables_are_aligned_into_one_frame(self, mock_client):
+        mock_client.get_table.side_effect = fake_get_table
+
+        result = get_company_snapshot(symbol="MSFT")
+
+        assert mock_client.get_table.call_count == 5
+        assert len(result) == 2
+        latest = result.set_index("calendardate").loc["2024-12-31"]
+        assert latest["pe"] == 35.0
+        assert latest["assets"] == 2
+        assert latest["ncfo"] == 5
+        assert latest["name"] == "Microsoft"
+        assert pd.isna(result.set_index("calendardate").loc["2023-12-31", "ncfo"])
+
+    @patch("nasdaq_data_link_mcp_os.resources.equities_360.snapshot.client")
+    def test_projection_skips_unneeded_tables(self, mock_client):
+        mock_client.get_table.side_effect = fake_get_table
+
+        result = get_company_snapshot(symbol="MSFT", columns=["pe", "marketcap"])
+
+        codes = {c.args[0] for c in mock_client.get_table.call_args_list}
+        assert codes == {"NDAQ/FS", "NDAQ/STAT"}
+        fs_params = next(
+            c.kwargs
+            for c in mock_client.get_table.call_args_list
+            if c.args[0] == "NDAQ/FS"
+        )
+        assert fs_params["qopts.columns"] == "symbol,calendardate,dimension,pe"
+        assert list(result.columns) == [
+            "symbol",
+            "calendardate",
+            "dimension",
+            "pe",
+            "marketcap",
+        ]
+
+    @patch("nasdaq_data_link_mcp_os.resources.equities_360.snapshot.client")
+    def test_key_only_projection(self, mock_client):
+        mock_client.get_table.side_effect = fake_get_table
+
+        result = get_company_snapshot(symbol="MSFT", columns=["symbol"])
+
+        mock_client.get_table.assert_called_once_with(
+            "NDAQ/FS",
+            symbol="MSFT",
+            **{"qopts.columns": "symbol,calendardate,dimension"},
+        )
+        assert list(result.columns) == ["symbol", "calendardate", "dimension"]
+        assert len(result) == 2
+
+    @patch("nasdaq_data_link_mcp_os.resources.equities_360.snapshot.client")
+    def test_failed_tables_are_reported(self, mock_client):
+        def flaky(code, **params):
+            if code == "NDAQ/RD":
+                raise RuntimeError("forbidden")
+            return TABLES[code]
+
+        mock_client.get_table.side_effect = flaky
+
+        result = get_company_snapshot(symbol="MSFT")
+
+        assert result.attrs["failed_tables"] == ["NDAQ/RD"]
+        assert "name" not in result.columns
+
+    def test_validation(self):
+        assert "Error" in get_company_snapshot()
+        assert "Unknown snapshot columns: nope" in get_company_snapshot(
+            symbol="MSFT", columns=["nope"]
+        )
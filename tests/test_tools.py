@@ -6,12 +6,17 @@ import os
 import sys
 from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 
 # Add the parent directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from nasdaq_data_link_mcp_os.resources.common.countries import get_country_code
+from nasdaq_data_link_mcp_os.resources.equities_360.balance_sheet import (
+    get_balance_sheet,
+    get_balance_sheet_batch,
+)
 from nasdaq_data_link_mcp_os.resources.equities_360.company_statistics import (
     get_company_stats,
 )
@@ -23,9 +28,7 @@ from nasdaq_data_link_mcp_os.resources.world_data_bank.indicators import (
 class TestEquitiesTools:
     """Test tools from Equities 360 module"""
 
-    @patch(
-        "nasdaq_data_link_mcp_os.resources.equities_360.company_statistics.nasdaqdatalink"
-    )
+    @patch("nasdaq_data_link_mcp_os.resources.equities_360.company_statistics.client")
     def test_get_company_stats_with_symbol(self, mock_nasdaqdatalink):
         """Test get_company_stats tool with a valid symbol"""
         # Mock successful API response
@@ -49,6 +52,42 @@ class TestEquitiesTools:
         result = get_company_stats()  # No parameters should return error message
         assert "Error" in str(result)
 
+    @patch("nasdaq_data_link_mcp_os.resources.equities_360.batch.client")
+    def test_get_balance_sheet_batch_merges_symbols_and_figis(self, mock_client):
+        """Test batch balance sheet fetch over symbols and FIGIs"""
+        rows = pd.DataFrame({"symbol": ["MSFT"], "assets": [1]})
+        mock_client.get_table_batch.return_value = rows
+
+        result = get_balance_sheet_batch(
+            symbols=["MSFT"], figis=["BBG000BPH459"], dimension="MRY"
+        )
+
+        assert mock_client.get_table_batch.call_count == 2
+        mock_client.get_table_batch.assert_any_call(
+            "NDAQ/BS", "symbol", ["MSFT"], dimension="MRY"
+        )
+        assert len(result) == 1
+        assert "Error" in get_balance_sheet_batch()
+
+    @patch("nasdaq_data_link_mcp_os.resources.equities_360.balance_sheet.client")
+    def test_get_balance_sheet_columns_projection(self, mock_client):
+        """Test columns are sent as qopts.columns after validation"""
+        mock_client.get_table.return_value = pd.DataFrame({"assets": [1]})
+
+        get_balance_sheet(symbol="MSFT", columns=["symbol", "assets"])
+
+        mock_client.get_table.assert_called_once_with(
+            "NDAQ/BS", symbol="MSFT", **{"qopts.columns": "symbol,assets"}
+        )
+
+    @patch("nasdaq_data_link_mcp_os.resources.equities_360.balance_sheet.client")
+    def test_get_balance_sheet_unknown_column(self, mock_client):
+        """Test unknown columns are rejected before any request"""
+        result = get_balance_sheet(symbol="MSFT", columns=["assets", "bogus"])
+
+        assert "Unknown columns for NDAQ/BS: bogus" in result
+        mock_client.get_table.assert_not_called()
+
 
 class TestWorldBankTools:
     """Test tools from World Bank module"""